@@ -1,11 +1,20 @@
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from playwright.sync_api import Page, expect
 import os
 
 User = get_user_model()
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Cached stats are keyed by user id, which the test database reuses."""
+    cache.clear()
+    yield
+    cache.clear()
+
+
 @pytest.fixture
 def user(db):
     return User.objects.create_user(username="testuser", password="testpass123")
@@ -1,3 +1,98 @@
 from django.contrib import admin
 
-# Register your models here.
+from birdie_buddy.round_entry.models import (
+    Hole,
+    Round,
+    RoundSummary,
+    ScorecardParseCacheEntry,
+    ScorecardParseJob,
+    Shot,
+)
+from birdie_buddy.round_entry.services.scorecard_parse_cache import (
+    ScorecardParseCache,
+)
+from birdie_buddy.round_entry.services.shot_bucket_aggregate_service import (
+    ShotBucketAggregateService,
+)
+from birdie_buddy.round_entry.services.stats_cache import StatsCache
+
+
+class InvalidateStatsAdmin(admin.ModelAdmin):
+    """
+    Admin edits change a player's data, so refresh the summaries of the
+    rounds touched, rebuild their bucket aggregates and drop their cached
+    stats.
+    """
+
+    # Lookup from the model to its round's id
+    round_field = "round_id"
+
+    def _round_ids(self, queryset) -> set[int]:
+        return set(queryset.values_list(self.round_field, flat=True))
+
+    def _data_changed(self, user_ids: set[int], round_ids: set[int]):
+        # Rounds that were deleted are simply not found
+        for round in Round.objects.filter(pk__in=round_ids):
+            RoundSummary.objects.refresh(round)
+        for user_id in user_ids:
+            ShotBucketAggregateService.rebuild_for_user(user_id)
+            StatsCache.invalidate_on_commit(user_id)
+
+    def save_model(self, request, obj, form, change):
+        rows = self.model.objects.filter(pk=obj.pk)
+        # Before saving, so a hole or shot moved off a round refreshes it too
+        round_ids = self._round_ids(rows) if change else set()
+        super().save_model(request, obj, form, change)
+        self._data_changed({obj.user_id}, round_ids | self._round_ids(rows))
+
+    def delete_model(self, request, obj):
+        round_ids = self._round_ids(self.model.objects.filter(pk=obj.pk))
+        super().delete_model(request, obj)
+        self._data_changed({obj.user_id}, round_ids)
+
+    def delete_queryset(self, request, queryset):
+        user_ids = set(queryset.values_list("user_id", flat=True))
+        round_ids = self._round_ids(queryset)
+        super().delete_queryset(request, queryset)
+        self._data_changed(user_ids, round_ids)
+
+
+@admin.register(Round)
+class RoundAdmin(InvalidateStatsAdmin):
+    round_field = "id"
+    list_display = ["id", "user", "course_name", "holes_played", "created_at"]
+
+
+@admin.register(Hole)
+class HoleAdmin(InvalidateStatsAdmin):
+    list_display = ["id", "user", "round", "number", "par", "score"]
+
+
+@admin.register(Shot)
+class ShotAdmin(InvalidateStatsAdmin):
+    round_field = "hole__round_id"
+    list_display = ["id", "user", "hole", "number", "lie", "start_distance"]
+
+
+@admin.register(ScorecardParseJob)
+class ScorecardParseJobAdmin(admin.ModelAdmin):
+    list_display = ["id", "scorecard_upload", "status", "attempts", "created_at"]
+    list_filter = ["status"]
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer("image")
+
+
+@admin.register(ScorecardParseCacheEntry)
+class ScorecardParseCacheEntryAdmin(admin.ModelAdmin):
+    list_display = ["id", "user", "image_hash", "hits", "created_at", "last_used_at"]
+    readonly_fields = ["image_hash", "perceptual_hash", "hits"]
+
+    def changelist_view(self, request, extra_context=None):
+        # Show the cache's hit rate in the page title
+        hit_rate = ScorecardParseCache.hit_rate()
+        extra_context = {
+            "title": f"Scorecard parse cache (hit rate {hit_rate:.0%})",
+            **(extra_context or {}),
+        }
+        return super().changelist_view(request, extra_context)
@@ -13,12 +13,21 @@ from birdie_buddy.round_entry.services.scorecard_parser_service import (
     ShotData,
 )
 from birdie_buddy.round_entry.models import Hole, Round
+from birdie_buddy.round_entry.services.scorecard_parse_job_service import (
+    ScorecardParseJobService,
+)
 
 User = get_user_model()
 
 os.environ["DJANGO_ALLOW_ASYNC_UNSAFE"] = "True"
 
 
+def run_parse_jobs(page: Page):
+    """Run the queued parse job in place of the worker and show the result."""
+    ScorecardParseJobService.run_pending()
+    page.reload()
+
+
 @pytest.fixture
 def scorecard_image_path():
     """Return the path to the test scorecard image."""
@@ -86,7 +95,7 @@ def mock_scorecard_parser():
 
     # Mock where the class is instantiated and used, not where it's defined
     with patch(
-        "birdie_buddy.round_entry.services.scorecard_parser_service.ScorecardParserService.parse_scorecard_image"
+        "birdie_buddy.round_entry.services.scorecard_parser_service.ScorecardParserService.parse_scorecard_bytes"
     ) as mock:
         mock.return_value = (mock_scorecard_data, mock_raw_json)
         yield mock
@@ -119,6 +128,7 @@ def test_scorecard_upload_page_loads(
     # Wait for the upload to process (the loading overlay should appear and disappear)
     # Or wait for navigation to the review page
     authenticated_page.wait_for_url("**/review", timeout=10000)
+    run_parse_jobs(authenticated_page)
 
     # Verify the mock was called (Claude API was NOT called)
     assert mock_scorecard_parser.called, (
@@ -149,6 +159,7 @@ def test_edit_hole_from_scorecard_review_redirects_back(
 
     authenticated_page.get_by_role("button", name="Upload").click()
     authenticated_page.wait_for_url("**/review", timeout=10000)
+    run_parse_jobs(authenticated_page)
 
     # Click edit button on first hole (find by href pattern)
     authenticated_page.locator('a[href*="holes/1/create"]').first.click()
@@ -199,6 +210,7 @@ def test_delete_hole_from_scorecard_review(
 
     authenticated_page.get_by_role("button", name="Upload").click()
     authenticated_page.wait_for_url("**/review", timeout=10000)
+    run_parse_jobs(authenticated_page)
 
     # Verify 2 holes exist initially
     content_before = authenticated_page.content()
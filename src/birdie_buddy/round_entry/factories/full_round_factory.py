@@ -1,5 +1,6 @@
 from birdie_buddy.round_entry.factories.hole_factory import HoleFactory
 from birdie_buddy.round_entry.factories.round_factory import RoundFactory
+from birdie_buddy.round_entry.models import RoundSummary
 
 
 def full_round_factory(n_holes=18, **kwargs):
@@ -8,5 +9,7 @@ def full_round_factory(n_holes=18, **kwargs):
         HoleFactory.create_with_shots(number=n + 1, round=round, user=round.user)
         for n in range(n_holes)
     ]
+    # Stored as the app stores it whenever holes change
+    RoundSummary.objects.refresh(round)
 
     return round
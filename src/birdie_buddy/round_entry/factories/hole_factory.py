@@ -2,6 +2,9 @@ import factory
 from birdie_buddy.round_entry.factories.round_factory import RoundFactory
 from birdie_buddy.round_entry.factories.shot_factory import ShotFactory
 from birdie_buddy.round_entry.models import Hole
+from birdie_buddy.round_entry.services.shot_bucket_aggregate_service import (
+    ShotBucketAggregateService,
+)
 from birdie_buddy.users.factories import UserFactory
 import random
 
@@ -100,13 +103,17 @@ class HoleFactory(factory.django.DjangoModelFactory):
 
         for i, shot in enumerate(obj.shot_set.all()):
             shot.number = i + 1
+            next_shot = shot.get_next_shot()
             try:
-                next_shot = shot.get_next_shot()
                 shot.calculate_strokes_gained(next_shot)
             except KeyError:
                 shot.strokes_gained = 0
+            shot.leave_feet = next_shot.feet if next_shot else 0
+            shot.is_holed = next_shot is None
             shot.save()
 
+        ShotBucketAggregateService.rebuild_for_user(obj.user_id)
+
 
 def create_par_3_par(hole):
     ShotFactory(hole=hole, user=hole.user, start_distance=170, lie="tee")
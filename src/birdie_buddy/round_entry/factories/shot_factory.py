@@ -1,6 +1,10 @@
 import factory
+from django.db.models import Max
 from django.utils import timezone
 from birdie_buddy.round_entry.models import Shot
+from birdie_buddy.round_entry.services.shot_bucket_aggregate_service import (
+    ShotBucketAggregateService,
+)
 from birdie_buddy.users.factories import UserFactory
 
 
@@ -32,3 +36,34 @@ class ShotFactory(factory.django.DjangoModelFactory):
         except KeyError:
             self.strokes_gained = 0
         self.save()
+
+    @factory.post_generation
+    def set_leave_feet(self, create, extracted, **kwargs):
+        """Mirror ShotService: this shot is holed until a later shot is added."""
+        if not create or self.leave_feet is not None:
+            return
+        previous = (
+            Shot.objects.filter(hole=self.hole, id__lt=self.id).order_by("-id").first()
+        )
+        if previous is not None:
+            Shot.objects.filter(pk=previous.pk).update(leave_feet=self.feet)
+        self.leave_feet = 0
+        Shot.objects.filter(pk=self.pk).update(leave_feet=0)
+
+    @factory.post_generation
+    def set_is_holed(self, create, extracted, **kwargs):
+        """Mirror ShotService: the highest numbered shot on the hole is holed."""
+        if not create:
+            return
+        shots = Shot.objects.filter(hole=self.hole)
+        last_number = shots.aggregate(Max("number"))["number__max"]
+        shots.exclude(number=last_number).update(is_holed=False)
+        shots.filter(number=last_number).update(is_holed=True)
+        self.is_holed = self.number == last_number
+
+    @factory.post_generation
+    def update_aggregates(self, create, extracted, **kwargs):
+        """Keep ShotBucketAggregate rows in step, as ShotService does."""
+        if not create:
+            return
+        ShotBucketAggregateService.rebuild_for_user(self.user_id)
@@ -4,7 +4,10 @@ from django import forms
 from django.core.exceptions import ValidationError
 
 from birdie_buddy.round_entry.models import Shot
-from birdie_buddy.round_entry.services.image_processing_service import ImageProcessingService
+from birdie_buddy.round_entry.services.image_processing_pool import (
+    ImageProcessingBusy,
+    ImageProcessingPool,
+)
 
 
 class ShotForm(forms.ModelForm):
@@ -56,8 +59,15 @@ class ScorecardUploadForm(forms.Form):
         if not uploaded_file:
             return uploaded_file
 
-        # Process the image (convert HEIC, resize, compress)
-        processed_file = ImageProcessingService.process_image(uploaded_file)
+        # Process the image (convert HEIC, resize, compress) in a worker
+        # process, so the request threads keep serving other pages
+        try:
+            processed_file = ImageProcessingPool.process_image(uploaded_file)
+        except ImageProcessingBusy:
+            raise ValidationError(
+                "We're processing a lot of scorecards right now. Please try again "
+                "in a minute."
+            )
 
         if processed_file is None:
             raise ValidationError(
@@ -66,3 +76,70 @@ class ScorecardUploadForm(forms.Form):
             )
 
         return processed_file
+
+
+class MultipleFileInput(forms.ClearableFileInput):
+    allow_multiple_selected = True
+
+
+class MultipleFileField(forms.FileField):
+    """A FileField accepting several files; cleans to a list."""
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("widget", MultipleFileInput())
+        super().__init__(*args, **kwargs)
+
+    def clean(self, data, initial=None):
+        single_file_clean = super().clean
+        if isinstance(data, (list, tuple)):
+            return [single_file_clean(d, initial) for d in data]
+        return [single_file_clean(data, initial)]
+
+
+class ScorecardBatchUploadForm(forms.Form):
+    """Several scorecard images at once, e.g. the rounds from a golf trip."""
+
+    MAX_IMAGES = 30
+
+    course_name = forms.CharField(
+        required=False,
+        help_text="Used for every round; leave blank to name each after its photo",
+    )
+    scorecard_images = MultipleFileField()
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fields["course_name"].widget.attrs.update(
+            {
+                "class": "block w-full rounded-md border-0 py-1.5 text-gray-900 shadow-sm ring-1 ring-inset ring-gray-300 placeholder:text-gray-400 focus:ring-2 focus:ring-inset focus:ring-indigo-600 sm:text-sm sm:leading-6"
+            }
+        )
+        self.fields["scorecard_images"].widget.attrs.update(
+            {"accept": "image/jpeg,image/jpg,image/png,image/gif,image/heic,image/heif"}
+        )
+
+    def clean_scorecard_images(self):
+        """
+        Process every image across the image workers. Returns (original
+        filename, processed image or None) pairs; unreadable images are kept
+        so the batch can report them.
+        """
+        uploaded_files = self.cleaned_data.get("scorecard_images") or []
+
+        if len(uploaded_files) > self.MAX_IMAGES:
+            raise ValidationError(
+                f"Upload at most {self.MAX_IMAGES} scorecards at a time."
+            )
+
+        try:
+            processed_files = ImageProcessingPool.process_images(uploaded_files)
+        except ImageProcessingBusy:
+            raise ValidationError(
+                "We're processing a lot of scorecards right now. Please try again "
+                "in a minute."
+            )
+
+        return [
+            (uploaded_file.name, processed_file)
+            for uploaded_file, processed_file in zip(uploaded_files, processed_files)
+        ]
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from birdie_buddy.round_entry.models import Round, RoundSummary
+
+
+class Command(BaseCommand):
+    help = (
+        "Store round summaries, and stats for complete rounds, missing from "
+        "rounds that predate them. Run once after migrating."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=200,
+            help="Rounds loaded per batch",
+        )
+
+    def handle(self, *args, **options):
+        rounds = Round.objects.filter(
+            Q(summary__isnull=True)
+            | Q(summary__complete=True, summary__stats__isnull=True)
+        ).order_by("id")
+
+        count = 0
+        for round in rounds.iterator(chunk_size=options["chunk_size"]):
+            RoundSummary.objects.refresh(round)
+            count += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Backfilled {count} round summaries"))
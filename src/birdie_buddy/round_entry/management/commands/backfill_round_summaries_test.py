@@ -0,0 +1,39 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from birdie_buddy.round_entry.factories import HoleFactory, RoundFactory
+from birdie_buddy.round_entry.models import RoundSummary
+from birdie_buddy.users.factories import UserFactory
+
+
+@pytest.mark.django_db
+class TestBackfillRoundSummaries:
+    def test_backfills_missing_summaries_and_stats(self):
+        user = UserFactory()
+        without_summary = RoundFactory(user=user, holes_played=1)
+        HoleFactory.par_4_par(round=without_summary, user=user, number=1)
+        without_stats = RoundFactory(user=user, holes_played=1)
+        HoleFactory.par_3_par(round=without_stats, user=user, number=1)
+        RoundSummary.objects.refresh(without_stats)
+        RoundSummary.objects.filter(round=without_summary).delete()
+        RoundSummary.objects.filter(round=without_stats).update(stats=None)
+        out = StringIO()
+
+        call_command("backfill_round_summaries", stdout=out)
+
+        assert RoundSummary.objects.get(round=without_summary).score == 4
+        assert RoundSummary.objects.get(round=without_stats).stats is not None
+        assert "Backfilled 2 round summaries" in out.getvalue()
+
+    def test_leaves_up_to_date_summaries_alone(self):
+        user = UserFactory()
+        round = RoundFactory(user=user, holes_played=1)
+        HoleFactory.par_4_par(round=round, user=user, number=1)
+        RoundSummary.objects.refresh(round)
+        out = StringIO()
+
+        call_command("backfill_round_summaries", stdout=out)
+
+        assert "Backfilled 0 round summaries" in out.getvalue()
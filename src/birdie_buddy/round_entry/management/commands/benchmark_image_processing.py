@@ -0,0 +1,119 @@
+import resource
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import django
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.base import BaseCommand, CommandError
+
+from birdie_buddy.round_entry.services.image_processing_service import (
+    ImageProcessingService,
+)
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".heic", ".heif"}
+DEFAULT_CORPUS = Path(__file__).resolve().parents[2] / "e2e" / "images"
+
+
+def _init_worker():
+    # Needed when the pool spawns rather than forks its workers
+    django.setup()
+
+
+def _benchmark(path: str, repeat: int) -> dict:
+    """Process one image `repeat` times; runs in a fresh process per image."""
+    content = Path(path).read_bytes()
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    seconds, output_size = [], None
+    for _ in range(repeat):
+        uploaded_file = SimpleUploadedFile(Path(path).name, content)
+        start = time.perf_counter()
+        processed = ImageProcessingService.process_image(uploaded_file)
+        seconds.append(time.perf_counter() - start)
+        output_size = processed.size if processed else None
+
+    # ru_maxrss is the process high-water mark, in KB on Linux
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {
+        "path": path,
+        "input_size": len(content),
+        "best_seconds": min(seconds),
+        "peak_rss_mb": (rss_after - rss_before) / 1024,
+        "output_size": output_size,
+    }
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark ImageProcessingService over sample scorecard photos: time, "
+        "peak RSS growth and output size per image"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="*",
+            type=Path,
+            help="Images or directories of images (default: the e2e sample images)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Runs per image; the fastest is reported",
+        )
+
+    def handle(self, *args, **options):
+        images = self._collect(options["paths"] or [DEFAULT_CORPUS])
+        if not images:
+            raise CommandError("No images found")
+
+        self.stdout.write(
+            f"{'image':<40} {'input KB':>9} {'ms':>8} {'peak MB':>8} {'output KB':>10}"
+        )
+
+        # A fresh process per image so each peak RSS is the image's own
+        results = []
+        with ProcessPoolExecutor(
+            max_workers=1, max_tasks_per_child=1, initializer=_init_worker
+        ) as pool:
+            for path in images:
+                result = pool.submit(_benchmark, str(path), options["repeat"]).result()
+                results.append(result)
+                output = (
+                    f"{result['output_size'] / 1024:>10.0f}"
+                    if result["output_size"] is not None
+                    else f"{'failed':>10}"
+                )
+                self.stdout.write(
+                    f"{path.name[:40]:<40} {result['input_size'] / 1024:>9.0f} "
+                    f"{result['best_seconds'] * 1000:>8.1f} "
+                    f"{result['peak_rss_mb']:>8.1f} {output}"
+                )
+
+        total_ms = sum(result["best_seconds"] for result in results) * 1000
+        max_rss = max(result["peak_rss_mb"] for result in results)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{len(results)} images: {total_ms:.1f} ms total, "
+                f"{total_ms / len(results):.1f} ms mean, {max_rss:.1f} MB max peak"
+            )
+        )
+
+    def _collect(self, paths: list[Path]) -> list[Path]:
+        images = []
+        for path in paths:
+            if path.is_dir():
+                images.extend(
+                    sorted(
+                        child
+                        for child in path.iterdir()
+                        if child.suffix.lower() in IMAGE_SUFFIXES
+                    )
+                )
+            elif path.exists():
+                images.append(path)
+            else:
+                raise CommandError(f"No such file: {path}")
+        return images
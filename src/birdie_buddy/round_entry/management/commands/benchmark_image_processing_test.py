@@ -0,0 +1,27 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from PIL import Image
+
+
+class TestBenchmarkImageProcessing:
+    def test_reports_each_image(self, tmp_path):
+        Image.new("RGB", (2000, 1500), "white").save(tmp_path / "card.jpg")
+        Image.new("RGB", (600, 400), "white").save(tmp_path / "small.png")
+        (tmp_path / "notes.txt").write_text("not an image")
+        out = StringIO()
+
+        call_command("benchmark_image_processing", str(tmp_path), repeat=1, stdout=out)
+
+        output = out.getvalue()
+        assert "card.jpg" in output
+        assert "small.png" in output
+        assert "notes.txt" not in output
+        assert "failed" not in output
+        assert "2 images:" in output
+
+    def test_missing_path(self, tmp_path):
+        with pytest.raises(CommandError):
+            call_command("benchmark_image_processing", str(tmp_path / "missing.jpg"))
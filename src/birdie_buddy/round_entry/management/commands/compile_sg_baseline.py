@@ -0,0 +1,47 @@
+from importlib import import_module
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from birdie_buddy.round_entry.services.avg_strokes_to_holeout import (
+    BASELINES,
+    BASELINES_DIR,
+    BaselineTable,
+)
+
+
+class Command(BaseCommand):
+    help = "Compile SG_DATA baselines into memory-mapped binary tables"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "names",
+            nargs="*",
+            help="Baselines to compile (defaults to every registered baseline)",
+        )
+        parser.add_argument(
+            "--output-dir",
+            type=Path,
+            default=BASELINES_DIR,
+            help="Directory to write the compiled baselines to",
+        )
+
+    def handle(self, *args, **options):
+        names = options["names"] or list(BASELINES)
+        output_dir: Path = options["output_dir"]
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        for name in names:
+            if name not in BASELINES:
+                raise CommandError(f"Unknown strokes gained baseline: {name}")
+
+            # Only the build step pays for parsing the dict literal
+            _, source = BASELINES[name]
+            data = BaselineTable.from_dict(import_module(source).SG_DATA).to_bytes()
+
+            output = output_dir / f"{name}.bin"
+            output.write_bytes(data)
+
+            self.stdout.write(
+                self.style.SUCCESS(f"Wrote {len(data)} bytes to {output}")
+            )
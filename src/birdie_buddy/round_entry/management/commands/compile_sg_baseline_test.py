@@ -0,0 +1,18 @@
+import pytest
+from django.core.management import CommandError, call_command
+
+from birdie_buddy.round_entry.services.avg_strokes_to_holeout import BaselineTable
+from birdie_buddy.round_entry.services.strokes_gained_data import SG_DATA
+
+
+class TestCompileSgBaseline:
+    def test_writes_loadable_baseline(self, tmp_path):
+        call_command("compile_sg_baseline", "tour", output_dir=tmp_path)
+
+        table = BaselineTable.load(tmp_path / "tour.bin")
+        assert table.lookup(400, "tee") == SG_DATA["tee"][400]
+        assert table.lookup(15, "green") == SG_DATA["green"][15]
+
+    def test_unknown_baseline_is_an_error(self, tmp_path):
+        with pytest.raises(CommandError):
+            call_command("compile_sg_baseline", "beginner", output_dir=tmp_path)
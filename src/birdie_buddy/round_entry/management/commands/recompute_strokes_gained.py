@@ -0,0 +1,125 @@
+import json
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import django
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from birdie_buddy.round_entry.models import Hole
+from birdie_buddy.round_entry.services.strokes_gained_recompute_service import (
+    StrokesGainedRecomputeService,
+)
+
+
+def _init_worker():
+    # Needed when the pool spawns rather than forks its workers
+    django.setup()
+
+
+def _recompute_user(user_id: int, chunk_size: int):
+    try:
+        return user_id, StrokesGainedRecomputeService.recompute_for_user(
+            user_id, chunk_size
+        )
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = "Recompute stored strokes gained for every shot, partitioned by user"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of worker processes (1 runs in this process)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=StrokesGainedRecomputeService.CHUNK_SIZE,
+            help="Holes loaded and written per batch",
+        )
+        parser.add_argument(
+            "--user",
+            type=int,
+            action="append",
+            dest="user_ids",
+            help="Only recompute these user ids (repeatable)",
+        )
+        parser.add_argument(
+            "--checkpoint",
+            type=Path,
+            help="JSON file recording finished users, so an interrupted run can resume",
+        )
+
+    def handle(self, *args, **options):
+        checkpoint: Path | None = options["checkpoint"]
+        completed = self._read_checkpoint(checkpoint)
+
+        user_ids = Hole.objects.order_by("user_id").values_list("user_id", flat=True)
+        if options["user_ids"]:
+            user_ids = user_ids.filter(user_id__in=options["user_ids"])
+        pending = [
+            user_id for user_id in user_ids.distinct() if user_id not in completed
+        ]
+
+        if completed:
+            self.stdout.write(f"Resuming: {len(completed)} users already done")
+
+        total = len(pending)
+        totals = {"holes": 0, "shots_updated": 0, "shots_skipped": 0}
+
+        for done, (user_id, result) in enumerate(
+            self._run(pending, options["workers"], options["chunk_size"]), start=1
+        ):
+            for key in totals:
+                totals[key] += getattr(result, key)
+
+            completed.add(user_id)
+            self._write_checkpoint(checkpoint, completed)
+
+            self.stdout.write(
+                f"[{done}/{total}] user {user_id}: {result.holes} holes, "
+                f"{result.shots_updated} shots updated, {result.shots_skipped} skipped"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Recomputed {totals['holes']} holes: {totals['shots_updated']} shots "
+                f"updated, {totals['shots_skipped']} skipped"
+            )
+        )
+
+    def _run(self, user_ids, workers, chunk_size):
+        if workers <= 1:
+            for user_id in user_ids:
+                yield user_id, StrokesGainedRecomputeService.recompute_for_user(
+                    user_id, chunk_size
+                )
+            return
+
+        # Workers must open their own connections rather than share ours
+        connections.close_all()
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            futures = [
+                pool.submit(_recompute_user, user_id, chunk_size) for user_id in user_ids
+            ]
+            for future in as_completed(futures):
+                yield future.result()
+
+    def _read_checkpoint(self, checkpoint: Path | None) -> set[int]:
+        if checkpoint is None or not checkpoint.exists():
+            return set()
+        return set(json.loads(checkpoint.read_text())["completed_users"])
+
+    def _write_checkpoint(self, checkpoint: Path | None, completed: set[int]):
+        if checkpoint is None:
+            return
+        # Write then rename so an interrupted run never leaves a torn file
+        tmp = checkpoint.with_suffix(".tmp")
+        tmp.write_text(json.dumps({"completed_users": sorted(completed)}))
+        tmp.replace(checkpoint)
@@ -0,0 +1,56 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+
+from birdie_buddy.round_entry.factories import HoleFactory, RoundFactory, ShotFactory
+from birdie_buddy.round_entry.models import Shot
+from birdie_buddy.users.factories import UserFactory
+
+
+def create_hole(user):
+    hole = HoleFactory(user=user, round=RoundFactory(user=user), par=3, number=1)
+    ShotFactory(user=user, hole=hole, number=1, lie="tee", start_distance=170, strokes_gained=0.0)
+    ShotFactory(user=user, hole=hole, number=2, lie="green", start_distance=1, strokes_gained=0.0)
+    return hole
+
+
+@pytest.mark.django_db
+class TestRecomputeStrokesGained:
+    def test_recomputes_every_user(self):
+        users = [UserFactory(), UserFactory()]
+        for user in users:
+            create_hole(user)
+        out = StringIO()
+
+        call_command("recompute_strokes_gained", stdout=out)
+
+        assert not Shot.objects.filter(strokes_gained=0.0).exists()
+        assert "[2/2]" in out.getvalue()
+
+    def test_limits_to_given_users(self):
+        user, other_user = UserFactory(), UserFactory()
+        create_hole(user)
+        create_hole(other_user)
+
+        call_command("recompute_strokes_gained", user_ids=[user.id], stdout=StringIO())
+
+        assert not Shot.objects.filter(user=user, strokes_gained=0.0).exists()
+        assert Shot.objects.filter(user=other_user, strokes_gained=0.0).count() == 2
+
+    def test_resumes_from_checkpoint(self, tmp_path):
+        done_user, pending_user = UserFactory(), UserFactory()
+        create_hole(done_user)
+        create_hole(pending_user)
+        checkpoint = tmp_path / "checkpoint.json"
+        checkpoint.write_text(json.dumps({"completed_users": [done_user.id]}))
+
+        call_command("recompute_strokes_gained", checkpoint=checkpoint, stdout=StringIO())
+
+        assert Shot.objects.filter(user=done_user, strokes_gained=0.0).count() == 2
+        assert not Shot.objects.filter(user=pending_user, strokes_gained=0.0).exists()
+        assert set(json.loads(checkpoint.read_text())["completed_users"]) == {
+            done_user.id,
+            pending_user.id,
+        }
@@ -0,0 +1,57 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from birdie_buddy.round_entry.services.scorecard_parse_job_service import (
+    ScorecardParseJobService,
+)
+from birdie_buddy.round_entry.services.scorecard_parser_service import (
+    ScorecardParserService,
+)
+
+
+class Command(BaseCommand):
+    help = "Run queued scorecard parse jobs, polling for new ones"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Run the jobs queued now and exit instead of polling",
+        )
+        parser.add_argument(
+            "--poll-interval",
+            type=float,
+            default=2.0,
+            help="Seconds to wait between polls when the queue is empty",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=settings.SCORECARD_PARSE_CONCURRENCY,
+            help="Jobs to run at once, i.e. the most LLM requests in flight",
+        )
+
+    def handle(self, *args, **options):
+        parser = ScorecardParserService()
+        self.stdout.write("Scorecard worker started")
+
+        try:
+            while True:
+                # Long-running: drop connections the database has closed
+                close_old_connections()
+                ran = ScorecardParseJobService.run_pending(
+                    parser, concurrency=options["concurrency"]
+                )
+                if ran:
+                    self.stdout.write(f"Ran {ran} scorecard parse jobs")
+                if options["once"]:
+                    break
+                if not ran:
+                    time.sleep(options["poll_interval"])
+        except KeyboardInterrupt:
+            pass
+
+        self.stdout.write(self.style.SUCCESS("Scorecard worker stopped"))
@@ -0,0 +1,42 @@
+from io import StringIO
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+
+from birdie_buddy.round_entry.models import ScorecardParseJob
+from birdie_buddy.round_entry.services.scorecard_parse_job_service import (
+    ScorecardParseJobService,
+)
+from birdie_buddy.round_entry.services.scorecard_parse_job_service_test import (
+    queued_upload,
+)
+
+
+@pytest.mark.django_db
+class TestRunScorecardWorker:
+    def test_once_runs_queued_jobs(self, user, settings):
+        settings.SCORECARD_PARSER_CLIENT = (
+            "birdie_buddy.round_entry.services.fake_scorecard_client.FakeScorecardClient"
+        )
+        scorecard_upload = queued_upload(user)
+        out = StringIO()
+
+        # Worker threads have their own connections, outside the test's
+        # transaction, so run jobs in this thread
+        call_command("run_scorecard_worker", once=True, concurrency=1, stdout=out)
+
+        scorecard_upload.refresh_from_db()
+        assert scorecard_upload.parse_job.status == ScorecardParseJob.SUCCEEDED
+        assert scorecard_upload.round is not None
+        assert "Ran 1 scorecard parse jobs" in out.getvalue()
+
+    def test_concurrency_option(self):
+        with patch.object(
+            ScorecardParseJobService, "run_pending", return_value=1
+        ) as run_pending:
+            call_command(
+                "run_scorecard_worker", once=True, concurrency=3, stdout=StringIO()
+            )
+
+        assert run_pending.call_args.kwargs["concurrency"] == 3
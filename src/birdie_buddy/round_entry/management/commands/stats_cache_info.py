@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from birdie_buddy.round_entry.services.stats_cache import StatsCache
+
+
+class Command(BaseCommand):
+    help = "Show the stats cache hit and miss counters"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Reset the counters after printing them",
+        )
+
+    def handle(self, *args, **options):
+        counters = StatsCache.counters()
+        lookups = counters["hits"] + counters["misses"]
+        hit_rate = counters["hits"] / lookups * 100 if lookups else 0.0
+
+        self.stdout.write(
+            f"hits: {counters['hits']}  misses: {counters['misses']}  "
+            f"hit rate: {hit_rate:.1f}%"
+        )
+
+        if options["reset"]:
+            StatsCache.reset_counters()
+            self.stdout.write(self.style.SUCCESS("Counters reset"))
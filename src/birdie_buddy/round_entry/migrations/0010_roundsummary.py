@@ -0,0 +1,31 @@
+# Generated by Django 5.1.4 on 2026-10-17 23:27
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('round_entry', '0009_scorecardupload_parsed_data'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RoundSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('strokes_gained_driving', models.FloatField(default=0)),
+                ('strokes_gained_approach', models.FloatField(default=0)),
+                ('strokes_gained_putting', models.FloatField(default=0)),
+                ('strokes_gained_around_the_green', models.FloatField(default=0)),
+                ('score', models.IntegerField(default=0)),
+                ('par', models.IntegerField(default=0)),
+                ('holes_with_shots', models.IntegerField(default=0)),
+                ('shot_count', models.IntegerField(default=0)),
+                ('complete', models.BooleanField(default=False)),
+                ('round', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='summary', to='round_entry.round')),
+            ],
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.1.4 on 2026-10-17 23:31
+
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def backfill_leave_feet(apps, schema_editor):
+    """Store each shot's next-shot feet (0 for the last shot of a hole)."""
+    Shot = apps.get_model("round_entry", "Shot")
+    shots = Shot.objects.order_by("hole_id", "number", "id").only("id", "hole_id", "feet")
+
+    pending = []
+    previous = None
+    for shot in shots.iterator(chunk_size=BATCH_SIZE):
+        if previous is not None:
+            previous.leave_feet = shot.feet if shot.hole_id == previous.hole_id else 0
+            pending.append(previous)
+        previous = shot
+
+        if len(pending) >= BATCH_SIZE:
+            Shot.objects.bulk_update(pending, ["leave_feet"])
+            pending = []
+
+    if previous is not None:
+        previous.leave_feet = 0
+        pending.append(previous)
+    Shot.objects.bulk_update(pending, ["leave_feet"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('round_entry', '0010_roundsummary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='shot',
+            name='leave_feet',
+            field=models.IntegerField(help_text='Feet to the hole after this shot, 0 when holed', null=True),
+        ),
+        migrations.RunPython(backfill_leave_feet, migrations.RunPython.noop),
+    ]
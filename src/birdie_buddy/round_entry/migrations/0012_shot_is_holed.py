@@ -0,0 +1,29 @@
+# Generated by Django 5.1.4 on 2026-10-17 23:37
+
+from django.db import migrations, models
+from django.db.models import Exists, OuterRef
+
+
+def backfill_is_holed(apps, schema_editor):
+    """Flag the highest numbered shot on each hole, in one UPDATE."""
+    Shot = apps.get_model("round_entry", "Shot")
+    later_shots = Shot.objects.filter(
+        hole_id=OuterRef("hole_id"), number__gt=OuterRef("number")
+    )
+    Shot.objects.update(is_holed=~Exists(later_shots))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('round_entry', '0011_shot_leave_feet'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='shot',
+            name='is_holed',
+            field=models.BooleanField(default=False, help_text='True for the last shot played on the hole'),
+        ),
+        migrations.RunPython(backfill_is_holed, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,151 @@
+# Generated by Django 5.1.4 on 2026-10-17 23:48
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from itertools import groupby
+from operator import attrgetter
+
+BATCH_SIZE = 1000
+
+# The bucket rules as of this migration, frozen here so later changes to the
+# stats services can't change what it does: (shot_type, bucket, distance
+# field, min distance, max distance, lie)
+BUCKETS = [
+    ("approach", "30_100", "start_distance", 30, 100, None),
+    ("approach", "100_150", "start_distance", 100, 150, None),
+    ("approach", "150_200", "start_distance", 150, 200, None),
+    ("approach", "over_200", "start_distance", 200, None, None),
+    ("approach", "30_100_rough", "start_distance", 30, 100, "rough"),
+    ("approach", "100_150_rough", "start_distance", 100, 150, "rough"),
+    ("approach", "150_200_rough", "start_distance", 150, 200, "rough"),
+    ("approach", "over_200_rough", "start_distance", 200, None, "rough"),
+    ("around_green", "0_10_fairway", "start_distance", 0, 10, "fairway"),
+    ("around_green", "0_10_rough", "start_distance", 0, 10, "rough"),
+    ("around_green", "10_20_fairway", "start_distance", 10, 20, "fairway"),
+    ("around_green", "10_20_rough", "start_distance", 10, 20, "rough"),
+    ("around_green", "20_30_fairway", "start_distance", 20, 30, "fairway"),
+    ("around_green", "20_30_rough", "start_distance", 20, 30, "rough"),
+    ("around_green", "sand", "start_distance", 0, None, "sand"),
+    ("putt", "0_3", "feet", 0, 3, None),
+    ("putt", "3_6", "feet", 3, 6, None),
+    ("putt", "6_9", "feet", 6, 9, None),
+    ("putt", "9_12", "feet", 9, 12, None),
+    ("putt", "12_15", "feet", 12, 15, None),
+    ("putt", "15_20", "feet", 15, 20, None),
+    ("putt", "20_30", "feet", 20, 30, None),
+    ("putt", "30_40", "feet", 30, 40, None),
+    ("putt", "40_plus", "feet", 40, None, None),
+]
+DRIVING_PARS = (4, 5)
+DRIVE_ENDING_LIES = ("penalty", "rough", "fairway")
+
+
+def in_bucket(shot, shot_type, distance_field, min_distance, max_distance, lie):
+    distance = getattr(shot, distance_field)
+    return (
+        shot.shot_type == shot_type
+        and distance is not None
+        and distance >= min_distance
+        and (max_distance is None or distance < max_distance)
+        and (lie is None or shot.lie == lie)
+    )
+
+
+def hole_totals(par, shots, totals):
+    """
+    Add one hole's shot count, strokes gained sum, leave feet sum, leave
+    count, holed count, hole count and two-chip holes to each of its buckets.
+    """
+    for shot_type, bucket, *rule in BUCKETS:
+        matching = [shot for shot in shots if in_bucket(shot, shot_type, *rule)]
+        if not matching:
+            continue
+        leaves = [shot.leave_feet for shot in matching if shot.leave_feet is not None]
+        values = [
+            len(matching),
+            sum(s.strokes_gained for s in matching if s.strokes_gained is not None),
+            sum(leaves),
+            len(leaves),
+            sum(1 for shot in matching if shot.is_holed),
+            1,
+            1 if len(matching) >= 2 else 0,
+        ]
+        current = totals.setdefault((shot_type, bucket), [0] * len(values))
+        for i, value in enumerate(values):
+            current[i] += value
+
+    # Drives are counted per hole by where the second shot was played from
+    if par in DRIVING_PARS:
+        for lie in {shot.lie for shot in shots if shot.number == 2}:
+            if lie in DRIVE_ENDING_LIES:
+                current = totals.setdefault(("drive", lie), [0] * 7)
+                current[5] += 1
+
+
+def backfill_aggregates(apps, schema_editor):
+    """Build every user's totals with the historical models."""
+    Shot = apps.get_model("round_entry", "Shot")
+    ShotBucketAggregate = apps.get_model("round_entry", "ShotBucketAggregate")
+
+    shots = Shot.objects.order_by("user_id", "hole_id", "number", "id").annotate(
+        hole_par=models.F("hole__par")
+    )
+
+    for user_id, user_shots in groupby(
+        shots.iterator(chunk_size=BATCH_SIZE), key=attrgetter("user_id")
+    ):
+        totals = {}
+        for _, hole_shots in groupby(user_shots, key=attrgetter("hole_id")):
+            hole_shots = list(hole_shots)
+            hole_totals(hole_shots[0].hole_par, hole_shots, totals)
+
+        ShotBucketAggregate.objects.bulk_create(
+            [
+                ShotBucketAggregate(
+                    user_id=user_id,
+                    shot_type=shot_type,
+                    bucket=bucket,
+                    shot_count=values[0],
+                    strokes_gained_sum=values[1],
+                    leave_feet_sum=values[2],
+                    leave_count=values[3],
+                    holed_count=values[4],
+                    hole_count=values[5],
+                    two_chip_holes=values[6],
+                )
+                for (shot_type, bucket), values in totals.items()
+            ],
+            batch_size=BATCH_SIZE,
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('round_entry', '0012_shot_is_holed'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ShotBucketAggregate',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('shot_type', models.CharField(max_length=16)),
+                ('bucket', models.CharField(max_length=32)),
+                ('shot_count', models.IntegerField(default=0)),
+                ('strokes_gained_sum', models.FloatField(default=0)),
+                ('leave_feet_sum', models.BigIntegerField(default=0)),
+                ('leave_count', models.IntegerField(default=0)),
+                ('holed_count', models.IntegerField(default=0)),
+                ('hole_count', models.IntegerField(default=0, help_text='Holes with at least one shot in the bucket')),
+                ('two_chip_holes', models.IntegerField(default=0, help_text='Holes with two or more shots in the bucket')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user', 'shot_type', 'bucket'), name='unique_shot_bucket_aggregate')],
+            },
+        ),
+        migrations.RunPython(backfill_aggregates, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.1.4 on 2026-10-18 00:03
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('round_entry', '0013_shotbucketaggregate'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='round',
+            index=models.Index(fields=['user', '-created_at'], name='round_user_created_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.1.4 on 2026-10-18 00:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('round_entry', '0014_round_user_created_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='roundsummary',
+            name='stats',
+            field=models.JSONField(help_text='Round detail stats, stored while the round is complete', null=True),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.4 on 2026-10-18 00:22
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('round_entry', '0015_roundsummary_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScorecardParseJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('succeeded', 'Succeeded'), ('failed', 'Failed')], default='queued', max_length=16)),
+                ('attempts', models.IntegerField(default=0)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('error', models.TextField(blank=True)),
+                ('scorecard_upload', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='parse_job', to='round_entry.scorecardupload')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'created_at'], name='parse_job_status_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.1.4 on 2026-10-18 00:29
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('round_entry', '0016_scorecardparsejob'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScorecardParseCacheEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('image_hash', models.CharField(max_length=64)),
+                ('perceptual_hash', models.CharField(blank=True, max_length=64)),
+                ('parsed_data', models.JSONField()),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('last_used_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('hits', models.IntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name_plural': 'scorecard parse cache entries',
+                'indexes': [models.Index(fields=['last_used_at'], name='parse_cache_last_used_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'image_hash'), name='unique_parse_cache_image')],
+            },
+        ),
+    ]
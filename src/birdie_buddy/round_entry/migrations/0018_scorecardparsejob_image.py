@@ -0,0 +1,23 @@
+# Generated by Django 5.1.4 on 2026-10-18 00:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('round_entry', '0017_scorecardparsecacheentry'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scorecardparsejob',
+            name='image',
+            field=models.BinaryField(help_text='Processed image for the worker, cleared once it is in storage', null=True),
+        ),
+        migrations.AddField(
+            model_name='scorecardparsejob',
+            name='image_name',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+    ]
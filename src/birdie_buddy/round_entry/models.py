@@ -1,3 +1,4 @@
+from math import isnan
 from typing import Self
 from django.core.exceptions import ValidationError
 from django.core.validators import MaxValueValidator, MinValueValidator
@@ -5,7 +6,10 @@ from django.db import models
 from django.utils import timezone
 from django.contrib.auth import get_user_model
 
-from birdie_buddy.round_entry.services import avg_strokes_to_holeout
+from birdie_buddy.round_entry.services import (
+    avg_strokes_to_holeout,
+    strokes_gained_for_shots,
+)
 
 APPROACH_SHOT_START_DISTANCE = 30
 TEE_SHOT_START_DISTANCE = 250
@@ -21,30 +25,53 @@ class Round(models.Model):
         null=True, validators=[MinValueValidator(1), MaxValueValidator(18)]
     )
 
+    class Meta:
+        indexes = [
+            # Recent rounds first, for stats windows and the round list
+            models.Index(fields=["user", "-created_at"], name="round_user_created_idx")
+        ]
+
+    def get_summary(self) -> "RoundSummary":
+        """
+        Return the stored summary, or an unsaved empty one for a round
+        without it. Read-only: summaries are written where holes and shots
+        change, never while rendering a page.
+        """
+        try:
+            return self.summary
+        except RoundSummary.DoesNotExist:
+            return RoundSummary(round=self)
+
     @property
     def strokes_gained_driving(self):
-        return sum([hole.strokes_gained_driving for hole in self.hole_set.all()])
+        return self.get_summary().strokes_gained_driving
 
     @property
     def strokes_gained_approach(self):
-        return sum([hole.strokes_gained_approach for hole in self.hole_set.all()])
+        return self.get_summary().strokes_gained_approach
 
     @property
     def strokes_gained_putting(self):
-        return sum([hole.strokes_gained_putting for hole in self.hole_set.all()])
+        return self.get_summary().strokes_gained_putting
 
     @property
     def strokes_gained_around_the_green(self):
-        return sum(
-            [hole.strokes_gained_around_the_green for hole in self.hole_set.all()]
-        )
+        return self.get_summary().strokes_gained_around_the_green
 
     @property
     def complete(self):
-        holes = self.hole_set.annotate(num_shots=models.Count("shot")).filter(
-            num_shots__gte=1
+        return self.get_summary().complete
+
+
+class HoleQuerySet(models.QuerySet):
+    def with_shots(self) -> Self:
+        """
+        Prefetch each hole's shots in play order, so the Hole properties and
+        templates iterating shot_set.all read them without further queries.
+        """
+        return self.prefetch_related(
+            models.Prefetch("shot_set", queryset=Shot.objects.order_by("number", "id"))
         )
-        return holes.count() == self.holes_played
 
 
 class Hole(models.Model):
@@ -63,6 +90,8 @@ class Hole(models.Model):
 
     par = models.IntegerField(validators=[MinValueValidator(2), MaxValueValidator(6)])
 
+    objects = HoleQuerySet.as_manager()
+
     def clean(self):
         super().clean()
         if (
@@ -74,19 +103,29 @@ class Hole(models.Model):
                 {"mental_scorecard": "Mental scorecard cannot exceed actual score."}
             )
 
+    def ordered_shots(self) -> list["Shot"]:
+        """
+        The hole's shots in play order, read from the prefetched shot_set when
+        there is one (see HoleQuerySet.with_shots).
+        """
+        return sorted(self.shot_set.all(), key=lambda shot: (shot.number, shot.pk))
+
     @property
     def strokes_gained(self):
-        first_shot = self.shot_set.first()
-        return first_shot.avg_strokes_to_holeout - self.score
+        shots = self.ordered_shots()
+        if not shots:
+            return None
+        return shots[0].avg_strokes_to_holeout - self.score
 
     @property
     def strokes_gained_driving(self):
         if self.par < 4:
             return 0
-        shots = self.shot_set.all()
-        if shots.count() == 1:
-            return shots[0].calculate_strokes_gained(None)
-        return shots[0].calculate_strokes_gained(shots[1])
+        tee_shots = self.ordered_shots()[:2]
+        return strokes_gained_for_shots(
+            [shot.start_distance for shot in tee_shots],
+            [shot.lie for shot in tee_shots],
+        )[0]
 
     @property
     def strokes_gained_approach(self):
@@ -96,8 +135,9 @@ class Hole(models.Model):
     def strokes_gained_putting(self):
         result = 0
 
-        for putt in self.shot_set.filter(shot_type="putt"):
-            result = result + putt.strokes_gained
+        for shot in self.shot_set.all():
+            if shot.shot_type == "putt":
+                result = result + shot.strokes_gained
 
         return result
 
@@ -106,18 +146,17 @@ class Hole(models.Model):
         return self._calculate_strokes_gained(lambda s: s.is_short_game_shot)
 
     def _calculate_strokes_gained(self, conditional):
-        result = 0
-        shots = list(self.shot_set.all())
-
-        for i, shot in enumerate(shots):
-            if conditional(shot):
-                next_shot = shots[i + 1] if i + 1 < len(shots) else None
-                result = result + shot.calculate_strokes_gained(next_shot)
+        shots = self.ordered_shots()
+        strokes_gained = strokes_gained_for_shots(
+            [shot.start_distance for shot in shots], [shot.lie for shot in shots]
+        )
 
-        return result
+        return sum(
+            sg for shot, sg in zip(shots, strokes_gained) if conditional(shot)
+        )
 
     def __str__(self):
-        return str([shot.start_distance for shot in self.shot_set.all()])
+        return str([shot.start_distance for shot in self.ordered_shots()])
 
 
 class Shot(models.Model):
@@ -155,11 +194,20 @@ class Shot(models.Model):
     feet = models.IntegerField(
         null=True, validators=[MinValueValidator(1), MaxValueValidator(3000)]
     )
+    leave_feet = models.IntegerField(
+        null=True, help_text="Feet to the hole after this shot, 0 when holed"
+    )
+    is_holed = models.BooleanField(
+        default=False, help_text="True for the last shot played on the hole"
+    )
 
     def save(self, *args, **kwargs):
+        self.set_derived_fields()
+        super().save(*args, **kwargs)
+
+    def set_derived_fields(self):
         self._parse_start_distance()
         self._parse_shot_type()
-        super().save(*args, **kwargs)
 
     def _feet_to_yards(self, feet: int | None) -> int | None:
         if feet is None:
@@ -244,6 +292,169 @@ class Shot(models.Model):
         return f"{self.shot_type} - {self.start_distance}"
 
 
+class RoundSummaryManager(models.Manager):
+    def refresh(self, round: Round) -> "RoundSummary":
+        """
+        Recompute and store the summary for a round.
+
+        Loads the round's holes and shots with two queries and aggregates them
+        in memory; complete rounds also get their stats stored. Callers that
+        change holes or shots should run this inside the same transaction as
+        the change.
+        """
+        holes = list(round.hole_set.with_shots())
+        holes_with_shots = [hole for hole in holes if hole.shot_set.all()]
+
+        def total(category):
+            # Shots outside the baseline come back as NaN; leave them out
+            values = (getattr(hole, category) for hole in holes_with_shots)
+            return sum(value for value in values if not isnan(value))
+
+        # Complete rounds also store their detail page stats. Imported here
+        # because the stats services import these models.
+        from birdie_buddy.round_entry.services.round_stats_service import (
+            RoundStatsService,
+        )
+
+        complete = len(holes_with_shots) == round.holes_played
+        stats = None
+        if complete:
+            stats = RoundStatsService.to_json(RoundStatsService.compute(round))
+
+        summary, _ = self.update_or_create(
+            round=round,
+            defaults={
+                "strokes_gained_driving": total("strokes_gained_driving"),
+                "strokes_gained_approach": total("strokes_gained_approach"),
+                "strokes_gained_putting": total("strokes_gained_putting"),
+                "strokes_gained_around_the_green": total(
+                    "strokes_gained_around_the_green"
+                ),
+                "score": sum(hole.score or 0 for hole in holes),
+                "par": sum(hole.par for hole in holes),
+                "holes_with_shots": len(holes_with_shots),
+                "shot_count": sum(len(hole.shot_set.all()) for hole in holes),
+                "complete": complete,
+                "stats": stats,
+            },
+        )
+        round.summary = summary
+        return summary
+
+
+class RoundSummary(models.Model):
+    """Denormalized per-round totals, kept up to date whenever holes or shots change."""
+
+    round = models.OneToOneField(
+        Round, on_delete=models.CASCADE, related_name="summary"
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+    strokes_gained_driving = models.FloatField(default=0)
+    strokes_gained_approach = models.FloatField(default=0)
+    strokes_gained_putting = models.FloatField(default=0)
+    strokes_gained_around_the_green = models.FloatField(default=0)
+    score = models.IntegerField(default=0)
+    par = models.IntegerField(default=0)
+    holes_with_shots = models.IntegerField(default=0)
+    shot_count = models.IntegerField(default=0)
+    complete = models.BooleanField(default=False)
+    stats = models.JSONField(
+        null=True, help_text="Round detail stats, stored while the round is complete"
+    )
+
+    objects = RoundSummaryManager()
+
+    def __str__(self):
+        return f"Summary for round {self.round_id}"
+
+    @property
+    def score_to_par(self) -> int:
+        return self.score - self.par
+
+
+class ShotBucketAggregateManager(models.Manager):
+    def for_user(self, user, shot_type: str) -> dict[str, "ShotBucketAggregate"]:
+        """A user's aggregates for one shot type, keyed by bucket name."""
+        return {
+            aggregate.bucket: aggregate
+            for aggregate in self.filter(user=user, shot_type=shot_type)
+        }
+
+
+class ShotBucketAggregate(models.Model):
+    """
+    Running totals of a user's shots in one stats bucket.
+
+    Maintained incrementally as holes and shots are written, so the stats
+    services read a row per bucket instead of scanning every shot.
+    """
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    shot_type = models.CharField(max_length=16)
+    bucket = models.CharField(max_length=32)
+    shot_count = models.IntegerField(default=0)
+    strokes_gained_sum = models.FloatField(default=0)
+    leave_feet_sum = models.BigIntegerField(default=0)
+    leave_count = models.IntegerField(default=0)
+    holed_count = models.IntegerField(default=0)
+    hole_count = models.IntegerField(
+        default=0, help_text="Holes with at least one shot in the bucket"
+    )
+    two_chip_holes = models.IntegerField(
+        default=0, help_text="Holes with two or more shots in the bucket"
+    )
+
+    objects = ShotBucketAggregateManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "shot_type", "bucket"],
+                name="unique_shot_bucket_aggregate",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.shot_type} {self.bucket} for user {self.user_id}"
+
+    @property
+    def avg_leave_feet(self) -> float:
+        return self.leave_feet_sum / self.leave_count if self.leave_count else 0.0
+
+    @property
+    def two_chip_pct(self) -> float:
+        return (self.two_chip_holes / self.hole_count) * 100 if self.hole_count else 0.0
+
+
+class StatsVersion(models.Model):
+    """
+    The data version StatsCache keys a user's cached stats by.
+
+    Kept in the database rather than the cache, so a version replaced by one
+    process, e.g. the scorecard worker, is seen by every other process
+    whichever cache backend each of them uses.
+    """
+
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True)
+    version = models.CharField(max_length=32)
+
+    def __str__(self):
+        return f"Stats version {self.version} for user {self.user_id}"
+
+
+class ScorecardUploadBatch(models.Model):
+    """Scorecard images uploaded together, e.g. the rounds from a golf trip."""
+
+    created_at = models.DateTimeField(default=timezone.now)
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+
+    class Meta:
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Scorecard batch {self.id} - {self.created_at.date()}"
+
+
 class ScorecardUpload(models.Model):
     """Model for storing uploaded scorecard image"""
 
@@ -266,9 +477,99 @@ class ScorecardUpload(models.Model):
         blank=True,
         help_text="JSON data parsed from scorecard image for debugging",
     )
+    batch = models.ForeignKey(
+        ScorecardUploadBatch,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="uploads",
+    )
 
     class Meta:
         ordering = ["-created_at"]
 
     def __str__(self):
         return f"Scorecard for {self.course_name} - {self.created_at.date()}"
+
+
+class ScorecardParseJob(models.Model):
+    """
+    A queued parse of an uploaded scorecard image.
+
+    Uploads enqueue a job and return straight away; the run_scorecard_worker
+    command claims jobs oldest first, parses the image and imports the round.
+    The processed image travels on the job, so the worker parses it from
+    memory and writes it to storage afterwards rather than reading it back.
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (QUEUED, "Queued"),
+        (RUNNING, "Running"),
+        (SUCCEEDED, "Succeeded"),
+        (FAILED, "Failed"),
+    ]
+
+    created_at = models.DateTimeField(default=timezone.now)
+    scorecard_upload = models.OneToOneField(
+        ScorecardUpload, on_delete=models.CASCADE, related_name="parse_job"
+    )
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=QUEUED)
+    attempts = models.IntegerField(default=0)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    error = models.TextField(blank=True)
+    image = models.BinaryField(
+        null=True,
+        editable=False,
+        help_text="Processed image for the worker, cleared once it is in storage",
+    )
+    image_name = models.CharField(max_length=255, blank=True)
+
+    class Meta:
+        indexes = [
+            # Workers claim the oldest job in a status
+            models.Index(fields=["status", "created_at"], name="parse_job_status_idx")
+        ]
+
+    def __str__(self):
+        return f"Parse job for upload {self.scorecard_upload_id} ({self.status})"
+
+    @property
+    def is_pending(self) -> bool:
+        return self.status in (self.QUEUED, self.RUNNING)
+
+
+class ScorecardParseCacheEntry(models.Model):
+    """
+    A parsed scorecard kept for re-uploads of the same photo.
+
+    Keyed per user by the SHA-256 of the processed image bytes, with a
+    perceptual hash so a re-encoded copy of the photo also matches.
+    """
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE)
+    image_hash = models.CharField(max_length=64)
+    perceptual_hash = models.CharField(max_length=64, blank=True)
+    parsed_data = models.JSONField()
+    created_at = models.DateTimeField(default=timezone.now)
+    last_used_at = models.DateTimeField(default=timezone.now)
+    hits = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["user", "image_hash"], name="unique_parse_cache_image"
+            )
+        ]
+        indexes = [
+            # Eviction drops the least recently used entries first
+            models.Index(fields=["last_used_at"], name="parse_cache_last_used_idx"),
+        ]
+        verbose_name_plural = "scorecard parse cache entries"
+
+    def __str__(self):
+        return f"Parse cache {self.image_hash[:12]} for user {self.user_id}"
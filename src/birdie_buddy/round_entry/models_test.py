@@ -3,7 +3,7 @@ from birdie_buddy.round_entry.factories.hole_factory import (
 )
 from birdie_buddy.round_entry.factories.round_factory import RoundFactory
 from birdie_buddy.round_entry.factories.shot_factory import ShotFactory
-from birdie_buddy.round_entry.models import Hole
+from birdie_buddy.round_entry.models import Hole, Round, RoundSummary
 from django.core.exceptions import ValidationError
 import pytest
 
@@ -18,6 +18,23 @@ class TestStrokesGained:
         hole = HoleFactory.par_3_par()
         assert hole.strokes_gained == pytest.approx(0.085)
 
+    def test_properties_read_prefetched_shots(self, db, django_assert_num_queries):
+        HoleFactory.par_3_par()
+        HoleFactory.par_3_par()
+
+        holes = list(Hole.objects.with_shots())
+        with django_assert_num_queries(0):
+            for hole in holes:
+                assert hole.strokes_gained == pytest.approx(0.085)
+                hole.strokes_gained_driving
+                hole.strokes_gained_approach
+                hole.strokes_gained_putting
+                str(hole)
+
+    def test_no_shots(self, db, user):
+        hole = HoleFactory(user=user)
+        assert hole.strokes_gained is None
+
 
 class TestRound:
     def test_complete_true_when_all_holes_have_shots(self, db, user):
@@ -26,6 +43,7 @@ class TestRound:
         hole2 = HoleFactory(round=round, user=user, number=2)
         ShotFactory(hole=hole1, user=user)
         ShotFactory(hole=hole2, user=user)
+        RoundSummary.objects.refresh(round)
 
         assert round.complete is True
 
@@ -157,3 +175,65 @@ class TestMentalScorecardValidation:
     def test_mental_scorecard_none_is_valid(self, db, user):
         hole = HoleFactory(user=user, score=5, number=1)
         hole.full_clean()
+
+
+class TestRoundSummary:
+    def test_refresh_totals_holes_and_shots(self, db, user):
+        round = RoundFactory(user=user, holes_played=2)
+        par_4 = HoleFactory.par_4_par(round=round, user=user, number=1)
+        par_3 = HoleFactory.par_3_par(round=round, user=user, number=2)
+
+        summary = RoundSummary.objects.refresh(round)
+
+        assert summary.score == 7
+        assert summary.par == 7
+        assert summary.shot_count == 7
+        assert summary.holes_with_shots == 2
+        assert summary.complete is True
+        assert summary.strokes_gained_driving == pytest.approx(
+            par_4.strokes_gained_driving
+        )
+        assert summary.strokes_gained_approach == pytest.approx(
+            par_4.strokes_gained_approach + par_3.strokes_gained_approach
+        )
+        assert summary.strokes_gained_putting == pytest.approx(
+            par_4.strokes_gained_putting + par_3.strokes_gained_putting
+        )
+
+    def test_refresh_updates_existing_summary(self, db, user):
+        round = RoundFactory(user=user, holes_played=2)
+        HoleFactory.par_4_par(round=round, user=user, number=1)
+        RoundSummary.objects.refresh(round)
+
+        HoleFactory.par_3_par(round=round, user=user, number=2)
+        RoundSummary.objects.refresh(round)
+
+        assert RoundSummary.objects.filter(round=round).count() == 1
+        assert round.summary.complete is True
+
+    def test_round_without_summary_reads_empty_one(
+        self, db, user, django_assert_num_queries
+    ):
+        round = RoundFactory(user=user, holes_played=1)
+        HoleFactory.par_4_par(round=round, user=user, number=1)
+        RoundSummary.objects.filter(round=round).delete()
+        round = Round.objects.get(pk=round.pk)
+
+        # One query for the missing summary and nothing written
+        with django_assert_num_queries(1):
+            assert round.complete is False
+            assert round.strokes_gained_putting == 0
+        assert not RoundSummary.objects.filter(round=round).exists()
+
+    def test_round_reads_come_from_summary(self, db, user, django_assert_num_queries):
+        round = RoundFactory(user=user, holes_played=1)
+        HoleFactory.par_4_par(round=round, user=user, number=1)
+        RoundSummary.objects.refresh(round)
+        round = Round.objects.get(pk=round.pk)
+
+        with django_assert_num_queries(1):
+            round.strokes_gained_driving
+            round.strokes_gained_approach
+            round.strokes_gained_putting
+            round.strokes_gained_around_the_green
+            round.complete
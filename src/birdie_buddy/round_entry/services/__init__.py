@@ -1,3 +1,8 @@
-from .avg_strokes_to_holeout import avg_strokes_to_holeout
+from .avg_strokes_to_holeout import avg_strokes_to_holeout, avg_strokes_to_holeout_many
+from .strokes_gained import strokes_gained_for_shots
 
-__all__ = ["avg_strokes_to_holeout"]
+__all__ = [
+    "avg_strokes_to_holeout",
+    "avg_strokes_to_holeout_many",
+    "strokes_gained_for_shots",
+]
@@ -1,9 +1,17 @@
 from typing import NamedTuple
 
-from django.db.models import Sum
-
-from birdie_buddy.round_entry.models import Hole, Shot
+from django.db.models import Avg, Sum
+
+from birdie_buddy.round_entry.models import Hole, Shot, ShotBucketAggregate
+from birdie_buddy.round_entry.services.avg_strokes_to_holeout import DEFAULT_BASELINE
+from birdie_buddy.round_entry.services.baseline_shots import BaselineStatsMixin
+from birdie_buddy.round_entry.services.bucket_aggregator import (
+    BucketAggregator,
+    ShotBucket,
+)
 from birdie_buddy.round_entry.services.proximity_calculator import ProximityCalculator
+from birdie_buddy.round_entry.services.stats_window import StatsWindow
+from birdie_buddy.round_entry.services.user_stats_snapshot import UserStatsSnapshot
 
 
 class ApproachStats(NamedTuple):
@@ -25,9 +33,29 @@ class ApproachStats(NamedTuple):
     avg_proximity_over_200_rough: float
 
 
-class ApproachShotService:
-    def __init__(self):
+class ApproachShotService(BaselineStatsMixin):
+    BUCKETS = {
+        "30_100": ShotBucket("approach", 30, 100),
+        "100_150": ShotBucket("approach", 100, 150),
+        "150_200": ShotBucket("approach", 150, 200),
+        "over_200": ShotBucket("approach", 200),
+        "30_100_rough": ShotBucket("approach", 30, 100, "rough"),
+        "100_150_rough": ShotBucket("approach", 100, 150, "rough"),
+        "150_200_rough": ShotBucket("approach", 150, 200, "rough"),
+        "over_200_rough": ShotBucket("approach", 200, None, "rough"),
+    }
+
+    STROKES_GAINED_BUCKETS = {
+        f"strokes_gained_{name}_per_18": bucket for name, bucket in BUCKETS.items()
+    }
+
+    PROXIMITY_BUCKETS = {
+        f"avg_proximity_{name}": bucket for name, bucket in BUCKETS.items()
+    }
+
+    def __init__(self, baseline: str = DEFAULT_BASELINE):
         self.proximity_calculator = ProximityCalculator()
+        self.baseline = baseline
 
     def strokes_gained_by_distance_range(
         self, user, min_distance: int, max_distance: int | None, lie: str | None = None, round=None
@@ -47,8 +75,13 @@ class ApproachShotService:
         if round is not None:
             filters["hole__round"] = round
 
-        shots = Shot.objects.filter(**filters)
-        total_sg = shots.aggregate(total=Sum("strokes_gained"))["total"] or 0.0
+        if self.uses_default_baseline:
+            shots = Shot.objects.filter(**filters)
+            total_sg = shots.aggregate(total=Sum("strokes_gained"))["total"] or 0.0
+        else:
+            total_sg = self.baseline_shots(user).strokes_gained(
+                "approach", min_distance, max_distance, lie=lie, round=round
+            )
 
         if round is not None:
             return total_sg
@@ -123,46 +156,76 @@ class ApproachShotService:
             user, "approach", 200, None, lie="rough", round=round
         )
 
-    def get_for_user(self, user):
-        return ApproachStats(
-            strokes_gained_30_100_per_18=self.strokes_gained_30_100(user),
-            strokes_gained_100_150_per_18=self.strokes_gained_100_150(user),
-            strokes_gained_150_200_per_18=self.strokes_gained_150_200(user),
-            strokes_gained_over_200_per_18=self.strokes_gained_over_200(user),
-            strokes_gained_30_100_rough_per_18=self.strokes_gained_30_100_rough(user),
-            strokes_gained_100_150_rough_per_18=self.strokes_gained_100_150_rough(user),
-            strokes_gained_150_200_rough_per_18=self.strokes_gained_150_200_rough(user),
-            strokes_gained_over_200_rough_per_18=self.strokes_gained_over_200_rough(
-                user
-            ),
-            avg_proximity_30_100=self.avg_proximity_30_100(user),
-            avg_proximity_100_150=self.avg_proximity_100_150(user),
-            avg_proximity_150_200=self.avg_proximity_150_200(user),
-            avg_proximity_over_200=self.avg_proximity_over_200(user),
-            avg_proximity_30_100_rough=self.avg_proximity_30_100_rough(user),
-            avg_proximity_100_150_rough=self.avg_proximity_100_150_rough(user),
-            avg_proximity_150_200_rough=self.avg_proximity_150_200_rough(user),
-            avg_proximity_over_200_rough=self.avg_proximity_over_200_rough(user),
+    def get_for_user(
+        self,
+        user,
+        snapshot: UserStatsSnapshot | None = None,
+        window: StatsWindow | None = None,
+    ) -> ApproachStats:
+        """
+        Per 18 hole stats. With no window and the default baseline they are
+        read from the user's ShotBucketAggregate rows; otherwise from the
+        snapshot given, or one loaded for the window.
+        """
+        if snapshot is None and window is None and self.uses_default_baseline:
+            return self._get_from_aggregates(user)
+        if snapshot is None:
+            snapshot = UserStatsSnapshot.load(user, window)
+        return self._get_from_snapshot(snapshot)
+
+    def get_for_round(self, round) -> ApproachStats:
+        return self.get_for_rounds([round])[round.pk]
+
+    def get_for_rounds(self, rounds) -> dict[int, ApproachStats]:
+        """
+        Unscaled stats for each round, keyed by round id, from one GROUP BY
+        round query however many rounds are passed.
+        """
+        rounds = list(rounds)
+        by_round = BucketAggregator.aggregate_many_by(
+            Shot.objects.filter(hole__round__in=rounds),
+            "hole__round_id",
+            self._bucket_aggregates(),
         )
 
-    def get_for_round(self, round):
-        return ApproachStats(
-            strokes_gained_30_100_per_18=self.strokes_gained_30_100(round.user, round),
-            strokes_gained_100_150_per_18=self.strokes_gained_100_150(round.user, round),
-            strokes_gained_150_200_per_18=self.strokes_gained_150_200(round.user, round),
-            strokes_gained_over_200_per_18=self.strokes_gained_over_200(round.user, round),
-            strokes_gained_30_100_rough_per_18=self.strokes_gained_30_100_rough(round.user, round),
-            strokes_gained_100_150_rough_per_18=self.strokes_gained_100_150_rough(round.user, round),
-            strokes_gained_150_200_rough_per_18=self.strokes_gained_150_200_rough(round.user, round),
-            strokes_gained_over_200_rough_per_18=self.strokes_gained_over_200_rough(
-                round.user, round
-            ),
-            avg_proximity_30_100=self.avg_proximity_30_100(round.user, round),
-            avg_proximity_100_150=self.avg_proximity_100_150(round.user, round),
-            avg_proximity_150_200=self.avg_proximity_150_200(round.user, round),
-            avg_proximity_over_200=self.avg_proximity_over_200(round.user, round),
-            avg_proximity_30_100_rough=self.avg_proximity_30_100_rough(round.user, round),
-            avg_proximity_100_150_rough=self.avg_proximity_100_150_rough(round.user, round),
-            avg_proximity_150_200_rough=self.avg_proximity_150_200_rough(round.user, round),
-            avg_proximity_over_200_rough=self.avg_proximity_over_200_rough(round.user, round),
-        )
+        results = {}
+        for round in rounds:
+            stats = dict.fromkeys(ApproachStats._fields, 0.0)
+            stats.update(by_round.get(round.pk, {}))
+            if not self.uses_default_baseline:
+                shots = self.baseline_shots(round.user)
+                for name, bucket in self.STROKES_GAINED_BUCKETS.items():
+                    stats[name] = shots.strokes_gained(*bucket, round=round)
+            results[round.pk] = ApproachStats(**stats)
+        return results
+
+    def _bucket_aggregates(self) -> dict:
+        """Stored strokes gained only apply to the default baseline."""
+        aggregates = {"leave_feet": (Avg, self.PROXIMITY_BUCKETS)}
+        if self.uses_default_baseline:
+            aggregates["strokes_gained"] = (Sum, self.STROKES_GAINED_BUCKETS)
+        return aggregates
+
+    def _get_from_snapshot(self, snapshot: UserStatsSnapshot) -> ApproachStats:
+        strokes_gained = snapshot.strokes_gained(self.baseline)
+        stats = {}
+        for name, bucket in self.STROKES_GAINED_BUCKETS.items():
+            stats[name] = snapshot.per_18(
+                snapshot.total(strokes_gained, snapshot.select(*bucket))
+            )
+        for name, bucket in self.PROXIMITY_BUCKETS.items():
+            stats[name] = snapshot.mean(snapshot.leave_feet, snapshot.select(*bucket))
+        return ApproachStats(**stats)
+
+    def _get_from_aggregates(self, user) -> ApproachStats:
+        aggregates = ShotBucketAggregate.objects.for_user(user, "approach")
+        total_holes = Hole.objects.filter(user=user).count()
+
+        stats = {}
+        for name in self.BUCKETS:
+            aggregate = aggregates.get(name, ShotBucketAggregate())
+            stats[f"strokes_gained_{name}_per_18"] = (
+                (aggregate.strokes_gained_sum / total_holes) * 18 if total_holes else 0.0
+            )
+            stats[f"avg_proximity_{name}"] = aggregate.avg_leave_feet
+        return ApproachStats(**stats)
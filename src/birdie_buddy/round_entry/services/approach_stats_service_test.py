@@ -5,6 +5,7 @@ from birdie_buddy.round_entry.factories import (
     RoundFactory,
     ShotFactory,
 )
+from birdie_buddy.round_entry.factories.full_round_factory import full_round_factory
 
 from birdie_buddy.users.factories import UserFactory
 
@@ -1576,3 +1577,57 @@ class TestApproachShotService:
         assert stats.strokes_gained_150_200_per_18 == 0.0
         assert stats.strokes_gained_over_200_per_18 == 0.0
 
+
+    def test_get_for_user_query_count(self, django_assert_num_queries):
+        user = UserFactory()
+        service = ApproachShotService()
+        round = RoundFactory(user=user)
+
+        for number, start_distance in enumerate([80, 120, 170, 220], start=1):
+            hole = HoleFactory(user=user, round=round, par=4, number=number)
+            ShotFactory(user=user, hole=hole, number=1, lie="tee", start_distance=400)
+            ShotFactory(
+                user=user, hole=hole, number=2, lie="rough", start_distance=start_distance
+            )
+            ShotFactory(user=user, hole=hole, number=3, lie="green", start_distance=10)
+
+        expected = service.strokes_gained_100_150_rough(user)
+
+        with django_assert_num_queries(2):
+            stats = service.get_for_user(user)
+
+        assert stats.strokes_gained_100_150_rough_per_18 == pytest.approx(expected)
+        assert stats.avg_proximity_100_150_rough == 10.0
+
+        with django_assert_num_queries(1):
+            service.get_for_round(round)
+
+    def test_get_for_rounds_matches_per_round_queries(self, django_assert_num_queries):
+        user = UserFactory()
+        service = ApproachShotService()
+        rounds = [
+            full_round_factory(n_holes=9, user=user),
+            full_round_factory(n_holes=9, user=user),
+            RoundFactory(user=user),
+        ]
+
+        with django_assert_num_queries(1):
+            results = service.get_for_rounds(rounds)
+
+        for round in rounds:
+            stats = results[round.pk]
+            for name, bucket in service.BUCKETS.items():
+                assert getattr(stats, f"strokes_gained_{name}_per_18") == pytest.approx(
+                    service.strokes_gained_by_distance_range(
+                        user,
+                        bucket.min_distance,
+                        bucket.max_distance,
+                        lie=bucket.lie,
+                        round=round,
+                    )
+                )
+                assert getattr(stats, f"avg_proximity_{name}") == pytest.approx(
+                    service.proximity_calculator.calculate_avg_proximity(
+                        user, *bucket, round=round
+                    )
+                )
@@ -1,5 +1,11 @@
+from math import isnan
+
 from django.db.models import Sum
 from birdie_buddy.round_entry.models import Hole, Shot
+from birdie_buddy.round_entry.services.avg_strokes_to_holeout import DEFAULT_BASELINE
+from birdie_buddy.round_entry.services.baseline_shots import BaselineShots
+from birdie_buddy.round_entry.services.stats_window import StatsWindow
+from birdie_buddy.round_entry.services.user_stats_snapshot import UserStatsSnapshot
 from collections import namedtuple
 
 StrokesGainedCategories = namedtuple(
@@ -7,7 +13,20 @@ StrokesGainedCategories = namedtuple(
 )
 
 
-def get_avg_strokes_gained_categories_per_18(user):
+def get_avg_strokes_gained_categories_per_18(
+    user,
+    baseline=DEFAULT_BASELINE,
+    snapshot: UserStatsSnapshot | None = None,
+    window: StatsWindow | None = None,
+):
+    if snapshot is None and window is not None:
+        snapshot = UserStatsSnapshot.load(user, window)
+    if snapshot is not None:
+        return _get_avg_strokes_gained_categories_from_snapshot(snapshot, baseline)
+
+    if baseline != DEFAULT_BASELINE:
+        return _get_avg_strokes_gained_categories_for_baseline(user, baseline)
+
     shots = Shot.objects.filter(user=user, strokes_gained__isnull=False)
     total_holes = shots.values("hole").distinct().count()
     if total_holes == 0:
@@ -44,3 +63,49 @@ def get_avg_strokes_gained_categories_per_18(user):
         short_game / total_holes * 18,
         putting / total_holes * 18,
     )
+
+
+def _get_avg_strokes_gained_categories_for_baseline(user, baseline):
+    totals = {"drive": 0, "approach": 0, "around_green": 0, "putt": 0}
+    holes = set()
+
+    for shot in BaselineShots(user, baseline).shots:
+        if isnan(shot.strokes_gained):
+            continue
+        holes.add(shot.hole_id)
+        if shot.shot_type in totals:
+            totals[shot.shot_type] += shot.strokes_gained
+
+    if not holes:
+        return StrokesGainedCategories(0, 0, 0, 0)
+
+    return StrokesGainedCategories(
+        totals["drive"] / len(holes) * 18,
+        totals["approach"] / len(holes) * 18,
+        totals["around_green"] / len(holes) * 18,
+        totals["putt"] / len(holes) * 18,
+    )
+
+
+def _get_avg_strokes_gained_categories_from_snapshot(snapshot, baseline):
+    totals = {"drive": 0, "approach": 0, "around_green": 0, "putt": 0}
+    holes = set()
+
+    for hole_id, shot_type, sg in zip(
+        snapshot.shot_hole_ids, snapshot.shot_types, snapshot.strokes_gained(baseline)
+    ):
+        if isnan(sg):
+            continue
+        holes.add(hole_id)
+        if shot_type in totals:
+            totals[shot_type] += sg
+
+    if not holes:
+        return StrokesGainedCategories(0, 0, 0, 0)
+
+    return StrokesGainedCategories(
+        totals["drive"] / len(holes) * 18,
+        totals["approach"] / len(holes) * 18,
+        totals["around_green"] / len(holes) * 18,
+        totals["putt"] / len(holes) * 18,
+    )
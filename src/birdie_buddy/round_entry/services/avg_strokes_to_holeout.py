@@ -1,10 +1,168 @@
-from .strokes_gained_data import SG_DATA
+import json
+import mmap
+import struct
+import sys
+from array import array
+from functools import cache
+from math import isnan, nan
+from pathlib import Path
+from typing import Iterable
 
+# Map penalty to recovery since SG_DATA doesn't have penalty-specific data
+LIE_ALIASES = {"penalty": "recovery"}
 
-def avg_strokes_to_holeout(distance, lie):
-    # Map penalty to recovery since SG_DATA doesn't have penalty-specific data
-    if lie == "penalty":
-        lie = "recovery"
+BASELINES_DIR = Path(__file__).resolve().parent.parent / "baselines"
 
-    result = SG_DATA[lie][distance]
-    return result
+# name -> (label, module whose SG_DATA is compiled into baselines/<name>.bin)
+BASELINES = {
+    "tour": ("Tour", "birdie_buddy.round_entry.services.strokes_gained_data"),
+}
+DEFAULT_BASELINE = "tour"
+
+# File layout: magic, header length, JSON header, padding to an 8 byte
+# boundary, then the little-endian doubles of the flat values array.
+BASELINE_MAGIC = b"SGB1"
+BASELINE_PREAMBLE = struct.Struct("<4sI")
+
+
+class BaselineTable:
+    """
+    Dense, array-backed strokes gained baseline.
+
+    Every lie owns a contiguous block of doubles in one flat array, indexed by
+    distance, so a lookup is an offset add and an index instead of two dict
+    probes. Distances missing from the source data are stored as NaN.
+    """
+
+    def __init__(self, values, offsets: dict[str, int], max_distances: dict[str, int]):
+        self.values = values
+        self.offsets = offsets
+        self.max_distances = max_distances
+
+    @classmethod
+    def from_dict(cls, data: dict[str, dict[int, float]]) -> "BaselineTable":
+        values = array("d")
+        offsets = {}
+        max_distances = {}
+
+        for lie, by_distance in data.items():
+            max_distance = max(by_distance)
+            block = array("d", [nan]) * (max_distance + 1)
+            for distance, expected in by_distance.items():
+                block[distance] = expected
+
+            offsets[lie] = len(values)
+            max_distances[lie] = max_distance
+            values.extend(block)
+
+        return cls(values, offsets, max_distances)
+
+    @classmethod
+    def load(cls, path: Path) -> "BaselineTable":
+        """
+        Memory-map a compiled baseline file.
+
+        The values are read straight out of the mapping, so every process that
+        loads the same file shares its pages instead of holding its own copy.
+        """
+        with open(path, "rb") as f:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, header_length = BASELINE_PREAMBLE.unpack_from(mapping, 0)
+        if magic != BASELINE_MAGIC:
+            raise ValueError(f"{path} is not a compiled strokes gained baseline")
+
+        start = BASELINE_PREAMBLE.size
+        header = json.loads(mapping[start : start + header_length])
+        start = _align(start + header_length)
+
+        values = memoryview(mapping)[start:].cast("d")
+        if sys.byteorder != "little":
+            values = array("d", values.tobytes())
+            values.byteswap()
+
+        offsets = {lie: offset for lie, (offset, _) in header["lies"].items()}
+        max_distances = {lie: max_d for lie, (_, max_d) in header["lies"].items()}
+        return cls(values, offsets, max_distances)
+
+    def to_bytes(self) -> bytes:
+        """Serialize the table in the format read by load()."""
+        header = json.dumps(
+            {
+                "lies": {
+                    lie: [offset, self.max_distances[lie]]
+                    for lie, offset in self.offsets.items()
+                }
+            }
+        ).encode()
+
+        values = array("d", self.values)
+        if sys.byteorder != "little":
+            values.byteswap()
+
+        preamble = BASELINE_PREAMBLE.pack(BASELINE_MAGIC, len(header)) + header
+        padding = b"\0" * (_align(len(preamble)) - len(preamble))
+        return preamble + padding + values.tobytes()
+
+    def _index(self, distance, lie) -> int:
+        lie = LIE_ALIASES.get(lie, lie)
+        offset = self.offsets.get(lie)
+        if offset is None or distance is None:
+            return -1
+        if type(distance) is not int:
+            # Match dict semantics: 15.0 finds the 15 entry, 7.5 finds nothing
+            if distance != int(distance):
+                return -1
+            distance = int(distance)
+        if distance < 0 or distance > self.max_distances[lie]:
+            return -1
+        return offset + distance
+
+    def lookup(self, distance, lie) -> float:
+        """Return the expected strokes to hole out, raising KeyError when unknown."""
+        index = self._index(distance, lie)
+        result = self.values[index] if index >= 0 else nan
+        if isnan(result):
+            raise KeyError((lie, distance))
+        return result
+
+    def lookup_many(self, distances: Iterable, lies: Iterable) -> array:
+        """
+        Return the expected strokes to hole out for each (distance, lie) pair.
+
+        Pairs that are not covered by the baseline come back as NaN rather than
+        raising, so callers can decide whether a missing value matters.
+        """
+        index = self._index
+        values = self.values
+        result = array("d")
+        for distance, lie in zip(distances, lies, strict=True):
+            i = index(distance, lie)
+            result.append(values[i] if i >= 0 else nan)
+        return result
+
+
+def _align(size: int) -> int:
+    return (size + 7) & ~7
+
+
+def baseline_path(name: str) -> Path:
+    return BASELINES_DIR / f"{name}.bin"
+
+
+@cache
+def get_baseline(name: str = DEFAULT_BASELINE) -> BaselineTable:
+    """Load a compiled baseline on first use and keep it for the process."""
+    if name not in BASELINES:
+        raise ValueError(f"Unknown strokes gained baseline: {name}")
+    return BaselineTable.load(baseline_path(name))
+
+
+def avg_strokes_to_holeout(distance, lie, baseline: str = DEFAULT_BASELINE):
+    return get_baseline(baseline).lookup(distance, lie)
+
+
+def avg_strokes_to_holeout_many(
+    distances, lies, baseline: str = DEFAULT_BASELINE
+) -> array:
+    return get_baseline(baseline).lookup_many(distances, lies)
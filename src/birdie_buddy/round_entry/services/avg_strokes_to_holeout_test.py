@@ -0,0 +1,115 @@
+import math
+from importlib import import_module
+
+import pytest
+
+from birdie_buddy.round_entry.services.avg_strokes_to_holeout import (
+    BASELINES,
+    BaselineTable,
+    baseline_path,
+    get_baseline,
+    avg_strokes_to_holeout,
+    avg_strokes_to_holeout_many,
+)
+from birdie_buddy.round_entry.services.strokes_gained_data import SG_DATA
+
+
+class TestAvgStrokesToHoleout:
+    def test_matches_baseline_data(self):
+        assert avg_strokes_to_holeout(400, "tee") == SG_DATA["tee"][400]
+        assert avg_strokes_to_holeout(130, "fairway") == SG_DATA["fairway"][130]
+        assert avg_strokes_to_holeout(15, "green") == SG_DATA["green"][15]
+
+    def test_penalty_uses_recovery(self):
+        assert avg_strokes_to_holeout(150, "penalty") == SG_DATA["recovery"][150]
+
+    def test_unknown_distance_raises_key_error(self):
+        with pytest.raises(KeyError):
+            avg_strokes_to_holeout(700, "tee")
+
+        with pytest.raises(KeyError):
+            avg_strokes_to_holeout(None, "tee")
+
+    def test_unknown_lie_raises_key_error(self):
+        with pytest.raises(KeyError):
+            avg_strokes_to_holeout(100, "cart_path")
+
+    def test_whole_float_distances_are_found(self):
+        assert avg_strokes_to_holeout(15.0, "green") == SG_DATA["green"][15]
+
+        with pytest.raises(KeyError):
+            avg_strokes_to_holeout(7.5, "green")
+
+
+class TestAvgStrokesToHoleoutMany:
+    def test_matches_single_lookups(self):
+        distances = [400, 130, 15, 1, 150]
+        lies = ["tee", "fairway", "green", "green", "penalty"]
+
+        result = avg_strokes_to_holeout_many(distances, lies)
+
+        assert list(result) == [
+            avg_strokes_to_holeout(d, lie) for d, lie in zip(distances, lies)
+        ]
+
+    def test_unknown_entries_are_nan(self):
+        result = avg_strokes_to_holeout_many([700, 100, None], ["tee", "mud", "green"])
+
+        assert all(math.isnan(value) for value in result)
+
+    def test_mismatched_lengths_raise(self):
+        with pytest.raises(ValueError):
+            avg_strokes_to_holeout_many([100, 200], ["tee"])
+
+
+class TestBaselineTable:
+    def test_gaps_in_source_data_are_unknown(self):
+        table = BaselineTable.from_dict({"tee": {1: 3.0, 3: 3.2}})
+
+        assert table.lookup(3, "tee") == 3.2
+        assert math.isnan(table.lookup_many([2], ["tee"])[0])
+        with pytest.raises(KeyError):
+            table.lookup(2, "tee")
+
+    def test_round_trips_through_compiled_file(self, tmp_path):
+        path = tmp_path / "baseline.bin"
+        path.write_bytes(BaselineTable.from_dict({"tee": {1: 3.0, 3: 3.2}}).to_bytes())
+
+        table = BaselineTable.load(path)
+
+        assert table.lookup(1, "tee") == 3.0
+        assert table.lookup(3, "tee") == 3.2
+        with pytest.raises(KeyError):
+            table.lookup(2, "tee")
+
+    def test_load_rejects_other_files(self, tmp_path):
+        path = tmp_path / "baseline.bin"
+        path.write_bytes(b"not a baseline")
+
+        with pytest.raises(ValueError):
+            BaselineTable.load(path)
+
+    @pytest.mark.parametrize("name", list(BASELINES))
+    def test_compiled_baselines_are_up_to_date(self, name):
+        """Run `manage.py compile_sg_baseline` if a baseline's SG_DATA changes."""
+        table = BaselineTable.load(baseline_path(name))
+        source = import_module(BASELINES[name][1]).SG_DATA
+
+        for lie, by_distance in source.items():
+            for distance, expected in by_distance.items():
+                assert table.lookup(distance, lie) == expected
+
+
+class TestGetBaseline:
+    def test_is_cached_per_process(self):
+        assert get_baseline("tour") is get_baseline("tour")
+
+    def test_unknown_baseline_raises(self):
+        with pytest.raises(ValueError):
+            get_baseline("beginner")
+
+    def test_lookups_accept_a_baseline(self):
+        assert avg_strokes_to_holeout(400, "tee", "tour") == SG_DATA["tee"][400]
+        assert list(avg_strokes_to_holeout_many([400], ["tee"], "tour")) == [
+            SG_DATA["tee"][400]
+        ]
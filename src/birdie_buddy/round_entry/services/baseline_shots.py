@@ -0,0 +1,90 @@
+from functools import cached_property
+from math import isnan
+from typing import NamedTuple
+
+from birdie_buddy.round_entry.models import Shot
+from birdie_buddy.round_entry.services.avg_strokes_to_holeout import DEFAULT_BASELINE
+from birdie_buddy.round_entry.services.strokes_gained import strokes_gained_for_shots
+
+
+class RescoredShot(NamedTuple):
+    hole_id: int
+    round_id: int
+    shot_type: str | None
+    lie: str | None
+    start_distance: int | None
+    feet: int | None
+    strokes_gained: float
+
+
+class BaselineShots:
+    """
+    A user's shots re-scored against a named baseline.
+
+    Stored Shot.strokes_gained values are calculated against the default
+    baseline. For any other baseline the shots are loaded with one query,
+    scored with the batch lookup and filtered in memory, so asking for more
+    buckets does not cost more queries.
+    """
+
+    def __init__(self, user, baseline: str):
+        self.user = user
+        self.baseline = baseline
+
+    @cached_property
+    def shots(self) -> list[RescoredShot]:
+        rows = list(
+            Shot.objects.filter(user=self.user)
+            .order_by("hole_id", "number")
+            .values_list(
+                "hole_id", "hole__round_id", "shot_type", "lie", "start_distance", "feet"
+            )
+        )
+        strokes_gained = strokes_gained_for_shots(
+            [row[4] for row in rows],
+            [row[3] for row in rows],
+            hole_ids=[row[0] for row in rows],
+            baseline=self.baseline,
+        )
+        return [RescoredShot(*row, sg) for row, sg in zip(rows, strokes_gained)]
+
+    def strokes_gained(
+        self,
+        shot_type: str,
+        min_distance: int = 0,
+        max_distance: int | None = None,
+        lie: str | None = None,
+        round=None,
+        distance_field: str = "start_distance",
+    ) -> float:
+        """Sum strokes gained for shots matching the same filters the stats services use."""
+        total = 0.0
+        for shot in self.shots:
+            distance = getattr(shot, distance_field)
+            if (
+                shot.shot_type == shot_type
+                and distance is not None
+                and distance >= min_distance
+                and (max_distance is None or distance < max_distance)
+                and (lie is None or shot.lie == lie)
+                and (round is None or shot.round_id == round.pk)
+                and not isnan(shot.strokes_gained)
+            ):
+                total += shot.strokes_gained
+        return total
+
+
+class BaselineStatsMixin:
+    """Lets a stats service compute strokes gained against a non-default baseline."""
+
+    baseline = DEFAULT_BASELINE
+
+    @property
+    def uses_default_baseline(self) -> bool:
+        return self.baseline == DEFAULT_BASELINE
+
+    def baseline_shots(self, user) -> BaselineShots:
+        cached = getattr(self, "_baseline_shots", None)
+        if cached is None or cached.user != user:
+            cached = self._baseline_shots = BaselineShots(user, self.baseline)
+        return cached
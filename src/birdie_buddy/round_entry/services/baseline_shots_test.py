@@ -0,0 +1,102 @@
+import pytest
+
+from birdie_buddy.round_entry.factories import HoleFactory, RoundFactory, ShotFactory
+from birdie_buddy.round_entry.services.approach_stats_service import (
+    ApproachShotService,
+)
+from birdie_buddy.round_entry.services.avg_strokes_gained_per_18 import (
+    get_avg_strokes_gained_categories_per_18,
+)
+from birdie_buddy.round_entry.services.baseline_shots import BaselineShots
+from birdie_buddy.round_entry.services.putting_stats_service import (
+    PuttingStatsService,
+)
+from birdie_buddy.users.factories import UserFactory
+
+
+def create_par_4(user, round, number):
+    hole = HoleFactory(user=user, round=round, par=4, number=number)
+    ShotFactory(user=user, hole=hole, number=1, lie="tee", start_distance=400)
+    ShotFactory(user=user, hole=hole, number=2, lie="fairway", start_distance=130)
+    ShotFactory(user=user, hole=hole, number=3, lie="green", start_distance=15)
+    ShotFactory(user=user, hole=hole, number=4, lie="green", start_distance=1)
+    return hole
+
+
+@pytest.mark.django_db
+class TestBaselineShots:
+    def test_rescores_shots_against_baseline(self, flat_baseline):
+        user = UserFactory()
+        round = RoundFactory(user=user)
+        create_par_4(user, round, 1)
+
+        shots = BaselineShots(user, flat_baseline).shots
+
+        assert [shot.strokes_gained for shot in shots] == [-1.0, -1.0, -1.0, 2.0]
+
+    def test_loads_shots_with_one_query(self, flat_baseline, django_assert_num_queries):
+        user = UserFactory()
+        round = RoundFactory(user=user)
+        create_par_4(user, round, 1)
+        create_par_4(user, round, 2)
+        rescored = BaselineShots(user, flat_baseline)
+
+        with django_assert_num_queries(1):
+            rescored.strokes_gained("approach", 30)
+            rescored.strokes_gained("putt", 0, 3, distance_field="feet")
+
+    def test_filters_by_round(self, flat_baseline):
+        user = UserFactory()
+        round = RoundFactory(user=user)
+        other_round = RoundFactory(user=user)
+        create_par_4(user, round, 1)
+        create_par_4(user, other_round, 1)
+
+        rescored = BaselineShots(user, flat_baseline)
+
+        assert rescored.strokes_gained("putt", 0, round=round, distance_field="feet") == 1.0
+
+
+@pytest.mark.django_db
+class TestServicesWithBaseline:
+    def test_default_baseline_uses_stored_strokes_gained(self):
+        user = UserFactory()
+        round = RoundFactory(user=user)
+        create_par_4(user, round, 1)
+
+        default = ApproachShotService().strokes_gained_100_150(user)
+        tour = ApproachShotService("tour").strokes_gained_100_150(user)
+
+        assert default == tour
+
+    def test_approach_against_other_baseline(self, flat_baseline):
+        user = UserFactory()
+        round = RoundFactory(user=user)
+        create_par_4(user, round, 1)
+
+        service = ApproachShotService(flat_baseline)
+
+        assert service.strokes_gained_100_150(user) == pytest.approx(-1.0 * 18)
+
+    def test_putting_against_other_baseline(self, flat_baseline):
+        user = UserFactory()
+        round = RoundFactory(user=user)
+        create_par_4(user, round, 1)
+
+        service = PuttingStatsService(flat_baseline)
+
+        assert service.strokes_gained_0_3(user) == pytest.approx(2.0 * 18)
+        assert service.strokes_gained_15_20(user) == pytest.approx(-1.0 * 18)
+
+    def test_categories_against_other_baseline(self, flat_baseline):
+        user = UserFactory()
+        round = RoundFactory(user=user)
+        create_par_4(user, round, 1)
+        create_par_4(user, round, 2)
+
+        stats = get_avg_strokes_gained_categories_per_18(user, flat_baseline)
+
+        assert stats.driving == pytest.approx(-1.0 * 18)
+        assert stats.approach == pytest.approx(-1.0 * 18)
+        assert stats.short_game == 0
+        assert stats.putting == pytest.approx(1.0 * 18)
@@ -0,0 +1,106 @@
+from typing import Any, NamedTuple
+
+from django.db.models import Aggregate, Avg, Q, Sum
+
+
+class ShotBucket(NamedTuple):
+    shot_type: str
+    min_distance: int
+    max_distance: int | None = None
+    lie: str | None = None
+
+    def filter(self) -> Q:
+        condition = Q(shot_type=self.shot_type, start_distance__gte=self.min_distance)
+        if self.max_distance is not None:
+            condition &= Q(start_distance__lt=self.max_distance)
+        if self.lie is not None:
+            condition &= Q(lie=self.lie)
+        return condition
+
+    def matches(self, shot, distance_field: str = "start_distance") -> bool:
+        """The in-memory equivalent of filter() for a single shot."""
+        distance = getattr(shot, distance_field)
+        return (
+            shot.shot_type == self.shot_type
+            and distance is not None
+            and distance >= self.min_distance
+            and (self.max_distance is None or distance < self.max_distance)
+            and (self.lie is None or shot.lie == self.lie)
+        )
+
+
+class BucketAggregator:
+    """
+    Aggregates a shot queryset over many distance x lie buckets in one query.
+
+    Buckets may overlap (e.g. "all lies" and "rough only"), so each one is
+    its own conditional aggregate, AGG(field) FILTER (WHERE ...), rather than
+    a GROUP BY. Empty buckets come back as 0.0.
+    """
+
+    @staticmethod
+    def _expressions(aggregates) -> dict[str, Aggregate]:
+        return {
+            name: function(field, filter=bucket.filter())
+            for field, (function, buckets) in aggregates.items()
+            for name, bucket in buckets.items()
+        }
+
+    @staticmethod
+    def aggregate(
+        queryset,
+        buckets: dict[str, ShotBucket],
+        field: str,
+        function: type[Aggregate],
+    ) -> dict[str, float]:
+        return BucketAggregator.aggregate_many(queryset, {field: (function, buckets)})
+
+    @staticmethod
+    def aggregate_many(
+        queryset,
+        aggregates: dict[str, tuple[type[Aggregate], dict[str, ShotBucket]]],
+    ) -> dict[str, float]:
+        """
+        Aggregate several fields at once, mapping field -> (function, buckets).
+
+        Bucket names must be unique across all fields.
+        """
+        expressions = BucketAggregator._expressions(aggregates)
+        if not expressions:
+            return {}
+
+        results = queryset.aggregate(**expressions)
+        return {name: float(value or 0.0) for name, value in results.items()}
+
+    @staticmethod
+    def aggregate_many_by(
+        queryset,
+        group_by: str,
+        aggregates: dict[str, tuple[type[Aggregate], dict[str, ShotBucket]]],
+    ) -> dict[Any, dict[str, float]]:
+        """
+        aggregate_many() for every value of group_by in one GROUP BY query.
+
+        Groups with no rows are missing from the result.
+        """
+        expressions = BucketAggregator._expressions(aggregates)
+        if not expressions:
+            return {}
+
+        rows = queryset.values(group_by).annotate(**expressions).order_by()
+        return {
+            row.pop(group_by): {
+                name: float(value or 0.0) for name, value in row.items()
+            }
+            for row in rows
+        }
+
+    @staticmethod
+    def sums(queryset, buckets: dict[str, ShotBucket], field: str) -> dict[str, float]:
+        return BucketAggregator.aggregate(queryset, buckets, field, Sum)
+
+    @staticmethod
+    def averages(
+        queryset, buckets: dict[str, ShotBucket], field: str
+    ) -> dict[str, float]:
+        return BucketAggregator.aggregate(queryset, buckets, field, Avg)
@@ -0,0 +1,69 @@
+import pytest
+from django.db.models import Count
+
+from birdie_buddy.round_entry.factories import HoleFactory, ShotFactory
+from birdie_buddy.round_entry.models import Shot
+from birdie_buddy.round_entry.services.bucket_aggregator import (
+    BucketAggregator,
+    ShotBucket,
+)
+from birdie_buddy.users.factories import UserFactory
+
+
+class TestShotBucket:
+    def test_open_ended_bucket_has_no_upper_bound(self):
+        assert "start_distance__lt" not in str(ShotBucket("approach", 200).filter())
+
+    def test_lie_is_optional(self):
+        assert "lie" not in str(ShotBucket("approach", 30, 100).filter())
+        assert "rough" in str(ShotBucket("approach", 30, 100, "rough").filter())
+
+
+@pytest.mark.django_db
+class TestBucketAggregator:
+    def test_empty_buckets_are_zero(self):
+        user = UserFactory()
+
+        result = BucketAggregator.sums(
+            Shot.objects.filter(user=user),
+            {"short": ShotBucket("approach", 30, 100)},
+            "strokes_gained",
+        )
+
+        assert result == {"short": 0.0}
+
+    def test_overlapping_buckets_in_one_query(self, django_assert_num_queries):
+        user = UserFactory()
+        hole = HoleFactory(user=user)
+        ShotFactory(
+            user=user,
+            hole=hole,
+            number=1,
+            lie="fairway",
+            start_distance=80,
+            strokes_gained=0.5,
+        )
+        ShotFactory(
+            user=user,
+            hole=hole,
+            number=2,
+            lie="rough",
+            start_distance=120,
+            strokes_gained=-0.25,
+        )
+
+        with django_assert_num_queries(1):
+            result = BucketAggregator.aggregate_many(
+                Shot.objects.filter(user=user),
+                {
+                    "strokes_gained": (
+                        Count,
+                        {
+                            "count_all": ShotBucket("approach", 30),
+                            "count_rough": ShotBucket("approach", 30, None, "rough"),
+                        },
+                    ),
+                },
+            )
+
+        assert result == {"count_all": 2.0, "count_rough": 1.0}
@@ -0,0 +1,28 @@
+from importlib import import_module
+
+import pytest
+
+# The services package re-exports the function under the module's name
+baselines = import_module("birdie_buddy.round_entry.services.avg_strokes_to_holeout")
+
+
+@pytest.fixture
+def flat_baseline(tmp_path, monkeypatch):
+    """A baseline where every shot is expected to take 3 strokes to hole out."""
+    lies = ["tee", "fairway", "rough", "sand", "recovery", "green"]
+    table = baselines.BaselineTable.from_dict(
+        {lie: {d: 3.0 for d in range(1, 601)} for lie in lies}
+    )
+    path = tmp_path / "flat.bin"
+    path.write_bytes(table.to_bytes())
+
+    baseline_path = baselines.baseline_path
+    monkeypatch.setitem(baselines.BASELINES, "flat", ("Flat", None))
+    monkeypatch.setattr(
+        baselines,
+        "baseline_path",
+        lambda name: path if name == "flat" else baseline_path(name),
+    )
+    baselines.get_baseline.cache_clear()
+    yield "flat"
+    baselines.get_baseline.cache_clear()
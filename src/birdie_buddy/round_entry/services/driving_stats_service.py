@@ -4,8 +4,11 @@ Services for driving stats.
 
 from typing import NamedTuple
 
+from django.db.models import Count
 
-from birdie_buddy.round_entry.models import Hole, Shot
+from birdie_buddy.round_entry.models import Hole, Shot, ShotBucketAggregate
+from birdie_buddy.round_entry.services.stats_window import StatsWindow
+from birdie_buddy.round_entry.services.user_stats_snapshot import UserStatsSnapshot
 
 
 class DrivingStats(NamedTuple):
@@ -31,10 +34,16 @@ class RoundDrivingStats(NamedTuple):
 class DrivingStatsService:
     """
     A service to calculate driving stats for a user.
+
+    These are counts of where drives finish, so they don't depend on the
+    strokes gained baseline and the service takes none. Driving strokes
+    gained, which does, comes from get_avg_strokes_gained_categories_per_18.
     """
 
     # 14 drives are 18 per 18 holes on average
     DRIVES_PER_18 = 14
+    DRIVING_PARS = (4, 5)
+    ENDING_LIES = ("penalty", "rough", "fairway")
 
     def _get_tee_shots(self, user):
         """
@@ -51,7 +60,12 @@ class DrivingStatsService:
         When round is provided, returns raw count for that round.
         Only considers par 4 and par 5 holes where the second shot has the given lie.
         """
-        filters = {"user": user, "par__in": [4, 5], "shot__number": 2, "shot__lie": lie}
+        filters = {
+            "user": user,
+            "par__in": self.DRIVING_PARS,
+            "shot__number": 2,
+            "shot__lie": lie,
+        }
         if round is not None:
             filters["round"] = round
 
@@ -60,7 +74,7 @@ class DrivingStatsService:
         if round is not None:
             return lie_holes
 
-        total_filters = {"user": user, "par__in": [4, 5]}
+        total_filters = {"user": user, "par__in": self.DRIVING_PARS}
         total_driving_holes = Hole.objects.filter(**total_filters).count()
 
         if total_driving_holes == 0:
@@ -110,22 +124,97 @@ class DrivingStatsService:
         """
         return self.fairways(user, round=None)
 
-    def get_for_user(self, user) -> DrivingStats:
+    def get_for_user(
+        self,
+        user,
+        snapshot: UserStatsSnapshot | None = None,
+        window: StatsWindow | None = None,
+    ) -> DrivingStats:
         """
-        Returns all driving statistics for a user.
+        Returns all driving statistics for a user. With no window they are
+        read from the user's ShotBucketAggregate rows; otherwise from the
+        snapshot given, or one loaded for the window.
         """
-        return DrivingStats(
-            penalties_per_18=self.penalties(user),
-            rough_per_18=self.rough(user),
-            fairways_per_18=self.fairways(user),
-        )
+        if snapshot is None and window is None:
+            return self._get_from_aggregates(user)
+        if snapshot is None:
+            snapshot = UserStatsSnapshot.load(user, window)
+        return self._get_from_snapshot(snapshot)
 
     def get_for_round(self, round) -> RoundDrivingStats:
         """
         Returns all driving statistics for a round.
         """
-        return RoundDrivingStats(
-            penalties=self.penalties(round.user, round),
-            rough=self.rough(round.user, round),
-            fairways=self.fairways(round.user, round),
+        return self.get_for_rounds([round])[round.pk]
+
+    def get_for_rounds(self, rounds) -> dict[int, RoundDrivingStats]:
+        """
+        Returns driving statistics for each round, keyed by round id, from one
+        GROUP BY round and ending lie query.
+        """
+        rounds = list(rounds)
+        rows = (
+            Hole.objects.filter(
+                round__in=rounds,
+                par__in=self.DRIVING_PARS,
+                shot__number=2,
+                shot__lie__in=self.ENDING_LIES,
+            )
+            .values("round_id", "shot__lie")
+            .annotate(holes=Count("id", distinct=True))
+            .order_by()
+        )
+
+        counts = {round.pk: dict.fromkeys(self.ENDING_LIES, 0) for round in rounds}
+        for row in rows:
+            counts[row["round_id"]][row["shot__lie"]] = row["holes"]
+
+        return {
+            round_id: RoundDrivingStats(
+                penalties=lies["penalty"],
+                rough=lies["rough"],
+                fairways=lies["fairway"],
+            )
+            for round_id, lies in counts.items()
+        }
+
+    def _get_from_snapshot(self, snapshot: UserStatsSnapshot) -> DrivingStats:
+        driving_holes = {
+            hole_id
+            for hole_id, par in zip(snapshot.hole_ids, snapshot.pars)
+            if par in self.DRIVING_PARS
+        }
+        if not driving_holes:
+            return DrivingStats(0.0, 0.0, 0.0)
+
+        holes_by_lie: dict[str, set[int]] = {}
+        for hole_id, number, lie in zip(
+            snapshot.shot_hole_ids, snapshot.numbers, snapshot.lies
+        ):
+            if number == 2 and hole_id in driving_holes:
+                holes_by_lie.setdefault(lie, set()).add(hole_id)
+
+        scale = self.DRIVES_PER_18 / len(driving_holes)
+        return DrivingStats(
+            penalties_per_18=len(holes_by_lie.get("penalty", ())) * scale,
+            rough_per_18=len(holes_by_lie.get("rough", ())) * scale,
+            fairways_per_18=len(holes_by_lie.get("fairway", ())) * scale,
+        )
+
+    def _get_from_aggregates(self, user) -> DrivingStats:
+        aggregates = ShotBucketAggregate.objects.for_user(user, "drive")
+        total_driving_holes = Hole.objects.filter(
+            user=user, par__in=self.DRIVING_PARS
+        ).count()
+        if total_driving_holes == 0:
+            return DrivingStats(0.0, 0.0, 0.0)
+
+        def per_18(lie):
+            aggregate = aggregates.get(lie, ShotBucketAggregate())
+            return (aggregate.hole_count / total_driving_holes) * self.DRIVES_PER_18
+
+        return DrivingStats(
+            penalties_per_18=per_18("penalty"),
+            rough_per_18=per_18("rough"),
+            fairways_per_18=per_18("fairway"),
         )
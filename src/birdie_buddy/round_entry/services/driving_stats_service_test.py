@@ -319,3 +319,22 @@ class TestDrivingStatsService:
         assert stats.rough == 1
         assert stats.penalties == 0
 
+
+    def test_get_for_rounds(self, django_assert_num_queries):
+        user = UserFactory()
+        service = DrivingStatsService()
+        rounds = [RoundFactory(user=user) for _ in range(3)]
+
+        for number, (round, lie) in enumerate(
+            zip(rounds, ["fairway", "penalty"]), start=1
+        ):
+            hole = HoleFactory(user=user, round=round, par=4, number=number)
+            ShotFactory(user=user, hole=hole, number=1, lie="tee", start_distance=400)
+            ShotFactory(user=user, hole=hole, number=2, lie=lie, start_distance=150)
+
+        with django_assert_num_queries(1):
+            results = service.get_for_rounds(rounds)
+
+        assert results[rounds[0].pk] == (0, 0, 1)
+        assert results[rounds[1].pk] == (1, 0, 0)
+        assert results[rounds[2].pk] == (0, 0, 0)
@@ -0,0 +1,75 @@
+import json
+import threading
+import time
+from types import SimpleNamespace
+from typing import Callable
+
+# A two hole card, as the LLM is asked to return it
+SCORECARD = {
+    "holes": [
+        {
+            "number": 1,
+            "par": 4,
+            "shots": [
+                {"number": 1, "start_distance": 380, "lie": "tee"},
+                {"number": 2, "start_distance": 150, "lie": "fairway"},
+                {"number": 3, "start_distance": 25, "lie": "green"},
+                {"number": 4, "start_distance": 8, "lie": "green"},
+                {"number": 5, "start_distance": 2, "lie": "green"},
+            ],
+        },
+        {
+            "number": 2,
+            "par": 3,
+            "shots": [
+                {"number": 1, "start_distance": 165, "lie": "tee"},
+                {"number": 2, "start_distance": 20, "lie": "rough"},
+                {"number": 3, "start_distance": 12, "lie": "green"},
+                {"number": 4, "start_distance": 3, "lie": "green"},
+            ],
+        },
+    ]
+}
+
+
+class FakeScorecardClient:
+    """
+    Stands in for anthropic.Anthropic in ScorecardParserService.
+
+    messages.create() returns `response` (the two hole SCORECARD by default),
+    or what `response` returns when called with the request's keyword
+    arguments, without calling the API, and records its keyword arguments in `calls`.
+    Each call takes `delay` seconds, and `max_in_flight` records how many
+    overlapped, for exercising concurrent parsing. Select it with the
+    SCORECARD_PARSER_CLIENT setting or pass it directly.
+    """
+
+    def __init__(
+        self,
+        api_key=None,
+        response: dict | str | Callable[..., dict | str] | None = None,
+        delay: float = 0.0,
+    ):
+        self.response = SCORECARD if response is None else response
+        # Seconds each call takes, standing in for the API's latency
+        self.delay = delay
+        self.calls: list[dict] = []
+        # Most calls that were ever in progress at once
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self.messages = SimpleNamespace(create=self._create)
+
+    def _create(self, **kwargs):
+        with self._lock:
+            self.calls.append(kwargs)
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            time.sleep(self.delay)
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+        response = self.response(**kwargs) if callable(self.response) else self.response
+        text = response if isinstance(response, str) else json.dumps(response)
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
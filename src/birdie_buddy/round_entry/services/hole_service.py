@@ -1,10 +1,17 @@
-from birdie_buddy.round_entry.models import Hole
+from django.db import transaction
+
+from birdie_buddy.round_entry.models import Hole, RoundSummary
+from birdie_buddy.round_entry.services.shot_bucket_aggregate_service import (
+    ShotBucketAggregateService,
+)
+from birdie_buddy.round_entry.services.stats_cache import StatsCache
 
 
 class HoleService:
     """Service for hole-related business logic."""
 
     @staticmethod
+    @transaction.atomic
     def delete_hole(hole: Hole) -> None:
         """
         Delete a hole and handle associated business logic.
@@ -13,12 +20,15 @@ class HoleService:
         1. Deletes the specified hole (shots cascade automatically)
         2. Renumbers all subsequent holes in the round
         3. Decrements the round's holes_played count
+        4. Refreshes the round summary and bucket aggregates, and invalidates
+           the user's cached stats
 
         Args:
             hole: The Hole instance to delete
         """
         round_obj = hole.round
         deleted_hole_number = hole.number
+        deleted = (hole.par, list(hole.shot_set.all()))
 
         # Delete the hole (shots cascade automatically via ForeignKey)
         hole.delete()
@@ -41,3 +51,7 @@ class HoleService:
         # Update holes_played count
         round_obj.holes_played -= 1
         round_obj.save()
+
+        RoundSummary.objects.refresh(round_obj)
+        ShotBucketAggregateService.apply_hole(round_obj.user_id, before=deleted)
+        StatsCache.invalidate_on_commit(round_obj.user_id)
@@ -1,7 +1,7 @@
 import pytest
 from birdie_buddy.round_entry.factories.hole_factory import HoleFactory
 from birdie_buddy.round_entry.factories.shot_factory import ShotFactory
-from birdie_buddy.round_entry.models import Hole
+from birdie_buddy.round_entry.models import Hole, RoundSummary
 from birdie_buddy.round_entry.services.hole_service import HoleService
 
 
@@ -90,6 +90,7 @@ class TestHoleService:
 
         round.holes_played = 3
         round.save()
+        RoundSummary.objects.refresh(round)
 
         # Verify round is complete
         assert round.complete is True
@@ -101,3 +102,18 @@ class TestHoleService:
         round.refresh_from_db()
         assert round.holes_played == 2
         assert round.complete is True  # Should remain complete
+
+    def test_delete_hole_refreshes_round_summary(self, round, user):
+        """Test that the round summary drops the deleted hole's totals."""
+        round.holes_played = 2
+        round.save()
+        hole1 = HoleFactory.par_4_par(user=user, round=round, number=1)
+        hole2 = HoleFactory.par_3_par(user=user, round=round, number=2)
+        RoundSummary.objects.refresh(round)
+
+        HoleService.delete_hole(hole2)
+
+        summary = RoundSummary.objects.get(round=round)
+        assert summary.score == hole1.score
+        assert summary.shot_count == 4
+        assert summary.complete is True
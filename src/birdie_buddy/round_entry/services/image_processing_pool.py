@@ -0,0 +1,235 @@
+import io
+import logging
+import multiprocessing
+import signal
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+import django
+from django.conf import settings
+from django.core.files.uploadedfile import InMemoryUploadedFile, SimpleUploadedFile
+
+from birdie_buddy.round_entry.services.image_processing_service import (
+    ImageProcessingService,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ImageProcessingBusy(Exception):
+    """Every worker is busy and the queue stayed full for QUEUE_TIMEOUT_SECONDS."""
+
+
+class _ImageTimedOut(Exception):
+    pass
+
+
+def _timed_out(signum, frame):
+    raise _ImageTimedOut()
+
+
+def _init_worker():
+    # Workers are spawned, not forked from the threaded web process
+    django.setup()
+    signal.signal(signal.SIGALRM, _timed_out)
+
+
+def _process(name: str, content: bytes, timeout: float) -> Optional[tuple[str, bytes]]:
+    """
+    Runs in a pool worker: the processed JPEG's name and bytes, or None.
+
+    A timer interrupts an image still running after timeout seconds, so the
+    worker moves on to the next image instead of having to be killed.
+    """
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        processed = ImageProcessingService.process_image(
+            SimpleUploadedFile(name, content)
+        )
+    except _ImageTimedOut:
+        processed = None
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+    if processed is None:
+        return None
+    return processed.name, processed.read()
+
+
+class ImageProcessingPool:
+    """
+    Runs ImageProcessingService in worker processes.
+
+    Decoding, resizing and JPEG encoding hold the GIL, so inline they stall
+    every other request thread in the gunicorn worker. Here the request
+    thread only waits on a future. At most QUEUE_PER_WORKER images per
+    worker are queued or running; past that callers wait up to
+    QUEUE_TIMEOUT_SECONDS for a slot and then get ImageProcessingBusy.
+
+    An image that takes longer than TIMEOUT_SECONDS is interrupted inside
+    its worker and fails on its own; the other images in the pool carry on.
+    A worker that dies breaks the whole pool, so each image that was in
+    flight is retried once in a process of its own.
+    """
+
+    TIMEOUT_SECONDS = 30
+    # Extra time to wait for a worker to report its own timeout
+    RESULT_GRACE_SECONDS = 5
+    QUEUE_TIMEOUT_SECONDS = 10
+    QUEUE_PER_WORKER = 2
+    # Of those, how many one process_images() call may hold
+    BATCH_SLOTS_PER_WORKER = 1
+    MP_CONTEXT = "spawn"
+    # Replace workers now and then, so Pillow's heap growth is returned
+    MAX_TASKS_PER_WORKER = 100
+
+    _lock = threading.Lock()
+    _executor: Optional[ProcessPoolExecutor] = None
+    _slots: Optional[threading.BoundedSemaphore] = None
+
+    @classmethod
+    def process_image(cls, uploaded_file) -> Optional[InMemoryUploadedFile]:
+        """
+        ImageProcessingService.process_image in a worker process.
+
+        Returns None when processing fails or times out, like the service,
+        and raises ImageProcessingBusy when the queue is full.
+        """
+        return cls.process_images([uploaded_file])[0]
+
+    @classmethod
+    def process_images(cls, uploaded_files) -> list[Optional[InMemoryUploadedFile]]:
+        """
+        Process several images across the workers, in the order given.
+
+        A call holds at most BATCH_SLOTS_PER_WORKER slots per worker at once,
+        submitting each further image once its oldest one finishes, so a big
+        batch leaves room for uploads arriving meanwhile and waits on its own
+        earlier images rather than failing.
+        """
+        limit = settings.IMAGE_PROCESSING_WORKERS * cls.BATCH_SLOTS_PER_WORKER
+        results = []
+        in_flight = deque()
+        try:
+            for uploaded_file in uploaded_files:
+                if len(in_flight) >= limit:
+                    results.append(cls._result(*in_flight.popleft()))
+                name, content = uploaded_file.name, uploaded_file.read()
+                executor, future = cls._submit(name, content)
+                in_flight.append((executor, future, name, content))
+        except ImageProcessingBusy:
+            for _, future, _, _ in in_flight:
+                future.cancel()
+            raise
+        results.extend(cls._result(*submitted) for submitted in in_flight)
+        return results
+
+    @classmethod
+    def _submit(cls, name: str, content: bytes):
+        """Submit an image once a queue slot is free."""
+        executor, slots = cls._get()
+        if not slots.acquire(timeout=cls.QUEUE_TIMEOUT_SECONDS):
+            raise ImageProcessingBusy()
+        try:
+            future = executor.submit(_process, name, content, cls.TIMEOUT_SECONDS)
+        except BrokenProcessPool:
+            slots.release()
+            raise
+        # Slots free up when the worker finishes, not when the caller stops
+        # waiting, so an image given up on holds one until it ends
+        future.add_done_callback(lambda _: slots.release())
+        return executor, future
+
+    @classmethod
+    def _result(
+        cls,
+        executor: ProcessPoolExecutor,
+        future,
+        name: str,
+        content: bytes,
+    ) -> Optional[InMemoryUploadedFile]:
+        try:
+            result = future.result(
+                timeout=cls.TIMEOUT_SECONDS + cls.RESULT_GRACE_SECONDS
+            )
+        except FutureTimeoutError:
+            # Stuck where the worker's timer can't interrupt it, e.g. inside
+            # one long C call. Give up on this image only.
+            logger.error(f"Processing {name} took over {cls.TIMEOUT_SECONDS}s")
+            return None
+        except BrokenProcessPool:
+            # A worker died, e.g. killed for running out of memory. That
+            # fails every image in flight, not just the one that killed it.
+            logger.exception(f"Image processing worker died on {name}")
+            cls._reset(executor)
+            result = cls._process_alone(name, content)
+
+        if result is None:
+            return None
+
+        name, data = result
+        return InMemoryUploadedFile(
+            file=io.BytesIO(data),
+            field_name="scorecard_image",
+            name=name,
+            content_type="image/jpeg",
+            size=len(data),
+            charset=None,
+        )
+
+    @classmethod
+    def _process_alone(cls, name: str, content: bytes) -> Optional[tuple[str, bytes]]:
+        """
+        Retry an image from a broken pool in a one-off process. Any image in
+        flight may be the one that killed the pool; alone, it can only fail
+        itself.
+        """
+        executor = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context(cls.MP_CONTEXT),
+            initializer=_init_worker,
+        )
+        try:
+            future = executor.submit(_process, name, content, cls.TIMEOUT_SECONDS)
+            return future.result(timeout=cls.TIMEOUT_SECONDS + cls.RESULT_GRACE_SECONDS)
+        except (FutureTimeoutError, BrokenProcessPool):
+            logger.exception(f"Retrying {name} on its own failed")
+            return None
+        finally:
+            # The process is this image's alone, so it can simply be ended
+            for process in list((executor._processes or {}).values()):
+                process.terminate()
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def _get(cls) -> tuple[ProcessPoolExecutor, threading.BoundedSemaphore]:
+        with cls._lock:
+            if cls._executor is None:
+                workers = settings.IMAGE_PROCESSING_WORKERS
+                cls._executor = ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context(cls.MP_CONTEXT),
+                    initializer=_init_worker,
+                    max_tasks_per_child=cls.MAX_TASKS_PER_WORKER,
+                )
+                cls._slots = threading.BoundedSemaphore(workers * cls.QUEUE_PER_WORKER)
+            return cls._executor, cls._slots
+
+    @classmethod
+    def _reset(cls, executor: ProcessPoolExecutor):
+        """Drop a broken executor; the next call starts a new pool."""
+        with cls._lock:
+            if cls._executor is executor:
+                cls._executor = None
+                cls._slots = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    @classmethod
+    def shutdown(cls):
+        with cls._lock:
+            executor, cls._executor, cls._slots = cls._executor, None, None
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
@@ -0,0 +1,145 @@
+import io
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
+
+from birdie_buddy.round_entry.services.image_processing_pool import (
+    ImageProcessingBusy,
+    ImageProcessingPool,
+)
+from birdie_buddy.round_entry.services.image_processing_service import (
+    ImageProcessingService,
+)
+
+
+def jpeg_file(size=(3000, 2000), name="scorecard.jpg"):
+    buffer = io.BytesIO()
+    Image.new("RGB", size, "white").save(buffer, format="JPEG")
+    return SimpleUploadedFile(name, buffer.getvalue())
+
+
+def process_both(pool, first, second):
+    """Process two images at once, as two requests would."""
+    with ThreadPoolExecutor(max_workers=2) as threads:
+        futures = [threads.submit(pool.process_image, file) for file in (first, second)]
+        return [future.result() for future in futures]
+
+
+@pytest.fixture
+def forked_pool(pool, settings, monkeypatch):
+    """
+    Two workers forked from the test process, so they inherit patches to
+    ImageProcessingService, with a short timeout.
+    """
+    settings.IMAGE_PROCESSING_WORKERS = 2
+    monkeypatch.setattr(pool, "MP_CONTEXT", "fork")
+    # Not supported with fork
+    monkeypatch.setattr(pool, "MAX_TASKS_PER_WORKER", None)
+    monkeypatch.setattr(pool, "TIMEOUT_SECONDS", 2)
+    return pool
+
+
+def patch_process_image(monkeypatch, name, action):
+    """Run action before processing the image called name."""
+    process_image = ImageProcessingService.process_image
+
+    def patched(uploaded_file):
+        if uploaded_file.name == name:
+            action()
+        return process_image(uploaded_file)
+
+    monkeypatch.setattr(ImageProcessingService, "process_image", staticmethod(patched))
+
+
+@pytest.fixture
+def pool(settings):
+    settings.IMAGE_PROCESSING_WORKERS = 1
+    ImageProcessingPool.shutdown()
+    yield ImageProcessingPool
+    ImageProcessingPool.shutdown()
+
+
+class TestImageProcessingPool:
+    def test_processes_image_in_a_worker(self, pool):
+        processed = pool.process_image(jpeg_file(name="card.png"))
+
+        assert processed.name == "card.jpg"
+        assert processed.content_type == "image/jpeg"
+        assert processed.size == len(processed.read()) > 0
+        processed.seek(0)
+        assert max(Image.open(processed).size) <= 1568
+
+    def test_invalid_image_returns_none(self, pool):
+        uploaded_file = SimpleUploadedFile("scorecard.jpg", b"not an image")
+
+        assert pool.process_image(uploaded_file) is None
+
+    def test_raises_busy_when_queue_is_full(self, pool, monkeypatch):
+        monkeypatch.setattr(pool, "QUEUE_TIMEOUT_SECONDS", 0.01)
+        _, slots = pool._get()
+        for _ in range(pool.QUEUE_PER_WORKER):
+            slots.acquire()
+
+        with pytest.raises(ImageProcessingBusy):
+            pool.process_image(jpeg_file())
+
+    def test_batch_leaves_slots_for_other_uploads(self, pool, monkeypatch):
+        _, slots = pool._get()
+        submit = pool._submit
+        slot_free = []
+
+        def submit_and_check(name, content):
+            submitted = submit(name, content)
+            # Could a single upload arriving now get a slot?
+            free = slots.acquire(blocking=False)
+            if free:
+                slots.release()
+            slot_free.append(free)
+            return submitted
+
+        monkeypatch.setattr(pool, "_submit", submit_and_check)
+
+        processed = pool.process_images([jpeg_file() for _ in range(4)])
+
+        assert all(processed)
+        assert slot_free == [True] * 4
+
+    def test_timeout_returns_none_and_keeps_workers(self, pool, monkeypatch):
+        executor, _ = pool._get()
+        monkeypatch.setattr(pool, "TIMEOUT_SECONDS", 0.001)
+
+        assert pool.process_image(jpeg_file()) is None
+
+        monkeypatch.undo()
+        assert pool._get()[0] is executor
+        assert pool.process_image(jpeg_file()) is not None
+
+    # The test process has threads, which fork warns about
+    @pytest.mark.filterwarnings("ignore:This process .* is multi-threaded")
+    def test_timeout_only_fails_that_image(self, forked_pool, monkeypatch):
+        patch_process_image(monkeypatch, "stuck.jpg", lambda: time.sleep(60))
+        executor, _ = forked_pool._get()
+
+        stuck, other = process_both(
+            forked_pool, jpeg_file(name="stuck.jpg"), jpeg_file(name="other.jpg")
+        )
+
+        assert stuck is None
+        assert other is not None
+        assert forked_pool._get()[0] is executor
+
+    # The test process has threads, which fork warns about
+    @pytest.mark.filterwarnings("ignore:This process .* is multi-threaded")
+    def test_dead_worker_retries_other_images(self, forked_pool, monkeypatch):
+        patch_process_image(monkeypatch, "crash.jpg", lambda: os._exit(1))
+
+        crash, other = process_both(
+            forked_pool, jpeg_file(name="crash.jpg"), jpeg_file(name="other.jpg")
+        )
+
+        assert crash is None
+        assert other is not None
@@ -1,14 +1,21 @@
 import io
 import logging
+import math
+import os
 from typing import Optional
 
+import pillow_heif
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from PIL import Image
 from pillow_heif import register_heif_opener
 
 logger = logging.getLogger(__name__)
 
-# Register HEIF/HEIC support with Pillow
+# Register HEIF/HEIC support with Pillow, without decoding the depth maps,
+# auxiliary images and thumbnails phones embed alongside the photo
+pillow_heif.options.DEPTH_IMAGES = False
+pillow_heif.options.AUX_IMAGES = False
+pillow_heif.options.THUMBNAILS = False
 register_heif_opener()
 
 
@@ -20,6 +27,10 @@ class ImageProcessingService:
     MAX_DIMENSION = 1568  # Anthropic's recommended max dimension
     INITIAL_QUALITY = 80  # Balanced quality
     MIN_QUALITY = 60  # Don't go below this
+    # Largest image decoded at full size (formats without reduced-scale
+    # decoding, e.g. HEIC): about 190MB as RGB, enough for 48MP phone photos
+    MAX_PIXELS = 64_000_000
+    MAX_RESIZE_ATTEMPTS = 3
 
     @staticmethod
     def process_image(uploaded_file) -> Optional[InMemoryUploadedFile]:
@@ -27,9 +38,11 @@ class ImageProcessingService:
         Process an uploaded image to ensure it's compatible with Claude API.
 
         Steps:
-        1. Convert HEIC to JPEG if needed
-        2. Resize if dimensions exceed MAX_DIMENSION
-        3. Compress to stay under MAX_FILE_SIZE_BYTES
+        1. Decode at reduced scale where the codec supports it (JPEG draft
+           mode) and shrink to MAX_DIMENSION before any mode conversion
+        2. Convert HEIC, PNG and other modes to RGB
+        3. Encode once at INITIAL_QUALITY, binary searching for the highest
+           quality under MAX_FILE_SIZE_BYTES only when that is too large
 
         Args:
             uploaded_file: Django UploadedFile instance
@@ -38,90 +51,33 @@ class ImageProcessingService:
             Processed InMemoryUploadedFile ready for Claude API, or None if processing fails
         """
         try:
-            # Open the image with Pillow (HEIC support via pillow-heif)
+            # Open the image with Pillow (HEIC support via pillow-heif); this
+            # only reads the header
             image = Image.open(uploaded_file)
 
-            # Convert to RGB (required for JPEG, handles HEIC and PNG with transparency)
-            if image.mode in ("RGBA", "LA", "P"):
-                # Create white background for images with transparency
-                background = Image.new("RGB", image.size, (255, 255, 255))
-                if image.mode == "P":
-                    image = image.convert("RGBA")
-                background.paste(
-                    image,
-                    mask=image.split()[-1] if image.mode in ("RGBA", "LA") else None,
-                )
-                image = background
-            elif image.mode != "RGB":
-                image = image.convert("RGB")
-
-            # Resize if needed (maintain aspect ratio)
-            if max(image.size) > ImageProcessingService.MAX_DIMENSION:
-                image.thumbnail(
-                    (
-                        ImageProcessingService.MAX_DIMENSION,
-                        ImageProcessingService.MAX_DIMENSION,
-                    ),
-                    Image.Resampling.LANCZOS,
-                )
-                logger.info(f"Resized image to {image.size}")
-
-            # Compress to stay under 5MB
-            quality = ImageProcessingService.INITIAL_QUALITY
-            output = io.BytesIO()
+            if image.width * image.height > ImageProcessingService.MAX_PIXELS:
+                logger.error(f"Image too large to process: {image.size}")
+                return None
 
-            while quality >= ImageProcessingService.MIN_QUALITY:
-                output.seek(0)
-                output.truncate()
+            image = ImageProcessingService._resize(image)
+            image = ImageProcessingService._to_rgb(image)
 
-                image.save(output, format="JPEG", quality=quality, optimize=True)
-                file_size = output.tell()
-
-                if file_size <= ImageProcessingService.MAX_FILE_SIZE_BYTES:
-                    logger.info(
-                        f"Compressed image to {file_size / (1024 * 1024):.2f}MB "
-                        f"at quality {quality}"
-                    )
-                    break
-
-                quality -= 5
-            else:
-                # If we couldn't get under 5MB even at MIN_QUALITY, try more aggressive resize
-                logger.warning(
-                    "Could not compress to 5MB, attempting more aggressive resize"
+            output = ImageProcessingService._encode(image)
+            if output is None:
+                logger.error(
+                    f"Failed to compress image to under {ImageProcessingService.MAX_FILE_SIZE_MB}MB"
                 )
-                scale_factor = 0.8
-                new_size = (
-                    int(image.size[0] * scale_factor),
-                    int(image.size[1] * scale_factor),
-                )
-                image = image.resize(new_size, Image.Resampling.LANCZOS)
-
-                output.seek(0)
-                output.truncate()
-                image.save(
-                    output,
-                    format="JPEG",
-                    quality=ImageProcessingService.MIN_QUALITY,
-                    optimize=True,
-                )
-                file_size = output.tell()
-
-                if file_size > ImageProcessingService.MAX_FILE_SIZE_BYTES:
-                    logger.error(
-                        f"Failed to compress image to under {ImageProcessingService.MAX_FILE_SIZE_MB}MB. "
-                        f"Final size: {file_size / (1024 * 1024):.2f}MB"
-                    )
-                    return None
+                return None
 
             # Create new InMemoryUploadedFile
+            size = output.getbuffer().nbytes
             output.seek(0)
             processed_file = InMemoryUploadedFile(
                 file=output,
                 field_name="scorecard_image",
                 name=ImageProcessingService._get_output_filename(uploaded_file.name),
                 content_type="image/jpeg",
-                size=output.tell(),
+                size=size,
                 charset=None,
             )
 
@@ -131,10 +87,101 @@ class ImageProcessingService:
             logger.error(f"Error processing image: {str(e)}")
             return None
 
+    @staticmethod
+    def _resize(image: Image.Image) -> Image.Image:
+        """
+        Shrink to fit MAX_DIMENSION, maintaining aspect ratio.
+
+        JPEGs are decoded straight at the smallest 1/2, 1/4 or 1/8 scale that
+        still covers the target, and large reductions go through a fast
+        integer box reduce before the LANCZOS pass.
+        """
+        limit = ImageProcessingService.MAX_DIMENSION
+        if max(image.size) <= limit:
+            return image
+
+        scale = limit / max(image.size)
+        target = (
+            max(1, round(image.width * scale)),
+            max(1, round(image.height * scale)),
+        )
+        if image.format == "JPEG":
+            image.draft("RGB", target)
+
+        if image.mode == "P":
+            # LANCZOS would fall back to nearest-neighbour on a palette
+            image = image.convert("RGBA")
+
+        image.thumbnail(target, Image.Resampling.LANCZOS, reducing_gap=2.0)
+        logger.info(f"Resized image to {image.size}")
+        return image
+
+    @staticmethod
+    def _to_rgb(image: Image.Image) -> Image.Image:
+        """Convert to RGB (required for JPEG, handles HEIC and PNG with transparency)."""
+        if image.mode in ("RGBA", "LA", "P"):
+            # Create white background for images with transparency
+            if image.mode == "P":
+                image = image.convert("RGBA")
+            background = Image.new("RGB", image.size, (255, 255, 255))
+            background.paste(image, mask=image.split()[-1])
+            return background
+        if image.mode != "RGB":
+            return image.convert("RGB")
+        return image
+
+    @staticmethod
+    def _encode(image: Image.Image) -> Optional[io.BytesIO]:
+        """The best JPEG under MAX_FILE_SIZE_BYTES, or None."""
+        # Nearly every photo fits at the initial quality: a single encode
+        output = ImageProcessingService._save(
+            image, ImageProcessingService.INITIAL_QUALITY, optimize=True
+        )
+        if output.tell() <= ImageProcessingService.MAX_FILE_SIZE_BYTES:
+            return output
+
+        # Binary search for the highest quality that fits
+        best = None
+        low = ImageProcessingService.MIN_QUALITY
+        high = ImageProcessingService.INITIAL_QUALITY - 1
+        while low <= high:
+            quality = (low + high) // 2
+            candidate = ImageProcessingService._save(image, quality)
+            if candidate.tell() <= ImageProcessingService.MAX_FILE_SIZE_BYTES:
+                best, low = candidate, quality + 1
+            else:
+                high = quality - 1
+        if best is not None:
+            logger.info(f"Compressed image at quality {low - 1}")
+            return best
+
+        # Too big even at MIN_QUALITY: shrink by the area needed to fit
+        size = ImageProcessingService._save(
+            image, ImageProcessingService.MIN_QUALITY
+        ).tell()
+        for _ in range(ImageProcessingService.MAX_RESIZE_ATTEMPTS):
+            logger.warning("Could not compress to 5MB, resizing")
+            scale = math.sqrt(ImageProcessingService.MAX_FILE_SIZE_BYTES / size) * 0.95
+            image = image.resize(
+                (max(1, int(image.width * scale)), max(1, int(image.height * scale))),
+                Image.Resampling.LANCZOS,
+            )
+            output = ImageProcessingService._save(
+                image, ImageProcessingService.MIN_QUALITY
+            )
+            size = output.tell()
+            if size <= ImageProcessingService.MAX_FILE_SIZE_BYTES:
+                return output
+        return None
+
+    @staticmethod
+    def _save(image: Image.Image, quality: int, optimize: bool = False) -> io.BytesIO:
+        output = io.BytesIO()
+        image.save(output, format="JPEG", quality=quality, optimize=optimize)
+        return output
+
     @staticmethod
     def _get_output_filename(original_filename: str) -> str:
         """Convert original filename to .jpg extension."""
-        import os
-
         name_without_ext = os.path.splitext(original_filename)[0]
         return f"{name_without_ext}.jpg"
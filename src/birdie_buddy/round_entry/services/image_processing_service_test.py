@@ -0,0 +1,127 @@
+import io
+import random
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
+from PIL.JpegImagePlugin import JpegImageFile
+
+from birdie_buddy.round_entry.services.image_processing_service import (
+    ImageProcessingService,
+)
+
+
+def image_file(size, mode="RGB", format="JPEG", name="scorecard.jpg", color=None):
+    image = Image.new(mode, size, color if color is not None else "white")
+    buffer = io.BytesIO()
+    image.save(buffer, format=format)
+    return SimpleUploadedFile(name, buffer.getvalue())
+
+
+def noisy_image(size):
+    """Random pixels barely compress, to exercise the size-targeted encode."""
+    data = random.Random(0).randbytes(size[0] * size[1] * 3)
+    return Image.frombytes("RGB", size, data)
+
+
+class TestProcessImage:
+    def test_large_jpeg_is_shrunk_to_max_dimension(self):
+        processed = ImageProcessingService.process_image(image_file((4032, 3024)))
+
+        image = Image.open(processed)
+        assert image.format == "JPEG"
+        assert max(image.size) == ImageProcessingService.MAX_DIMENSION
+        assert image.size == (1568, 1176)
+
+    def test_large_jpeg_is_decoded_at_reduced_scale(self):
+        with patch.object(
+            JpegImageFile, "draft", autospec=True, side_effect=JpegImageFile.draft
+        ) as draft:
+            ImageProcessingService.process_image(image_file((4032, 3024)))
+
+        draft.assert_called()
+        assert draft.call_args_list[0].args[1:] == ("RGB", (1568, 1176))
+
+    def test_small_image_keeps_its_size(self):
+        processed = ImageProcessingService.process_image(image_file((800, 600)))
+
+        assert Image.open(processed).size == (800, 600)
+
+    def test_reports_output_size(self):
+        processed = ImageProcessingService.process_image(image_file((800, 600)))
+
+        assert processed.size == len(processed.read()) > 0
+        assert processed.name == "scorecard.jpg"
+        assert processed.content_type == "image/jpeg"
+
+    def test_png_with_transparency_is_flattened_onto_white(self):
+        processed = ImageProcessingService.process_image(
+            image_file(
+                (2000, 1000),
+                mode="RGBA",
+                format="PNG",
+                name="card.png",
+                color=(0, 0, 0, 0),
+            )
+        )
+
+        image = Image.open(processed)
+        assert image.mode == "RGB"
+        assert image.size == (1568, 784)
+        assert image.getpixel((10, 10)) == (255, 255, 255)
+        assert processed.name == "card.jpg"
+
+    def test_palette_image_is_converted(self):
+        processed = ImageProcessingService.process_image(
+            image_file((2000, 1000), mode="P", format="GIF", name="card.gif", color=3)
+        )
+
+        assert Image.open(processed).mode == "RGB"
+
+    def test_rejects_images_over_max_pixels(self):
+        with patch.object(ImageProcessingService, "MAX_PIXELS", 100 * 100):
+            assert ImageProcessingService.process_image(image_file((101, 100))) is None
+
+    def test_invalid_file_returns_none(self):
+        uploaded_file = SimpleUploadedFile("scorecard.jpg", b"not an image")
+
+        assert ImageProcessingService.process_image(uploaded_file) is None
+
+
+class TestEncode:
+    def test_single_encode_when_it_fits(self):
+        with patch.object(
+            ImageProcessingService, "_save", wraps=ImageProcessingService._save
+        ) as save:
+            output = ImageProcessingService._encode(Image.new("RGB", (800, 600)))
+
+        assert save.call_count == 1
+        assert output.tell() <= ImageProcessingService.MAX_FILE_SIZE_BYTES
+
+    def test_searches_for_highest_quality_that_fits(self):
+        image = noisy_image((400, 400))
+        sizes = {
+            quality: ImageProcessingService._save(image, quality).tell()
+            for quality in (60, 70, 79)
+        }
+        limit = (sizes[60] + sizes[79]) // 2
+
+        with patch.object(ImageProcessingService, "MAX_FILE_SIZE_BYTES", limit):
+            output = ImageProcessingService._encode(image)
+
+        assert sizes[60] < output.tell() <= limit
+        assert Image.open(output).size == (400, 400)
+
+    def test_resizes_when_min_quality_is_too_large(self):
+        image = noisy_image((400, 400))
+        limit = ImageProcessingService._save(image, 60).tell() // 2
+
+        with patch.object(ImageProcessingService, "MAX_FILE_SIZE_BYTES", limit):
+            output = ImageProcessingService._encode(image)
+
+        assert output.tell() <= limit
+        assert max(Image.open(output).size) < 400
+
+    def test_gives_up_after_max_resize_attempts(self):
+        with patch.object(ImageProcessingService, "MAX_FILE_SIZE_BYTES", 10):
+            assert ImageProcessingService._encode(noisy_image((100, 100))) is None
@@ -1,7 +1,11 @@
 from dataclasses import dataclass
-from django.db.models import Avg, Sum
+from math import isnan
+
+from django.db.models import Avg, Count, Sum
 
 from birdie_buddy.round_entry.models import Hole, Round
+from birdie_buddy.round_entry.services.stats_window import StatsWindow
+from birdie_buddy.round_entry.services.user_stats_snapshot import UserStatsSnapshot
 
 
 @dataclass
@@ -21,26 +25,73 @@ class RoundMentalScorecardStats:
 
 
 class MentalScorecardService:
-    def get_for_user(self, user) -> MentalScorecardStats:
+    def get_for_user(
+        self,
+        user,
+        snapshot: UserStatsSnapshot | None = None,
+        window: StatsWindow | None = None,
+    ) -> MentalScorecardStats:
+        if snapshot is None and window is not None:
+            snapshot = UserStatsSnapshot.load(user, window)
+        if snapshot is not None:
+            return self._get_from_snapshot(snapshot)
+
         holes_with_mental = Hole.objects.filter(
             user=user, mental_scorecard__isnull=False, score__isnull=False
         )
 
         if not holes_with_mental.exists():
-            return MentalScorecardStats(
-                avg_mental_scorecard_per_18=0.0,
-                avg_actual_score_per_18=0.0,
-                mental_vs_actual_pct=0.0,
-                rounds_with_mental_data=0,
-            )
+            return self._empty_stats()
 
         stats = holes_with_mental.aggregate(
             avg_mental=Avg("mental_scorecard"), avg_score=Avg("score")
         )
 
-        avg_mental_per_hole = stats["avg_mental"] or 0.0
-        avg_score_per_hole = stats["avg_score"] or 0.0
+        rounds_with_mental = (
+            Round.objects.filter(user=user, hole__mental_scorecard__isnull=False)
+            .distinct()
+            .count()
+        )
+
+        return self._build_stats(
+            stats["avg_mental"] or 0.0, stats["avg_score"] or 0.0, rounds_with_mental
+        )
+
+    def _get_from_snapshot(self, snapshot: UserStatsSnapshot) -> MentalScorecardStats:
+        mental = []
+        scores = []
+        rounds_with_mental = set()
+        for round_id, mental_scorecard, score in zip(
+            snapshot.hole_round_ids, snapshot.mental_scorecards, snapshot.scores
+        ):
+            if isnan(mental_scorecard):
+                continue
+            rounds_with_mental.add(round_id)
+            if not isnan(score):
+                mental.append(mental_scorecard)
+                scores.append(score)
+
+        if not mental:
+            return self._empty_stats()
+
+        return self._build_stats(
+            sum(mental) / len(mental), sum(scores) / len(scores), len(rounds_with_mental)
+        )
 
+    def _empty_stats(self) -> MentalScorecardStats:
+        return MentalScorecardStats(
+            avg_mental_scorecard_per_18=0.0,
+            avg_actual_score_per_18=0.0,
+            mental_vs_actual_pct=0.0,
+            rounds_with_mental_data=0,
+        )
+
+    def _build_stats(
+        self,
+        avg_mental_per_hole: float,
+        avg_score_per_hole: float,
+        rounds_with_mental: int,
+    ) -> MentalScorecardStats:
         avg_mental_per_18 = avg_mental_per_hole * 18
         avg_score_per_18 = avg_score_per_hole * 18
 
@@ -49,12 +100,6 @@ class MentalScorecardService:
         else:
             mental_vs_actual_pct = 0.0
 
-        rounds_with_mental = (
-            Round.objects.filter(user=user, hole__mental_scorecard__isnull=False)
-            .distinct()
-            .count()
-        )
-
         return MentalScorecardStats(
             avg_mental_scorecard_per_18=avg_mental_per_18,
             avg_actual_score_per_18=avg_score_per_18,
@@ -63,33 +108,49 @@ class MentalScorecardService:
         )
 
     def get_for_round(self, round) -> RoundMentalScorecardStats:
-        holes_with_mental = Hole.objects.filter(
-            round=round, mental_scorecard__isnull=False, score__isnull=False
-        )
-
-        if not holes_with_mental.exists():
-            return RoundMentalScorecardStats(
-                total_mental_scorecard=0.0,
-                total_actual_score=0.0,
-                mental_vs_actual_pct=0.0,
-                holes_with_mental_data=0,
+        return self.get_for_rounds([round])[round.pk]
+
+    def get_for_rounds(self, rounds) -> dict[int, RoundMentalScorecardStats]:
+        """Totals for each round, keyed by round id, from one GROUP BY round query."""
+        rounds = list(rounds)
+        rows = (
+            Hole.objects.filter(
+                round__in=rounds, mental_scorecard__isnull=False, score__isnull=False
             )
-
-        totals = holes_with_mental.aggregate(
-            total_mental=Sum("mental_scorecard"), total_score=Sum("score")
-        )
-
-        total_mental = totals["total_mental"] or 0.0
-        total_score = totals["total_score"] or 0.0
-
-        if total_score > 0:
-            mental_vs_actual_pct = (total_mental / total_score) * 100
-        else:
-            mental_vs_actual_pct = 0.0
-
-        return RoundMentalScorecardStats(
-            total_mental_scorecard=float(total_mental),
-            total_actual_score=float(total_score),
-            mental_vs_actual_pct=mental_vs_actual_pct,
-            holes_with_mental_data=holes_with_mental.count(),
+            .values("round_id")
+            .annotate(
+                total_mental=Sum("mental_scorecard"),
+                total_score=Sum("score"),
+                holes=Count("id"),
+            )
+            .order_by()
         )
+        totals = {row["round_id"]: row for row in rows}
+
+        results = {}
+        for round in rounds:
+            row = totals.get(round.pk)
+            if row is None:
+                results[round.pk] = RoundMentalScorecardStats(
+                    total_mental_scorecard=0.0,
+                    total_actual_score=0.0,
+                    mental_vs_actual_pct=0.0,
+                    holes_with_mental_data=0,
+                )
+                continue
+
+            total_mental = row["total_mental"] or 0.0
+            total_score = row["total_score"] or 0.0
+
+            if total_score > 0:
+                mental_vs_actual_pct = (total_mental / total_score) * 100
+            else:
+                mental_vs_actual_pct = 0.0
+
+            results[round.pk] = RoundMentalScorecardStats(
+                total_mental_scorecard=float(total_mental),
+                total_actual_score=float(total_score),
+                mental_vs_actual_pct=mental_vs_actual_pct,
+                holes_with_mental_data=row["holes"],
+            )
+        return results
@@ -89,3 +89,20 @@ class TestMentalScorecardService:
         assert stats.total_actual_score == 9.0
         assert stats.mental_vs_actual_pct == pytest.approx((7 / 9) * 100)
         assert stats.holes_with_mental_data == 2
+
+    def test_get_for_rounds(self, django_assert_num_queries):
+        user = UserFactory()
+        service = MentalScorecardService()
+        round1 = RoundFactory(user=user)
+        round2 = RoundFactory(user=user)
+
+        HoleFactory(user=user, round=round1, par=4, number=1, score=5, mental_scorecard=4)
+        HoleFactory(user=user, round=round1, par=4, number=2, score=5, mental_scorecard=None)
+
+        with django_assert_num_queries(1):
+            results = service.get_for_rounds([round1, round2])
+
+        assert results[round1.pk].total_mental_scorecard == 4.0
+        assert results[round1.pk].total_actual_score == 5.0
+        assert results[round1.pk].holes_with_mental_data == 1
+        assert results[round2.pk].holes_with_mental_data == 0
@@ -1,10 +1,16 @@
-from django.db.models import F, Window
-from django.db.models.functions import Lead
-
 from birdie_buddy.round_entry.models import Shot
+from birdie_buddy.round_entry.services.bucket_aggregator import (
+    BucketAggregator,
+    ShotBucket,
+)
 
 
 class ProximityCalculator:
+    """
+    Average leave distance (feet to the hole after the shot, 0 when holed)
+    for shots in a distance bucket, read from the stored Shot.leave_feet.
+    """
+
     def calculate_avg_proximity(
         self,
         user,
@@ -14,30 +20,25 @@ class ProximityCalculator:
         lie: str | None = None,
         round=None,
     ) -> float:
-        queryset = Shot.objects.filter(user=user)
+        return self.calculate_avg_proximities(
+            user, {"avg": (shot_type, min_distance, max_distance, lie)}, round=round
+        )["avg"]
+
+    def calculate_avg_proximities(
+        self, user, buckets: dict[str, tuple], round=None
+    ) -> dict[str, float]:
+        """
+        Average proximity for several buckets with a single aggregate query.
+
+        Buckets map a name to (shot_type, min_distance, max_distance, lie)
+        and may overlap, e.g. "all lies" and "rough only".
+        """
+        queryset = Shot.objects.filter(user=user, leave_feet__isnull=False)
         if round is not None:
             queryset = queryset.filter(hole__round=round)
 
-        shots_with_next = queryset.annotate(
-            next_distance=Window(
-                expression=Lead("feet"),
-                partition_by=[F("hole_id")],
-                order_by=F("id").asc(),
-            )
+        return BucketAggregator.averages(
+            queryset,
+            {name: ShotBucket(*bucket) for name, bucket in buckets.items()},
+            "leave_feet",
         )
-
-        proximities = []
-        for shot in shots_with_next:
-            if (
-                shot.shot_type == shot_type
-                and shot.start_distance >= min_distance
-                and (max_distance is None or shot.start_distance < max_distance)
-                and (lie is None or shot.lie == lie)
-                and shot.next_distance is not None
-            ):
-                proximities.append(shot.next_distance)
-
-        if not proximities:
-            return 0.0
-
-        return sum(proximities) / len(proximities)
@@ -0,0 +1,82 @@
+import pytest
+
+from birdie_buddy.round_entry.factories import (
+    HoleFactory,
+    RoundFactory,
+    ShotFactory,
+)
+from birdie_buddy.round_entry.services.proximity_calculator import (
+    ProximityCalculator,
+)
+from birdie_buddy.users.factories import UserFactory
+
+
+@pytest.mark.django_db
+class TestProximityCalculator:
+    def _approach_hole(self, user, round, number, start_distance, putt_distance):
+        hole = HoleFactory(user=user, round=round, par=4, number=number)
+        ShotFactory(user=user, hole=hole, number=1, lie="tee", start_distance=400)
+        ShotFactory(
+            user=user, hole=hole, number=2, lie="fairway", start_distance=start_distance
+        )
+        if putt_distance is not None:
+            ShotFactory(
+                user=user, hole=hole, number=3, lie="green", start_distance=putt_distance
+            )
+        return hole
+
+    def test_no_shots(self):
+        user = UserFactory()
+        calculator = ProximityCalculator()
+
+        assert calculator.calculate_avg_proximity(user, "approach", 100, 150) == 0.0
+
+    def test_holed_shot_counts_as_zero(self):
+        user = UserFactory()
+        round = RoundFactory(user=user)
+        self._approach_hole(user, round, 1, 120, 20)
+        self._approach_hole(user, round, 2, 130, None)
+
+        calculator = ProximityCalculator()
+
+        assert calculator.calculate_avg_proximity(user, "approach", 100, 150) == 10.0
+
+    def test_filters_by_round(self):
+        user = UserFactory()
+        round1 = RoundFactory(user=user)
+        round2 = RoundFactory(user=user)
+        self._approach_hole(user, round1, 1, 120, 20)
+        self._approach_hole(user, round2, 1, 120, 40)
+
+        calculator = ProximityCalculator()
+
+        assert (
+            calculator.calculate_avg_proximity(user, "approach", 100, 150, round=round2)
+            == 40.0
+        )
+
+    def test_multiple_buckets_use_one_query(self, django_assert_num_queries):
+        user = UserFactory()
+        round = RoundFactory(user=user)
+        self._approach_hole(user, round, 1, 120, 20)
+        self._approach_hole(user, round, 2, 170, 30)
+
+        calculator = ProximityCalculator()
+
+        with django_assert_num_queries(1):
+            proximities = calculator.calculate_avg_proximities(
+                user,
+                {
+                    "100_150": ("approach", 100, 150, None),
+                    "150_200": ("approach", 150, 200, None),
+                    "all": ("approach", 30, None, None),
+                    "rough": ("approach", 30, None, "rough"),
+                },
+            )
+
+        assert proximities == {
+            "100_150": 20.0,
+            "150_200": 30.0,
+            "all": 25.0,
+            "rough": 0.0,
+        }
@@ -1,7 +1,11 @@
 from typing import NamedTuple
-from django.db.models import Max, Sum
+from django.db.models import Case, CharField, Count, Q, Sum, Value, When
 
-from birdie_buddy.round_entry.models import Shot, Hole
+from birdie_buddy.round_entry.models import Shot, Hole, ShotBucketAggregate
+from birdie_buddy.round_entry.services.avg_strokes_to_holeout import DEFAULT_BASELINE
+from birdie_buddy.round_entry.services.baseline_shots import BaselineStatsMixin
+from birdie_buddy.round_entry.services.stats_window import StatsWindow
+from birdie_buddy.round_entry.services.user_stats_snapshot import UserStatsSnapshot
 
 
 class PuttingStats(NamedTuple):
@@ -46,7 +50,33 @@ class RoundPuttingStats(NamedTuple):
     strokes_gained_40_plus: float
 
 
-class PuttingStatsService:
+class PuttingBucket(NamedTuple):
+    putts: int = 0
+    made: int = 0
+    strokes_gained: float = 0.0
+
+    @property
+    def make_rate(self) -> float:
+        return (self.made / self.putts) * 100 if self.putts else 0.0
+
+
+class PuttingStatsService(BaselineStatsMixin):
+    # (name, min_feet, max_feet); the buckets are disjoint
+    BUCKETS = (
+        ("0_3", 0, 3),
+        ("3_6", 3, 6),
+        ("6_9", 6, 9),
+        ("9_12", 9, 12),
+        ("12_15", 12, 15),
+        ("15_20", 15, 20),
+        ("20_30", 20, 30),
+        ("30_40", 30, 40),
+        ("40_plus", 40, None),
+    )
+
+    def __init__(self, baseline: str = DEFAULT_BASELINE):
+        self.baseline = baseline
+
     def _get_make_rate_for_distance(
         self, user, min_feet: int, max_feet: int | None, round=None
     ) -> float:
@@ -58,18 +88,10 @@ class PuttingStatsService:
         if round is not None:
             putts = putts.filter(hole__round=round)
 
-        total_putts = putts.count()
-
-        if total_putts == 0:
-            return 0.0
-
-        made_putts = 0
-        for putt in putts.select_related("hole"):
-            max_shot_number = putt.hole.shot_set.aggregate(Max("number"))["number__max"]
-            if putt.number == max_shot_number:
-                made_putts += 1
-
-        return (made_putts / total_putts) * 100
+        counts = putts.aggregate(
+            total=Count("id"), made=Count("id", filter=Q(is_holed=True))
+        )
+        return PuttingBucket(counts["total"], counts["made"]).make_rate
 
     def _get_strokes_gained_for_distance(
         self, user, min_feet: int, max_feet: int | None, round=None
@@ -86,8 +108,13 @@ class PuttingStatsService:
         if round is not None:
             filters["hole__round"] = round
 
-        shots = Shot.objects.filter(**filters)
-        total_sg = shots.aggregate(total=Sum("strokes_gained"))["total"] or 0.0
+        if self.uses_default_baseline:
+            shots = Shot.objects.filter(**filters)
+            total_sg = shots.aggregate(total=Sum("strokes_gained"))["total"] or 0.0
+        else:
+            total_sg = self.baseline_shots(user).strokes_gained(
+                "putt", min_feet, max_feet, round=round, distance_field="feet"
+            )
 
         if round is not None:
             return total_sg
@@ -152,47 +179,133 @@ class PuttingStatsService:
     def strokes_gained_40_plus(self, user, round=None) -> float:
         return self._get_strokes_gained_for_distance(user, 40, None, round)
 
-    def get_for_user(self, user) -> PuttingStats:
-        return PuttingStats(
-            make_rate_0_3=self.make_rate_0_3(user),
-            make_rate_3_6=self.make_rate_3_6(user),
-            make_rate_6_9=self.make_rate_6_9(user),
-            make_rate_9_12=self.make_rate_9_12(user),
-            make_rate_12_15=self.make_rate_12_15(user),
-            make_rate_15_20=self.make_rate_15_20(user),
-            make_rate_20_30=self.make_rate_20_30(user),
-            make_rate_30_40=self.make_rate_30_40(user),
-            make_rate_40_plus=self.make_rate_40_plus(user),
-            strokes_gained_0_3_per_18=self.strokes_gained_0_3(user),
-            strokes_gained_3_6_per_18=self.strokes_gained_3_6(user),
-            strokes_gained_6_9_per_18=self.strokes_gained_6_9(user),
-            strokes_gained_9_12_per_18=self.strokes_gained_9_12(user),
-            strokes_gained_12_15_per_18=self.strokes_gained_12_15(user),
-            strokes_gained_15_20_per_18=self.strokes_gained_15_20(user),
-            strokes_gained_20_30_per_18=self.strokes_gained_20_30(user),
-            strokes_gained_30_40_per_18=self.strokes_gained_30_40(user),
-            strokes_gained_40_plus_per_18=self.strokes_gained_40_plus(user),
+    def _bucket_rows(self, putts, *group_by: str):
+        """
+        Putt count, holed count and strokes gained per bucket (and group_by
+        fields) from one GROUP BY query.
+        """
+        bucket = Case(
+            *[
+                When(
+                    Q(feet__gte=min_feet)
+                    & (Q() if max_feet is None else Q(feet__lt=max_feet)),
+                    then=Value(name),
+                )
+                for name, min_feet, max_feet in self.BUCKETS
+            ],
+            output_field=CharField(),
+        )
+        return (
+            putts.filter(shot_type="putt", feet__isnull=False)
+            .annotate(bucket=bucket)
+            .values(*group_by, "bucket")
+            .annotate(
+                putts=Count("id"),
+                made=Count("id", filter=Q(is_holed=True)),
+                strokes_gained=Sum("strokes_gained"),
+            )
+            .order_by()
         )
 
-    def get_for_round(self, round) -> RoundPuttingStats:
-        user = round.user
-        return RoundPuttingStats(
-            make_rate_0_3=self.make_rate_0_3(user, round),
-            make_rate_3_6=self.make_rate_3_6(user, round),
-            make_rate_6_9=self.make_rate_6_9(user, round),
-            make_rate_9_12=self.make_rate_9_12(user, round),
-            make_rate_12_15=self.make_rate_12_15(user, round),
-            make_rate_15_20=self.make_rate_15_20(user, round),
-            make_rate_20_30=self.make_rate_20_30(user, round),
-            make_rate_30_40=self.make_rate_30_40(user, round),
-            make_rate_40_plus=self.make_rate_40_plus(user, round),
-            strokes_gained_0_3=self.strokes_gained_0_3(user, round),
-            strokes_gained_3_6=self.strokes_gained_3_6(user, round),
-            strokes_gained_6_9=self.strokes_gained_6_9(user, round),
-            strokes_gained_9_12=self.strokes_gained_9_12(user, round),
-            strokes_gained_12_15=self.strokes_gained_12_15(user, round),
-            strokes_gained_15_20=self.strokes_gained_15_20(user, round),
-            strokes_gained_20_30=self.strokes_gained_20_30(user, round),
-            strokes_gained_30_40=self.strokes_gained_30_40(user, round),
-            strokes_gained_40_plus=self.strokes_gained_40_plus(user, round),
+    def _empty_buckets(self) -> dict[str, PuttingBucket]:
+        return {name: PuttingBucket() for name, _, _ in self.BUCKETS}
+
+    def _rescore_buckets(self, buckets: dict[str, PuttingBucket], user, round=None):
+        """Replace stored strokes gained with values for a non-default baseline."""
+        shots = self.baseline_shots(user)
+        for name, min_feet, max_feet in self.BUCKETS:
+            buckets[name] = buckets[name]._replace(
+                strokes_gained=shots.strokes_gained(
+                    "putt", min_feet, max_feet, round=round, distance_field="feet"
+                )
+            )
+
+    def _get_buckets_for_rounds(
+        self, rounds: list
+    ) -> dict[int, dict[str, PuttingBucket]]:
+        by_round = {round.pk: self._empty_buckets() for round in rounds}
+        rows = self._bucket_rows(
+            Shot.objects.filter(hole__round__in=rounds), "hole__round_id"
         )
+        for row in rows:
+            if row["bucket"] is not None:
+                by_round[row["hole__round_id"]][row["bucket"]] = PuttingBucket(
+                    row["putts"], row["made"], row["strokes_gained"] or 0.0
+                )
+
+        if not self.uses_default_baseline:
+            for round in rounds:
+                self._rescore_buckets(by_round[round.pk], round.user, round)
+
+        return by_round
+
+    def _get_buckets_from_snapshot(
+        self, snapshot: UserStatsSnapshot
+    ) -> dict[str, PuttingBucket]:
+        strokes_gained = snapshot.strokes_gained(self.baseline)
+        buckets = {}
+        for name, min_feet, max_feet in self.BUCKETS:
+            putts = snapshot.select("putt", min_feet, max_feet, distance_field="feet")
+            buckets[name] = PuttingBucket(
+                len(putts),
+                sum(snapshot.is_holed[i] for i in putts),
+                snapshot.total(strokes_gained, putts),
+            )
+        return buckets
+
+    def _get_buckets_from_aggregates(self, user) -> dict[str, PuttingBucket]:
+        aggregates = ShotBucketAggregate.objects.for_user(user, "putt")
+        buckets = {}
+        for name, _, _ in self.BUCKETS:
+            aggregate = aggregates.get(name, ShotBucketAggregate())
+            buckets[name] = PuttingBucket(
+                aggregate.shot_count,
+                aggregate.holed_count,
+                aggregate.strokes_gained_sum,
+            )
+        return buckets
+
+    def get_for_user(
+        self,
+        user,
+        snapshot: UserStatsSnapshot | None = None,
+        window: StatsWindow | None = None,
+    ) -> PuttingStats:
+        """
+        Per 18 hole stats. With no window and the default baseline they are
+        read from the user's ShotBucketAggregate rows; otherwise from the
+        snapshot given, or one loaded for the window.
+        """
+        if snapshot is None and window is None and self.uses_default_baseline:
+            buckets = self._get_buckets_from_aggregates(user)
+            total_holes = Hole.objects.filter(user=user).count()
+        else:
+            if snapshot is None:
+                snapshot = UserStatsSnapshot.load(user, window)
+            buckets = self._get_buckets_from_snapshot(snapshot)
+            total_holes = snapshot.hole_count
+
+        stats = {}
+        for name, bucket in buckets.items():
+            stats[f"make_rate_{name}"] = bucket.make_rate
+            stats[f"strokes_gained_{name}_per_18"] = (
+                (bucket.strokes_gained / total_holes) * 18 if total_holes else 0.0
+            )
+        return PuttingStats(**stats)
+
+    def get_for_round(self, round) -> RoundPuttingStats:
+        return self.get_for_rounds([round])[round.pk]
+
+    def get_for_rounds(self, rounds) -> dict[int, RoundPuttingStats]:
+        """
+        Unscaled stats for each round, keyed by round id, from one GROUP BY
+        round and bucket query however many rounds are passed.
+        """
+        results = {}
+        for round_id, buckets in self._get_buckets_for_rounds(list(rounds)).items():
+            stats = {}
+            for name, bucket in buckets.items():
+                stats[f"make_rate_{name}"] = bucket.make_rate
+                stats[f"strokes_gained_{name}"] = bucket.strokes_gained
+            results[round_id] = RoundPuttingStats(**stats)
+        return results
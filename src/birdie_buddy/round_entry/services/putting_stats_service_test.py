@@ -5,6 +5,7 @@ from birdie_buddy.round_entry.factories import (
     RoundFactory,
     ShotFactory,
 )
+from birdie_buddy.round_entry.factories.full_round_factory import full_round_factory
 
 from birdie_buddy.users.factories import UserFactory
 
@@ -813,3 +814,63 @@ class TestPuttingStatsService:
         assert stats.strokes_gained_0_3 == pytest.approx(0.5)
         assert stats.strokes_gained_9_12 == pytest.approx(-0.3)
 
+
+    def test_get_for_user_uses_grouped_query(self, django_assert_num_queries):
+        user = UserFactory()
+        service = PuttingStatsService()
+        round = RoundFactory(user=user)
+
+        for number, putts in enumerate([[2], [25, 3], [45, 8, 1]], start=1):
+            hole = HoleFactory(user=user, round=round, par=4, number=number)
+            ShotFactory(user=user, hole=hole, number=1, lie="tee", start_distance=400)
+            ShotFactory(user=user, hole=hole, number=2, lie="fairway", start_distance=150)
+            for putt_number, feet in enumerate(putts, start=3):
+                ShotFactory(
+                    user=user,
+                    hole=hole,
+                    number=putt_number,
+                    lie="green",
+                    start_distance=feet,
+                )
+
+        expected_sg = service.strokes_gained_0_3(user)
+
+        with django_assert_num_queries(2):
+            stats = service.get_for_user(user)
+
+        assert stats.make_rate_0_3 == 100.0
+        assert stats.make_rate_3_6 == 100.0
+        assert stats.make_rate_6_9 == 0.0
+        assert stats.make_rate_20_30 == 0.0
+        assert stats.make_rate_40_plus == 0.0
+        assert stats.make_rate_12_15 == 0.0
+        assert stats.strokes_gained_0_3_per_18 == pytest.approx(expected_sg)
+
+        with django_assert_num_queries(1):
+            round_stats = service.get_for_round(round)
+
+        assert round_stats.make_rate_0_3 == 100.0
+
+    def test_get_for_rounds_matches_per_round_queries(self, django_assert_num_queries):
+        user = UserFactory()
+        service = PuttingStatsService()
+        rounds = [
+            full_round_factory(n_holes=9, user=user),
+            full_round_factory(n_holes=9, user=user),
+            RoundFactory(user=user),
+        ]
+
+        with django_assert_num_queries(1):
+            results = service.get_for_rounds(rounds)
+
+        for round in rounds:
+            stats = results[round.pk]
+            for name, min_feet, max_feet in service.BUCKETS:
+                assert getattr(stats, f"make_rate_{name}") == pytest.approx(
+                    service._get_make_rate_for_distance(user, min_feet, max_feet, round)
+                )
+                assert getattr(stats, f"strokes_gained_{name}") == pytest.approx(
+                    service._get_strokes_gained_for_distance(
+                        user, min_feet, max_feet, round
+                    )
+                )
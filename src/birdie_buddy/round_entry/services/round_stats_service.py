@@ -0,0 +1,89 @@
+from dataclasses import asdict, is_dataclass
+from math import isnan
+from typing import NamedTuple
+
+from birdie_buddy.round_entry.services.approach_stats_service import (
+    ApproachShotService,
+    ApproachStats,
+)
+from birdie_buddy.round_entry.services.driving_stats_service import (
+    DrivingStatsService,
+    RoundDrivingStats,
+)
+from birdie_buddy.round_entry.services.mental_scorecard_service import (
+    MentalScorecardService,
+    RoundMentalScorecardStats,
+)
+from birdie_buddy.round_entry.services.putting_stats_service import (
+    PuttingStatsService,
+    RoundPuttingStats,
+)
+from birdie_buddy.round_entry.services.tiger_five import TigerFive, TigerFiveService
+
+
+class RoundStats(NamedTuple):
+    tiger: TigerFive
+    approach_stats: ApproachStats
+    driving_stats: RoundDrivingStats
+    putting_stats: RoundPuttingStats
+    mental_stats: RoundMentalScorecardStats
+
+
+# RoundStats field -> (service, result type)
+SECTIONS = {
+    "tiger": (TigerFiveService, TigerFive),
+    "approach_stats": (ApproachShotService, ApproachStats),
+    "driving_stats": (DrivingStatsService, RoundDrivingStats),
+    "putting_stats": (PuttingStatsService, RoundPuttingStats),
+    "mental_stats": (MentalScorecardService, RoundMentalScorecardStats),
+}
+
+
+class RoundStatsService:
+    """
+    The round detail page's stats, stored as JSON on RoundSummary.stats.
+
+    RoundSummary.objects.refresh() stores them whenever a complete round's
+    holes or shots change, so viewing a round reads them with its summary
+    instead of running every stats service. The backfill_round_summaries
+    command stores them for existing rounds.
+    """
+
+    @staticmethod
+    def compute(round) -> RoundStats:
+        return RoundStats(
+            **{
+                name: service().get_for_round(round)
+                for name, (service, _) in SECTIONS.items()
+            }
+        )
+
+    @staticmethod
+    def to_json(stats: RoundStats) -> dict:
+        """Plain dicts per section, NaN stored as null since JSON has no NaN."""
+        data = {}
+        for name, section in stats._asdict().items():
+            values = asdict(section) if is_dataclass(section) else section._asdict()
+            data[name] = {
+                key: None if isinstance(value, float) and isnan(value) else value
+                for key, value in values.items()
+            }
+        return data
+
+    @staticmethod
+    def from_json(data: dict) -> RoundStats:
+        return RoundStats(
+            **{name: result(**data[name]) for name, (_, result) in SECTIONS.items()}
+        )
+
+    @staticmethod
+    def get_for_round(round) -> RoundStats:
+        """
+        Stored stats for the round. Without them, e.g. stored before a
+        section was added, they are computed but not stored; the next
+        RoundSummary refresh stores them.
+        """
+        summary = round.get_summary()
+        if summary.stats is None or summary.stats.keys() != SECTIONS.keys():
+            return RoundStatsService.compute(round)
+        return RoundStatsService.from_json(summary.stats)
@@ -0,0 +1,58 @@
+import pytest
+
+from birdie_buddy.round_entry.factories import HoleFactory, RoundFactory
+from birdie_buddy.round_entry.models import Round, RoundSummary
+from birdie_buddy.round_entry.services.hole_service import HoleService
+from birdie_buddy.round_entry.services.round_stats_service import RoundStatsService
+
+
+@pytest.fixture
+def complete_round(user):
+    round = RoundFactory(user=user, holes_played=2)
+    HoleFactory.par_4_par(round=round, user=user, number=1)
+    HoleFactory.par_3_par(round=round, user=user, number=2)
+    RoundSummary.objects.refresh(round)
+    return round
+
+
+@pytest.mark.django_db
+class TestRoundStatsService:
+    def test_refresh_stores_stats_for_complete_rounds(self, complete_round):
+        summary = RoundSummary.objects.get(round=complete_round)
+
+        assert RoundStatsService.from_json(summary.stats) == RoundStatsService.compute(
+            complete_round
+        )
+
+    def test_incomplete_rounds_store_nothing(self, user):
+        round = RoundFactory(user=user, holes_played=18)
+        HoleFactory.par_4_par(round=round, user=user, number=1)
+
+        assert RoundSummary.objects.refresh(round).stats is None
+
+    def test_changing_a_hole_recomputes_the_stats(self, complete_round):
+        before = RoundStatsService.get_for_round(complete_round)
+
+        HoleService.delete_hole(complete_round.hole_set.get(number=2))
+
+        after = RoundStatsService.get_for_round(complete_round)
+        assert after.putting_stats != before.putting_stats
+        assert after == RoundStatsService.compute(complete_round)
+
+    def test_stored_stats_are_read_without_computing(
+        self, complete_round, monkeypatch, django_assert_num_queries
+    ):
+        monkeypatch.setattr(RoundStatsService, "compute", None)
+
+        with django_assert_num_queries(0):
+            stats = RoundStatsService.get_for_round(complete_round)
+
+        assert stats.tiger.penalties == 0
+
+    def test_computes_missing_stats_without_storing_them(self, complete_round):
+        RoundSummary.objects.filter(round=complete_round).update(stats=None)
+
+        stats = RoundStatsService.get_for_round(Round.objects.get(pk=complete_round.pk))
+
+        assert stats == RoundStatsService.compute(complete_round)
+        assert RoundSummary.objects.get(round=complete_round).stats is None
@@ -4,19 +4,81 @@ from typing import Optional
 from django.contrib.auth import get_user_model
 from django.db import transaction
 
-from birdie_buddy.round_entry.models import Round, Hole, Shot, ScorecardUpload
+from birdie_buddy.round_entry.models import (
+    Round,
+    RoundSummary,
+    Hole,
+    Shot,
+    ScorecardUpload,
+)
 from birdie_buddy.round_entry.services.scorecard_parser_service import ScorecardData
+from birdie_buddy.round_entry.services.shot_bucket_aggregate_service import (
+    ShotBucketAggregateService,
+)
 from birdie_buddy.round_entry.services.shot_service import ShotService
+from birdie_buddy.round_entry.services.stats_cache import StatsCache
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
 
 
+# A hole ready to write: the unsaved Hole and its unsaved, scored shots
+HoleImport = tuple[Hole, list[Shot]]
+
+
 class ScorecardImportService:
     """Service for creating Round/Hole/Shot objects from parsed scorecard data."""
 
     @staticmethod
-    @transaction.atomic
+    def build_holes(
+        user, round_obj: Round, scorecard_data: ScorecardData
+    ) -> list[HoleImport]:
+        """
+        Build a round's holes and shots in memory, with strokes gained, leave
+        distances and the derived distance and type fields already set.
+
+        Raises KeyError for a shot outside the strokes gained baseline, before
+        anything has been written.
+        """
+        holes = []
+        for hole_data in scorecard_data.holes:
+            hole = Hole(
+                user=user,
+                round=round_obj,
+                number=hole_data.number,
+                par=hole_data.par,
+                score=hole_data.score,
+            )
+            shots = [
+                Shot(
+                    user=user,
+                    hole=hole,
+                    start_distance=shot_data.start_distance,
+                    lie=shot_data.lie,
+                )
+                for shot_data in hole_data.shots
+            ]
+            holes.append((hole, ShotService.set_strokes_gained(shots)))
+        return holes
+
+    @staticmethod
+    def write_holes(user, holes: list[HoleImport]) -> None:
+        """
+        Insert holes built by build_holes, for any number of the user's
+        rounds, with one bulk_create for the holes and one for the shots.
+        """
+        Hole.objects.bulk_create([hole for hole, _ in holes])
+        # Shots built against the unsaved holes pick up their new pks here
+        Shot.objects.bulk_create([shot for _, shots in holes for shot in shots])
+
+        ShotBucketAggregateService.apply(
+            user.pk,
+            after=ShotBucketAggregateService.holes_totals(
+                (hole.par, shots) for hole, shots in holes
+            ),
+        )
+
+    @staticmethod
     def create_round_from_scorecard_data(
         user, scorecard_upload: ScorecardUpload, scorecard_data: ScorecardData
     ) -> Optional[Round]:
@@ -31,48 +93,79 @@ class ScorecardImportService:
         Returns:
             The created Round object, or None if creation fails
         """
-        try:
-            # Create the Round (use course_name from scorecard_upload, not parsed data)
-            round_obj = Round.objects.create(
+        rounds = ScorecardImportService.create_rounds_from_scorecard_data(
+            user, [(scorecard_upload, scorecard_data)]
+        )
+        return rounds[0]
+
+    @staticmethod
+    @transaction.atomic
+    def create_rounds_from_scorecard_data(
+        user, imports: list[tuple[ScorecardUpload, ScorecardData]]
+    ) -> list[Optional[Round]]:
+        """
+        Create a Round per (upload, parsed data) pair, for importing many cards at once.
+
+        Every round is built in memory first and then written with one
+        bulk_create each for the rounds, holes and shots, however many cards
+        are imported. A card that cannot be built is skipped.
+
+        Args:
+            user: The user who owns these rounds
+            imports: ScorecardUpload instances with their parsed scorecard data
+
+        Returns:
+            The created Round for each pair, in order, or None where creation failed
+        """
+        rounds: list[Optional[Round]] = [None] * len(imports)
+        built = []
+        for i, (scorecard_upload, scorecard_data) in enumerate(imports):
+            # Use course_name from scorecard_upload, not parsed data
+            round_obj = Round(
                 user=user,
                 course_name=scorecard_upload.course_name,
                 holes_played=scorecard_data.holes_played,
             )
-
-            # Create all holes and their shots
-            for hole_data in scorecard_data.holes:
-                hole = Hole.objects.create(
-                    user=user,
-                    round=round_obj,
-                    number=hole_data.number,
-                    par=hole_data.par,
-                    score=hole_data.score,
+            try:
+                holes = ScorecardImportService.build_holes(
+                    user, round_obj, scorecard_data
+                )
+            except Exception as e:
+                logger.error(
+                    f"Failed to create round from scorecard upload {scorecard_upload.id}: {str(e)}"
                 )
+                continue
+            built.append((i, scorecard_upload, round_obj, holes))
 
-                # Create shots for this hole (unsaved)
-                shots_to_create = []
-                for shot_data in hole_data.shots:
-                    shot = Shot(
-                        user=user,
-                        hole=hole,
-                        start_distance=shot_data.start_distance,
-                        lie=shot_data.lie,
-                    )
-                    shots_to_create.append(shot)
+        if not built:
+            return rounds
 
-                # Use ShotService to calculate strokes gained and save
-                ShotService.save_shots_with_strokes_gained(shots_to_create)
+        try:
+            with transaction.atomic():
+                Round.objects.bulk_create([round_obj for _, _, round_obj, _ in built])
+                ScorecardImportService.write_holes(
+                    user, [hole for *_, holes in built for hole in holes]
+                )
 
-            # Link the scorecard upload to the round
-            scorecard_upload.round = round_obj
-            scorecard_upload.save()
+                for _, scorecard_upload, round_obj, _ in built:
+                    RoundSummary.objects.refresh(round_obj)
+                    # Link the scorecard upload to the round
+                    scorecard_upload.round = round_obj
+                ScorecardUpload.objects.bulk_update(
+                    [scorecard_upload for _, scorecard_upload, _, _ in built], ["round"]
+                )
+        except Exception as e:
+            logger.error(f"Failed to create rounds from scorecard data: {str(e)}")
+            # The savepoint was rolled back, so nothing was written
+            for _, scorecard_upload, _, _ in built:
+                scorecard_upload.round = None
+            return rounds
+
+        StatsCache.invalidate_on_commit(user.pk)
 
+        for i, scorecard_upload, round_obj, _ in built:
             logger.info(
                 f"Successfully created round {round_obj.id} from scorecard upload {scorecard_upload.id}"
             )
-            return round_obj
-
-        except Exception as e:
-            logger.error(f"Failed to create round from scorecard data: {str(e)}")
-            # Transaction will be rolled back automatically
-            return None
+            rounds[i] = round_obj
+        return rounds
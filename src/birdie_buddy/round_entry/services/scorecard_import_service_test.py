@@ -0,0 +1,143 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from birdie_buddy.round_entry.models import (
+    Hole,
+    Round,
+    RoundSummary,
+    ScorecardUpload,
+    Shot,
+)
+from birdie_buddy.round_entry.services.scorecard_import_service import (
+    ScorecardImportService,
+)
+from birdie_buddy.round_entry.services.scorecard_parser_service import (
+    HoleData,
+    ScorecardData,
+    ShotData,
+)
+from birdie_buddy.round_entry.services.shot_bucket_aggregate_service_test import (
+    assert_matches_rebuild,
+)
+
+
+def scorecard_data(n_holes, start_distance=380):
+    return ScorecardData(
+        holes=[
+            HoleData(
+                number=number,
+                par=4,
+                score=4,
+                shots=[
+                    ShotData(number=1, start_distance=start_distance, lie="tee"),
+                    ShotData(number=2, start_distance=150, lie="fairway"),
+                    ShotData(number=3, start_distance=25, lie="green"),
+                    ShotData(number=4, start_distance=2, lie="green"),
+                ],
+            )
+            for number in range(1, n_holes + 1)
+        ]
+    )
+
+
+def scorecard_upload(user, course_name="Test Course"):
+    return ScorecardUpload.objects.create(
+        user=user, course_name=course_name, scorecard_image="test.jpg"
+    )
+
+
+def inserts(queries, table):
+    return [
+        query
+        for query in queries
+        if query["sql"].startswith("INSERT") and f'"{table}"' in query["sql"]
+    ]
+
+
+@pytest.mark.django_db
+class TestScorecardImportService:
+    def test_creates_round_holes_and_shots(self, user):
+        upload = scorecard_upload(user)
+
+        round = ScorecardImportService.create_round_from_scorecard_data(
+            user, upload, scorecard_data(2)
+        )
+
+        assert round.course_name == "Test Course"
+        assert round.holes_played == 2
+        upload.refresh_from_db()
+        assert upload.round == round
+        shots = list(
+            Shot.objects.filter(hole__round=round).order_by("hole__number", "number")
+        )
+        assert len(shots) == 8
+        tee, approach, putt, tap_in = shots[:4]
+        assert (tee.shot_type, tee.yards, tee.feet, tee.leave_feet) == (
+            "drive",
+            380,
+            1140,
+            450,
+        )
+        assert approach.shot_type == "approach"
+        assert (putt.shot_type, putt.yards, putt.feet) == ("putt", 8, 25)
+        assert (tap_in.leave_feet, tap_in.is_holed) == (0, True)
+        assert all(shot.strokes_gained is not None for shot in shots)
+        assert round.summary.complete
+        assert_matches_rebuild(user)
+
+    def test_writes_holes_and_shots_with_one_insert_each(self, user):
+        with CaptureQueriesContext(connection) as queries:
+            ScorecardImportService.create_round_from_scorecard_data(
+                user, scorecard_upload(user), scorecard_data(18)
+            )
+
+        assert len(inserts(queries, "round_entry_hole")) == 1
+        assert len(inserts(queries, "round_entry_shot")) == 1
+        assert Shot.objects.count() == 72
+
+    def test_imports_many_rounds(self, user):
+        uploads = [scorecard_upload(user, f"Course {i}") for i in range(3)]
+
+        with CaptureQueriesContext(connection) as queries:
+            rounds = ScorecardImportService.create_rounds_from_scorecard_data(
+                user, [(upload, scorecard_data(3)) for upload in uploads]
+            )
+
+        assert [round.course_name for round in rounds] == [
+            "Course 0",
+            "Course 1",
+            "Course 2",
+        ]
+        assert len(inserts(queries, "round_entry_round")) == 1
+        assert len(inserts(queries, "round_entry_shot")) == 1
+        assert RoundSummary.objects.filter(round__in=rounds, complete=True).count() == 3
+        assert [
+            upload.round_id for upload in ScorecardUpload.objects.order_by("course_name")
+        ] == [round.pk for round in rounds]
+        assert_matches_rebuild(user)
+
+    def test_card_outside_the_baseline_is_skipped(self, user):
+        bad, good = scorecard_upload(user, "Bad"), scorecard_upload(user, "Good")
+
+        rounds = ScorecardImportService.create_rounds_from_scorecard_data(
+            user,
+            [
+                (bad, scorecard_data(2, start_distance=5000)),
+                (good, scorecard_data(2)),
+            ],
+        )
+
+        assert rounds[0] is None
+        assert rounds[1].course_name == "Good"
+        assert Round.objects.count() == 1
+        assert Hole.objects.count() == 2
+
+    def test_returns_none_when_the_card_fails(self, user):
+        round = ScorecardImportService.create_round_from_scorecard_data(
+            user, scorecard_upload(user), scorecard_data(2, start_distance=5000)
+        )
+
+        assert round is None
+        assert not Round.objects.exists()
+        assert not Shot.objects.exists()
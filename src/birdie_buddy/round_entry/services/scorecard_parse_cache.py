@@ -0,0 +1,171 @@
+import hashlib
+import io
+import logging
+from datetime import timedelta
+from typing import NamedTuple, Optional
+
+from django.db.models import F, Sum
+from django.utils import timezone
+from PIL import Image
+
+from birdie_buddy.round_entry.models import ScorecardParseCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+class ImageKey(NamedTuple):
+    image_hash: str
+    perceptual_hash: str
+
+
+class ScorecardParseCache:
+    """
+    Parsed scorecards keyed by the image they came from, so re-uploading a
+    photo reuses the stored parse instead of calling the LLM again.
+
+    Entries belong to one user. A lookup matches the exact image bytes
+    first and then, with PERCEPTUAL set, the closest difference hash of the
+    picture within MAX_DISTANCE bits, which survives re-encoding and
+    resizing. Entries unused for MAX_AGE and a user's entries beyond the
+    MAX_ENTRIES_PER_USER most recently used are evicted whenever a new parse
+    is stored.
+    """
+
+    # Off by default: the picture of a card is dominated by its printed
+    # grid, so two rounds on the same card design can hash alike. Only turn
+    # it on where uploads of one user's different rounds look distinct.
+    PERCEPTUAL = False
+    HASH_SIZE = 16  # A 16x16 difference hash: 256 bits
+    MAX_DISTANCE = 24  # Differing bits still counted as the same photo
+    MAX_AGE = timedelta(days=90)
+    MAX_ENTRIES_PER_USER = 50
+
+    @classmethod
+    def key(cls, content: bytes) -> ImageKey:
+        return ImageKey(
+            hashlib.sha256(content).hexdigest(),
+            cls.perceptual_hash(content) if cls.PERCEPTUAL else "",
+        )
+
+    @classmethod
+    def perceptual_hash(cls, content: bytes) -> str:
+        """
+        Difference hash: one bit per horizontally adjacent pixel pair of a
+        grayscale thumbnail, set where brightness increases. Empty if the
+        bytes are not a readable image.
+        """
+        try:
+            image = Image.open(io.BytesIO(content))
+            image.draft("L", (cls.HASH_SIZE * 8, cls.HASH_SIZE * 8))
+            pixels = list(
+                image.convert("L")
+                .resize((cls.HASH_SIZE + 1, cls.HASH_SIZE), Image.Resampling.LANCZOS)
+                .getdata()
+            )
+        except Exception as e:
+            logger.warning(f"Could not hash image: {str(e)}")
+            return ""
+
+        width = cls.HASH_SIZE + 1
+        bits = 0
+        for row in range(cls.HASH_SIZE):
+            for col in range(cls.HASH_SIZE):
+                left = pixels[row * width + col]
+                right = pixels[row * width + col + 1]
+                bits = (bits << 1) | (right > left)
+        return f"{bits:0{cls.HASH_SIZE * cls.HASH_SIZE // 4}x}"
+
+    @classmethod
+    def _matching(cls, user, key: ImageKey) -> list[ScorecardParseCacheEntry]:
+        """
+        The user's unexpired entries for the image, best match first: the
+        exact bytes, then perceptual matches by Hamming distance.
+        """
+        entries = ScorecardParseCacheEntry.objects.filter(
+            user=user, last_used_at__gte=timezone.now() - cls.MAX_AGE
+        )
+        if not key.perceptual_hash:
+            return list(entries.filter(image_hash=key.image_hash))
+
+        # A user has at most MAX_ENTRIES_PER_USER entries, so compare in Python
+        matches = []
+        for entry in entries:
+            if entry.image_hash == key.image_hash:
+                matches.append((-1, entry))
+            elif entry.perceptual_hash:
+                distance = cls.distance(entry.perceptual_hash, key.perceptual_hash)
+                if distance <= cls.MAX_DISTANCE:
+                    matches.append((distance, entry))
+        return [entry for _, entry in sorted(matches, key=lambda match: match[0])]
+
+    @staticmethod
+    def distance(a: str, b: str) -> int:
+        """Number of differing bits between two perceptual hashes."""
+        return (int(a, 16) ^ int(b, 16)).bit_count()
+
+    @classmethod
+    def get(cls, user, key: ImageKey) -> Optional[dict]:
+        """The stored parse for the image, counting the hit, or None."""
+        matches = cls._matching(user, key)
+        if not matches:
+            return None
+
+        entry = matches[0]
+        ScorecardParseCacheEntry.objects.filter(pk=entry.pk).update(
+            hits=F("hits") + 1, last_used_at=timezone.now()
+        )
+        return entry.parsed_data
+
+    @classmethod
+    def set(cls, user, key: ImageKey, parsed_data: dict) -> None:
+        ScorecardParseCacheEntry.objects.update_or_create(
+            user=user,
+            image_hash=key.image_hash,
+            defaults={
+                "perceptual_hash": key.perceptual_hash,
+                "parsed_data": parsed_data,
+                "last_used_at": timezone.now(),
+            },
+        )
+        cls.evict(user)
+
+    @classmethod
+    def discard(cls, user, key: ImageKey) -> None:
+        """Forget the image's parse, e.g. when no round could be imported from it."""
+        ScorecardParseCacheEntry.objects.filter(
+            pk__in=[entry.pk for entry in cls._matching(user, key)]
+        ).delete()
+
+    @classmethod
+    def evict(cls, user=None) -> int:
+        """
+        Delete expired entries and, for `user`, those past the per-user limit.
+        Returns the number of entries deleted.
+        """
+        expired = ScorecardParseCacheEntry.objects.filter(
+            last_used_at__lt=timezone.now() - cls.MAX_AGE
+        )
+        deleted, _ = expired.delete()
+
+        if user is not None:
+            keep = ScorecardParseCacheEntry.objects.filter(user=user).order_by(
+                "-last_used_at", "-id"
+            )[: cls.MAX_ENTRIES_PER_USER]
+            over_limit, _ = (
+                ScorecardParseCacheEntry.objects.filter(user=user)
+                .exclude(pk__in=list(keep.values_list("pk", flat=True)))
+                .delete()
+            )
+            deleted += over_limit
+        return deleted
+
+    @staticmethod
+    def hit_rate() -> float:
+        """
+        Share of the cached parses' uses served from the cache: each entry was
+        parsed once, then reused `hits` times.
+        """
+        totals = ScorecardParseCacheEntry.objects.aggregate(hits=Sum("hits"))
+        hits = totals["hits"] or 0
+        lookups = hits + ScorecardParseCacheEntry.objects.count()
+        return hits / lookups if lookups else 0.0
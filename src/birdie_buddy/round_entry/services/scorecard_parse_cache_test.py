@@ -0,0 +1,140 @@
+import io
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+from PIL import Image, ImageDraw
+
+from birdie_buddy.round_entry.models import ScorecardParseCacheEntry
+from birdie_buddy.round_entry.services.scorecard_parse_cache import ScorecardParseCache
+from birdie_buddy.users.factories import UserFactory
+
+PARSED = {"holes": [{"number": 1, "par": 3, "shots": []}]}
+
+
+@pytest.fixture
+def perceptual(monkeypatch):
+    monkeypatch.setattr(ScorecardParseCache, "PERCEPTUAL", True)
+
+
+def scorecard_photo(format="JPEG", quality=90, size=(600, 400), text="4 3 5"):
+    image = Image.new("RGB", (600, 400), "white")
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((40, 40, 560, 360), outline="black", width=6)
+    draw.line((40, 200, 560, 200), fill="black", width=4)
+    draw.text((80, 100), text, fill="black")
+    image = image.resize(size)
+    output = io.BytesIO()
+    image.save(output, format=format, quality=quality)
+    return output.getvalue()
+
+
+@pytest.mark.django_db
+class TestScorecardParseCache:
+    def test_same_image_hits(self, user):
+        key = ScorecardParseCache.key(scorecard_photo())
+        assert ScorecardParseCache.get(user, key) is None
+
+        ScorecardParseCache.set(user, key, PARSED)
+
+        assert ScorecardParseCache.get(user, key) == PARSED
+        assert ScorecardParseCacheEntry.objects.get(user=user).hits == 1
+
+    def test_re_encoded_image_misses_by_default(self, user):
+        original = ScorecardParseCache.key(scorecard_photo())
+        ScorecardParseCache.set(user, original, PARSED)
+
+        re_encoded = ScorecardParseCache.key(scorecard_photo(quality=60))
+
+        assert re_encoded.perceptual_hash == ""
+        assert ScorecardParseCache.get(user, re_encoded) is None
+
+    def test_same_card_design_hashes_alike(self):
+        # Why perceptual matching is off by default
+        assert (
+            ScorecardParseCache.distance(
+                ScorecardParseCache.perceptual_hash(scorecard_photo(text="4 3 5")),
+                ScorecardParseCache.perceptual_hash(scorecard_photo(text="5 4 6")),
+            )
+            <= ScorecardParseCache.MAX_DISTANCE
+        )
+
+    def test_re_encoded_image_hits_with_perceptual_hash(self, user, perceptual):
+        original = ScorecardParseCache.key(scorecard_photo())
+        ScorecardParseCache.set(user, original, PARSED)
+
+        re_encoded = ScorecardParseCache.key(
+            scorecard_photo(format="PNG", size=(900, 600))
+        )
+
+        assert re_encoded.image_hash != original.image_hash
+        assert re_encoded.perceptual_hash
+        assert ScorecardParseCache.get(user, re_encoded) == PARSED
+
+    def test_different_card_misses(self, user, perceptual):
+        original = ScorecardParseCache.key(scorecard_photo())
+        ScorecardParseCache.set(user, original, PARSED)
+        other = Image.new("RGB", (600, 400), "white")
+        ImageDraw.Draw(other).ellipse((100, 50, 500, 350), outline="black", width=8)
+        output = io.BytesIO()
+        other.save(output, format="JPEG")
+
+        other_key = ScorecardParseCache.key(output.getvalue())
+        assert ScorecardParseCache.get(user, other_key) is None
+
+    def test_entries_are_per_user(self, user):
+        key = ScorecardParseCache.key(scorecard_photo())
+        ScorecardParseCache.set(user, key, PARSED)
+
+        assert ScorecardParseCache.get(UserFactory(), key) is None
+
+    def test_unreadable_bytes_use_the_exact_hash_only(self, user, perceptual):
+        key = ScorecardParseCache.key(b"not an image")
+        assert key.perceptual_hash == ""
+
+        ScorecardParseCache.set(user, key, PARSED)
+
+        assert ScorecardParseCache.get(user, key) == PARSED
+        other_key = ScorecardParseCache.key(b"other")
+        assert ScorecardParseCache.get(user, other_key) is None
+
+    def test_discard(self, user):
+        key = ScorecardParseCache.key(scorecard_photo())
+        ScorecardParseCache.set(user, key, PARSED)
+
+        ScorecardParseCache.discard(user, key)
+
+        assert ScorecardParseCache.get(user, key) is None
+
+    def test_evicts_expired_entries(self, user):
+        key = ScorecardParseCache.key(scorecard_photo())
+        ScorecardParseCache.set(user, key, PARSED)
+        expired = timezone.now() - ScorecardParseCache.MAX_AGE - timedelta(days=1)
+        ScorecardParseCacheEntry.objects.update(last_used_at=expired)
+
+        assert ScorecardParseCache.get(user, key) is None
+        assert ScorecardParseCache.evict() == 1
+
+    def test_evicts_least_recently_used_past_the_limit(self, user, monkeypatch):
+        monkeypatch.setattr(ScorecardParseCache, "MAX_ENTRIES_PER_USER", 2)
+        keys = [ScorecardParseCache.key(f"card {i}".encode()) for i in range(3)]
+        ScorecardParseCache.set(user, keys[0], PARSED)
+        ScorecardParseCache.set(user, keys[1], PARSED)
+        ScorecardParseCache.get(user, keys[0])
+
+        ScorecardParseCache.set(user, keys[2], PARSED)
+
+        assert ScorecardParseCache.get(user, keys[1]) is None
+        assert ScorecardParseCache.get(user, keys[0]) == PARSED
+        assert ScorecardParseCache.get(user, keys[2]) == PARSED
+
+    def test_hit_rate(self, user):
+        assert ScorecardParseCache.hit_rate() == 0.0
+        key = ScorecardParseCache.key(scorecard_photo())
+        ScorecardParseCache.set(user, key, PARSED)
+        ScorecardParseCache.set(user, ScorecardParseCache.key(b"other"), PARSED)
+        ScorecardParseCache.get(user, key)
+        ScorecardParseCache.get(user, key)
+
+        # Two parses, reused twice
+        assert ScorecardParseCache.hit_rate() == pytest.approx(0.5)
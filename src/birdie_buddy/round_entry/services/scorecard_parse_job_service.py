@@ -0,0 +1,276 @@
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from typing import Callable, Optional
+
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import UploadedFile
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from birdie_buddy.round_entry.models import (
+    ScorecardParseJob,
+    ScorecardUpload,
+    ScorecardUploadBatch,
+)
+from birdie_buddy.round_entry.services.scorecard_import_service import (
+    ScorecardImportService,
+)
+from birdie_buddy.round_entry.services.scorecard_parse_cache import (
+    ScorecardParseCache,
+)
+from birdie_buddy.round_entry.services.scorecard_parser_service import (
+    ScorecardParserService,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ScorecardParseJobService:
+    """
+    A database-backed queue of scorecard parse jobs.
+
+    Uploads call enqueue() and return; the run_scorecard_worker command
+    claims jobs and runs the LLM parse and round import outside the request.
+    Jobs are claimed with SELECT ... FOR UPDATE SKIP LOCKED, so several
+    workers never run the same job, and a job left running by a worker that
+    died is picked up again once it goes stale.
+    """
+
+    MAX_ATTEMPTS = 3
+    STALE_AFTER = timedelta(minutes=10)
+
+    @staticmethod
+    def enqueue(
+        scorecard_upload: ScorecardUpload, image: Optional[UploadedFile] = None
+    ) -> ScorecardParseJob:
+        """
+        Queue the upload for parsing. With the processed `image`, the job
+        carries it and the worker stores it on the upload, so the request
+        neither writes the image to storage nor waits for it.
+        """
+        job = ScorecardParseJob(scorecard_upload=scorecard_upload)
+        if image is not None:
+            image.seek(0)
+            job.image = image.read()
+            job.image_name = image.name
+        job.save()
+        return job
+
+    @staticmethod
+    def enqueue_batch(
+        user, images: list[tuple[str, Optional[UploadedFile]]], course_name: str = ""
+    ) -> ScorecardUploadBatch:
+        """
+        An upload and job per (original filename, processed image) in one
+        batch. Images that couldn't be processed get a failed job, so the
+        batch still reports them. Without a course name, each round is named
+        after its photo's filename.
+        """
+        with transaction.atomic():
+            batch = ScorecardUploadBatch.objects.create(user=user)
+            for filename, image in images:
+                scorecard_upload = ScorecardUpload.objects.create(
+                    user=user,
+                    batch=batch,
+                    course_name=course_name or os.path.splitext(filename)[0],
+                )
+                if image is not None:
+                    ScorecardParseJobService.enqueue(scorecard_upload, image)
+                else:
+                    ScorecardParseJob.objects.create(
+                        scorecard_upload=scorecard_upload,
+                        status=ScorecardParseJob.FAILED,
+                        finished_at=timezone.now(),
+                        error=f"{filename} could not be read as an image",
+                    )
+        return batch
+
+    @staticmethod
+    def claim_next() -> Optional[ScorecardParseJob]:
+        """Mark the oldest runnable job as running and return it, if any."""
+        while True:
+            with transaction.atomic():
+                now = timezone.now()
+                job = (
+                    ScorecardParseJob.objects.select_for_update(skip_locked=True)
+                    .filter(
+                        Q(status=ScorecardParseJob.QUEUED)
+                        | Q(
+                            status=ScorecardParseJob.RUNNING,
+                            started_at__lt=now - ScorecardParseJobService.STALE_AFTER,
+                        )
+                    )
+                    .order_by("created_at", "id")
+                    .first()
+                )
+                if job is None:
+                    return None
+
+                gave_up = job.attempts >= ScorecardParseJobService.MAX_ATTEMPTS
+                if gave_up:
+                    job.status = ScorecardParseJob.FAILED
+                    job.finished_at = now
+                    job.error = f"Gave up after {job.attempts} attempts"
+                    job.save(update_fields=["status", "finished_at", "error"])
+                else:
+                    job.status = ScorecardParseJob.RUNNING
+                    job.started_at = now
+                    job.attempts += 1
+                    job.save(update_fields=["status", "started_at", "attempts"])
+
+            if not gave_up:
+                return job
+            # Outside the claim's transaction: storage is a network call
+            ScorecardParseJobService._release_image(job)
+
+    @staticmethod
+    def run(
+        job: ScorecardParseJob, parser: Optional[ScorecardParserService] = None
+    ) -> ScorecardParseJob:
+        """Parse the job's image, import the round and record the outcome."""
+        scorecard_upload = job.scorecard_upload
+        parser = parser or ScorecardParserService()
+        user = scorecard_upload.user
+
+        error = ""
+        try:
+            if job.image is not None:
+                # Parsed straight from the job; the database hands back a
+                # memoryview (bytes on SQLite) that is used without copying
+                content, filename = job.image, job.image_name
+            else:
+                content = parser.read_image(scorecard_upload.scorecard_image)
+                filename = scorecard_upload.scorecard_image.name
+
+            scorecard_data, raw_json = None, None
+            if content:
+                scorecard_data, raw_json = parser.parse_scorecard_bytes(
+                    content, filename, user
+                )
+
+            # Save the raw JSON data for debugging
+            if raw_json:
+                scorecard_upload.parsed_data = raw_json
+                scorecard_upload.save(update_fields=["parsed_data"])
+
+            if not scorecard_data:
+                error = "The scorecard image could not be parsed"
+            elif not ScorecardImportService.create_round_from_scorecard_data(
+                user=user,
+                scorecard_upload=scorecard_upload,
+                scorecard_data=scorecard_data,
+            ):
+                error = "A round could not be created from the parsed data"
+                # Don't serve the same unusable parse to a re-upload
+                ScorecardParseCache.discard(user, ScorecardParseCache.key(content))
+        except Exception as e:
+            logger.exception(f"Parse job {job.id} failed")
+            error = str(e) or e.__class__.__name__
+
+        job.status = ScorecardParseJob.FAILED if error else ScorecardParseJob.SUCCEEDED
+        job.error = error
+        job.finished_at = timezone.now()
+        job.save(update_fields=["status", "error", "finished_at"])
+
+        # The job is finished either way, so the image moves to the upload
+        ScorecardParseJobService._release_image(job)
+
+        if error:
+            logger.warning(
+                f"Scorecard parsing failed for upload {scorecard_upload.id}: {error}"
+            )
+        else:
+            logger.info(
+                f"Scorecard parsed and round created for upload {scorecard_upload.id}"
+            )
+        return job
+
+    @staticmethod
+    def _release_image(job: ScorecardParseJob) -> None:
+        """
+        Move a finished job's image to the upload's storage, off the request
+        path. A storage error is logged and leaves the image on the job rather
+        than losing it, and doesn't change the job's outcome.
+        """
+        if job.image is None:
+            return
+        try:
+            ScorecardParseJobService._store_image(job)
+        except Exception:
+            logger.exception(f"Storing the image of parse job {job.id} failed")
+
+    @staticmethod
+    def _store_image(job: ScorecardParseJob) -> None:
+        """Write the job's image to the upload's storage and drop it from the job."""
+        scorecard_upload = job.scorecard_upload
+        scorecard_upload.scorecard_image.save(
+            job.image_name, ContentFile(bytes(job.image)), save=False
+        )
+        scorecard_upload.save(update_fields=["scorecard_image"])
+        job.image = None
+        job.save(update_fields=["image"])
+
+    @staticmethod
+    def run_pending(
+        parser: Optional[ScorecardParserService] = None,
+        limit: Optional[int] = None,
+        concurrency: int = 1,
+    ) -> int:
+        """
+        Run queued jobs until none are left (or `limit` ran); returns the count.
+
+        A job's time is nearly all spent waiting on the LLM, so with
+        `concurrency` above 1 that many jobs run at once, each thread with
+        its own database connection. This is also the cap on LLM requests
+        in flight from this worker.
+        """
+        claim = ScorecardParseJobService._claimer(limit)
+        if concurrency <= 1:
+            return ScorecardParseJobService._run_jobs(parser, claim)
+
+        def run_jobs():
+            try:
+                return ScorecardParseJobService._run_jobs(parser, claim)
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = [executor.submit(run_jobs) for _ in range(concurrency)]
+        return sum(future.result() for future in futures)
+
+    @staticmethod
+    def _claimer(
+        limit: Optional[int],
+    ) -> Callable[[], Optional[ScorecardParseJob]]:
+        """claim_next(), returning None once `limit` jobs have been claimed."""
+        lock = threading.Lock()
+        claimed = 0
+
+        def claim():
+            nonlocal claimed
+            with lock:
+                if limit is not None and claimed >= limit:
+                    return None
+                claimed += 1
+            job = ScorecardParseJobService.claim_next()
+            if job is None:
+                with lock:
+                    claimed -= 1
+            return job
+
+        return claim
+
+    @staticmethod
+    def _run_jobs(
+        parser: Optional[ScorecardParserService],
+        claim: Callable[[], Optional[ScorecardParseJob]],
+    ) -> int:
+        ran = 0
+        while (job := claim()) is not None:
+            ScorecardParseJobService.run(job, parser)
+            ran += 1
+        return ran
@@ -0,0 +1,308 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.utils import timezone
+
+from birdie_buddy.round_entry.models import (
+    Hole,
+    ScorecardParseCacheEntry,
+    ScorecardParseJob,
+    ScorecardUpload,
+    ScorecardUploadBatch,
+)
+from birdie_buddy.round_entry.services.fake_scorecard_client import (
+    FakeScorecardClient,
+)
+from birdie_buddy.round_entry.services.scorecard_parse_job_service import (
+    ScorecardParseJobService,
+)
+from birdie_buddy.round_entry.services.scorecard_parser_service import (
+    ScorecardParserService,
+)
+
+
+def queued_upload(user, course_name="Test Course"):
+    scorecard_upload = ScorecardUpload.objects.create(
+        user=user,
+        course_name=course_name,
+        scorecard_image=SimpleUploadedFile("card.jpg", b"image", "image/jpeg"),
+    )
+    ScorecardParseJobService.enqueue(scorecard_upload)
+    return scorecard_upload
+
+
+def queued_upload_with_image(user, content=b"processed image"):
+    """Queued the way the upload view does it: the image is on the job."""
+    scorecard_upload = ScorecardUpload.objects.create(
+        user=user, course_name="Test Course"
+    )
+    ScorecardParseJobService.enqueue(
+        scorecard_upload, SimpleUploadedFile("card.jpg", content, "image/jpeg")
+    )
+    return scorecard_upload
+
+
+def fake_parser(response=None):
+    return ScorecardParserService(client=FakeScorecardClient(response=response))
+
+
+@pytest.mark.django_db
+class TestScorecardParseJobService:
+    def test_enqueue_queues_a_job(self, user):
+        scorecard_upload = queued_upload(user)
+
+        job = scorecard_upload.parse_job
+        assert job.status == ScorecardParseJob.QUEUED
+        assert job.is_pending
+        assert scorecard_upload.round is None
+
+    def test_claims_oldest_job_first(self, user):
+        first, second = queued_upload(user, "First"), queued_upload(user, "Second")
+
+        claimed = [ScorecardParseJobService.claim_next() for _ in range(3)]
+
+        assert [job.scorecard_upload for job in claimed[:2]] == [first, second]
+        assert claimed[2] is None
+        assert claimed[0].status == ScorecardParseJob.RUNNING
+        assert claimed[0].attempts == 1
+        assert claimed[0].started_at is not None
+
+    def test_run_imports_the_round(self, user):
+        scorecard_upload = queued_upload(user)
+        parser = fake_parser()
+
+        job = ScorecardParseJobService.run(ScorecardParseJobService.claim_next(), parser)
+
+        scorecard_upload.refresh_from_db()
+        assert job.status == ScorecardParseJob.SUCCEEDED
+        assert job.finished_at is not None
+        assert scorecard_upload.round.course_name == "Test Course"
+        assert scorecard_upload.parsed_data["holes"][0]["par"] == 4
+        assert Hole.objects.filter(round=scorecard_upload.round).count() == 2
+        assert parser.client.calls[0]["messages"][0]["content"][0]["type"] == "image"
+
+    def test_parses_the_image_on_the_job_then_stores_it(self, user):
+        scorecard_upload = queued_upload_with_image(user)
+        parser = fake_parser()
+
+        with patch.object(parser, "read_image") as read_image:
+            job = ScorecardParseJobService.run(
+                ScorecardParseJobService.claim_next(), parser
+            )
+
+        read_image.assert_not_called()
+        scorecard_upload.refresh_from_db()
+        assert job.status == ScorecardParseJob.SUCCEEDED
+        assert scorecard_upload.round is not None
+        assert scorecard_upload.scorecard_image.read() == b"processed image"
+        assert ScorecardParseJob.objects.get(pk=job.pk).image is None
+
+    def test_failed_job_still_stores_its_image(self, user):
+        scorecard_upload = queued_upload_with_image(user)
+        parser = fake_parser()
+
+        with patch.object(
+            parser, "parse_scorecard_bytes", side_effect=RuntimeError("boom")
+        ):
+            job = ScorecardParseJobService.run(
+                ScorecardParseJobService.claim_next(), parser
+            )
+
+        scorecard_upload.refresh_from_db()
+        assert job.status == ScorecardParseJob.FAILED
+        assert scorecard_upload.scorecard_image.read() == b"processed image"
+        assert ScorecardParseJob.objects.get(pk=job.pk).image is None
+
+    def test_storage_error_keeps_a_successful_parse(self, user):
+        scorecard_upload = queued_upload_with_image(user)
+
+        with patch.object(
+            ScorecardParseJobService, "_store_image", side_effect=OSError("down")
+        ):
+            job = ScorecardParseJobService.run(
+                ScorecardParseJobService.claim_next(), fake_parser()
+            )
+
+        scorecard_upload.refresh_from_db()
+        assert job.status == ScorecardParseJob.SUCCEEDED
+        assert scorecard_upload.round is not None
+        # Kept on the job rather than lost
+        assert bytes(ScorecardParseJob.objects.get(pk=job.pk).image) == (
+            b"processed image"
+        )
+
+    def test_unreadable_response_fails_the_job(self, user):
+        scorecard_upload = queued_upload(user)
+
+        job = ScorecardParseJobService.run(
+            ScorecardParseJobService.claim_next(), fake_parser("not json")
+        )
+
+        scorecard_upload.refresh_from_db()
+        assert job.status == ScorecardParseJob.FAILED
+        assert job.error
+        assert scorecard_upload.round is None
+
+    def test_failed_import_discards_the_cached_parse(self, user):
+        bad_card = {
+            "holes": [
+                {
+                    "number": 1,
+                    "par": 4,
+                    "shots": [{"number": 1, "start_distance": 5000, "lie": "tee"}],
+                }
+            ]
+        }
+        queued_upload(user)
+
+        job = ScorecardParseJobService.run(
+            ScorecardParseJobService.claim_next(), fake_parser(bad_card)
+        )
+
+        assert job.status == ScorecardParseJob.FAILED
+        assert not ScorecardParseCacheEntry.objects.exists()
+
+    def test_stale_running_job_is_claimed_again(self, user):
+        queued_upload(user)
+        job = ScorecardParseJobService.claim_next()
+        assert ScorecardParseJobService.claim_next() is None
+
+        ScorecardParseJob.objects.filter(pk=job.pk).update(
+            started_at=timezone.now() - timedelta(hours=1)
+        )
+
+        reclaimed = ScorecardParseJobService.claim_next()
+        assert reclaimed.pk == job.pk
+        assert reclaimed.attempts == 2
+
+    def test_gives_up_after_max_attempts(self, user):
+        scorecard_upload = queued_upload(user)
+        ScorecardParseJob.objects.filter(scorecard_upload=scorecard_upload).update(
+            attempts=ScorecardParseJobService.MAX_ATTEMPTS
+        )
+
+        assert ScorecardParseJobService.claim_next() is None
+
+        job = ScorecardParseJob.objects.get(scorecard_upload=scorecard_upload)
+        assert job.status == ScorecardParseJob.FAILED
+        assert not job.is_pending
+
+    def test_giving_up_stores_the_image(self, user):
+        scorecard_upload = queued_upload_with_image(user)
+        ScorecardParseJob.objects.filter(scorecard_upload=scorecard_upload).update(
+            attempts=ScorecardParseJobService.MAX_ATTEMPTS
+        )
+
+        assert ScorecardParseJobService.claim_next() is None
+
+        scorecard_upload.refresh_from_db()
+        job = ScorecardParseJob.objects.get(scorecard_upload=scorecard_upload)
+        assert job.status == ScorecardParseJob.FAILED
+        assert job.image is None
+        assert scorecard_upload.scorecard_image.read() == b"processed image"
+
+    def test_run_pending_drains_the_queue(self, user):
+        uploads = [queued_upload(user, f"Course {i}") for i in range(3)]
+
+        assert ScorecardParseJobService.run_pending(fake_parser(), limit=2) == 2
+        assert ScorecardParseJobService.run_pending(fake_parser()) == 1
+
+        assert all(
+            ScorecardUpload.objects.get(pk=upload.pk).round_id for upload in uploads
+        )
+
+    def test_enqueue_batch(self, user):
+        batch = ScorecardParseJobService.enqueue_batch(
+            user,
+            [
+                ("day one.HEIC", SimpleUploadedFile("day one.jpg", b"one")),
+                ("notes.txt", None),
+            ],
+        )
+
+        first, second = batch.uploads.order_by("id")
+        assert batch.user == user
+        assert first.course_name == "day one"
+        assert first.parse_job.status == ScorecardParseJob.QUEUED
+        assert bytes(first.parse_job.image) == b"one"
+        assert second.parse_job.status == ScorecardParseJob.FAILED
+        assert "notes.txt" in second.parse_job.error
+
+    def test_enqueue_batch_with_course_name(self, user):
+        batch = ScorecardParseJobService.enqueue_batch(
+            user,
+            [("a.jpg", SimpleUploadedFile("a.jpg", b"a"))],
+            course_name="Pebble Beach",
+        )
+
+        assert batch.uploads.get().course_name == "Pebble Beach"
+        assert ScorecardUploadBatch.objects.count() == 1
+
+
+class TestRunPendingConcurrently:
+    @staticmethod
+    def run_fake_jobs(count, client, **kwargs):
+        """run_pending over `count` stand-in jobs, each one LLM call."""
+        jobs = list(range(count))
+
+        def claim_next():
+            try:
+                return jobs.pop(0)
+            except IndexError:
+                return None
+
+        with (
+            patch.object(ScorecardParseJobService, "claim_next", claim_next),
+            patch.object(
+                ScorecardParseJobService,
+                "run",
+                side_effect=lambda job, parser: client.messages.create(),
+            ),
+        ):
+            return ScorecardParseJobService.run_pending(**kwargs), jobs
+
+    def test_runs_jobs_at_once_up_to_the_concurrency(self):
+        client = FakeScorecardClient(delay=0.1)
+
+        ran, left = self.run_fake_jobs(5, client, concurrency=2)
+
+        assert ran == 5
+        assert left == []
+        assert client.max_in_flight == 2
+
+    def test_limit_is_shared_between_threads(self):
+        client = FakeScorecardClient()
+
+        ran, left = self.run_fake_jobs(4, client, limit=3, concurrency=2)
+
+        assert ran == 3
+        assert len(left) == 1
+
+    def test_one_job_at_a_time_by_default(self):
+        client = FakeScorecardClient(delay=0.05)
+
+        ran, _ = self.run_fake_jobs(3, client)
+
+        assert ran == 3
+        assert client.max_in_flight == 1
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.skipif(
+    not connection.features.has_select_for_update_skip_locked,
+    reason="Concurrent workers claim jobs with SELECT ... FOR UPDATE SKIP LOCKED",
+)
+def test_run_pending_concurrently_imports_every_round(user):
+    uploads = [queued_upload_with_image(user, f"image {i}".encode()) for i in range(5)]
+    client = FakeScorecardClient(delay=0.2)
+
+    ran = ScorecardParseJobService.run_pending(
+        ScorecardParserService(client=client), concurrency=2
+    )
+
+    assert ran == 5
+    assert client.max_in_flight == 2
+    assert all(ScorecardUpload.objects.get(pk=upload.pk).round_id for upload in uploads)
@@ -1,12 +1,18 @@
 import base64
+import io
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Optional
 
 import anthropic
 from django.conf import settings
 from django.core.files.storage import default_storage
+from django.utils.module_loading import import_string
+from PIL import Image
+
+from birdie_buddy.round_entry.services.scorecard_parse_cache import ScorecardParseCache
 
 logger = logging.getLogger(__name__)
 
@@ -42,57 +48,227 @@ class ScorecardData:
 
 
 class ScorecardParserService:
-    """Service for parsing scorecard images using Anthropic's Claude multimodal LLM."""
+    """
+    Service for parsing scorecard images using Anthropic's Claude multimodal LLM.
+
+    In split mode (the SCORECARD_PARSE_SPLIT setting) the card is cut in two
+    across its hole columns and the halves are parsed concurrently. The
+    response, which dominates the latency, is then about half as long. The
+    halves are merged by hole number. Unless every half has holes and
+    together they make a full 18 without a gap, the whole card is parsed in
+    one request instead: a half that came back empty can't be told apart
+    from holes that weren't played.
+    """
 
     VALID_LIES = ["tee", "fairway", "rough", "recovery", "penalty", "sand", "green"]
-
-    def __init__(self, client: Optional[anthropic.Anthropic] = None):
+    DEFAULT_PROMPT = (
+        "Please parse this golf scorecard image and extract the hole and shot "
+        "data as JSON."
+    )
+    SPLIT_PROMPT = (
+        "This image is part {part} of {parts} of a golf scorecard, cut across "
+        "the hole columns. Please extract the hole and shot data as JSON for "
+        "only the holes whose column is fully visible in this part."
+    )
+    SPLIT_PARTS = 2
+    # Each part reaches this fraction of the card past its cut, so a hole
+    # column on a cut is whole in one of the parts
+    SPLIT_OVERLAP = 0.05
+    # Holes a merged split parse must cover
+    CARD_HOLES = 18
+
+    def __init__(
+        self, client: Optional[anthropic.Anthropic] = None, split: Optional[bool] = None
+    ):
         self.api_key = getattr(settings, "ANTHROPIC_API_KEY", None)
-        self.client = client or anthropic.Anthropic(api_key=self.api_key)
+        self.client = client or self._default_client()
         self.model = "claude-sonnet-4-20250514"
-
-    def parse_scorecard_image(self, image_field) -> tuple[Optional[ScorecardData], Optional[dict]]:
+        self.split = (
+            getattr(settings, "SCORECARD_PARSE_SPLIT", False) if split is None else split
+        )
+
+    def _default_client(self):
+        """The SCORECARD_PARSER_CLIENT class when set (e.g. a fake in tests)."""
+        client_path = getattr(settings, "SCORECARD_PARSER_CLIENT", None)
+        if client_path:
+            return import_string(client_path)(api_key=self.api_key)
+        return anthropic.Anthropic(api_key=self.api_key)
+
+    def parse_scorecard_image(
+        self, image_field, user=None
+    ) -> tuple[Optional[ScorecardData], Optional[dict]]:
         """
-        Parse a scorecard image using Anthropic's Claude multimodal LLM.
+        Parse a scorecard image in storage using Anthropic's Claude multimodal LLM.
 
         Args:
             image_field: Django ImageField instance (e.g., scorecard_upload.scorecard_image)
+            user: The uploading user, to enable the parse cache
 
         Returns:
             Tuple of (ScorecardData object, raw JSON dict) or (None, None) if parsing fails
         """
-        if not self.api_key:
-            logger.warning("Anthropic API key not configured")
+        # Read the image
+        content = self.read_image(image_field)
+        if not content:
             return None, None
+        return self.parse_scorecard_bytes(content, image_field.name, user)
+
+    def parse_scorecard_bytes(
+        self, content: bytes | memoryview, filename: str, user=None
+    ) -> tuple[Optional[ScorecardData], Optional[dict]]:
+        """
+        Parse scorecard image bytes already in memory, e.g. the processed
+        upload, without a round trip through storage.
+
+        With a user, a parse of the same image the user uploaded before is
+        reused from ScorecardParseCache and the LLM is not called; new parses
+        are stored there.
 
+        Args:
+            content: The image bytes, or a memoryview of them
+            filename: The image's file name, for its media type
+            user: The uploading user, to enable the parse cache
+
+        Returns:
+            Tuple of (ScorecardData object, raw JSON dict) or (None, None) if parsing fails
+        """
         try:
-            # Read and encode the image
-            image_base64 = self._encode_image(image_field)
-            if not image_base64:
+            key = None
+            if user is not None:
+                key = ScorecardParseCache.key(content)
+                cached = ScorecardParseCache.get(user, key)
+                if cached is not None:
+                    logger.info(f"Parse cache hit for {filename}")
+                    return self._parse_data(cached)
+
+            if not self.api_key and isinstance(self.client, anthropic.Anthropic):
+                logger.warning("Anthropic API key not configured")
                 return None, None
 
-            # Get the media type
-            media_type = self._get_media_type(image_field.name)
+            scorecard_data, data = None, None
+            if self.split:
+                scorecard_data, data = self._parse_split(content)
 
-            # Call the LLM
-            response = self._call_llm(image_base64, media_type)
-            print(response)
-            if not response:
-                return None, None
+            if scorecard_data is None:
+                image_base64 = base64.b64encode(content).decode("utf-8")
+
+                # Get the media type
+                media_type = self._get_media_type(filename)
+
+                # Call the LLM
+                response = self._call_llm(image_base64, media_type)
+                print(response)
+                if not response:
+                    return None, None
 
-            # Parse the response into structured data
-            return self._parse_response(response)
+                # Parse the response into structured data
+                scorecard_data, data = self._parse_response(response)
+
+            if scorecard_data and key is not None:
+                ScorecardParseCache.set(user, key, data)
+            return scorecard_data, data
 
         except Exception as e:
             logger.error(f"Error parsing scorecard image: {str(e)}")
             return None, None
 
-    def _encode_image(self, image_field) -> Optional[str]:
-        """Read and base64 encode an image from storage."""
+    def _parse_split(
+        self, content: bytes | memoryview
+    ) -> tuple[Optional[ScorecardData], Optional[dict]]:
+        """
+        Parse the card's parts concurrently and merge them, or (None, None)
+        when a part fails or the merged holes aren't a full card.
+        """
+        try:
+            parts = self._split_image(content)
+        except Exception as e:
+            logger.warning(f"Could not split the scorecard image: {str(e)}")
+            return None, None
+        prompts = [
+            self.SPLIT_PROMPT.format(part=number, parts=len(parts))
+            for number in range(1, len(parts) + 1)
+        ]
+
+        with ThreadPoolExecutor(max_workers=len(parts)) as executor:
+            responses = list(
+                executor.map(
+                    lambda part, prompt: self._call_llm(
+                        base64.b64encode(part).decode("utf-8"), "image/jpeg", prompt
+                    ),
+                    parts,
+                    prompts,
+                )
+            )
+
+        parsed = []
+        for response in responses:
+            data = self._parse_response(response)[1] if response else None
+            if data is None:
+                logger.warning("Split parse failed; parsing the whole card")
+                return None, None
+            parsed.append(data)
+
+        data = self._merge_parts(parsed)
+        if data is None:
+            logger.warning(
+                "Split parse holes aren't a full card; parsing the whole card"
+            )
+            return None, None
+        return self._parse_data(data)
+
+    def _split_image(self, content: bytes | memoryview) -> list[bytes]:
+        """The card cut into SPLIT_PARTS JPEGs along its longer side."""
+        image = Image.open(io.BytesIO(content))
+        image = image.convert("RGB")
+        horizontal = image.width >= image.height
+        length = image.width if horizontal else image.height
+        overlap = round(length * self.SPLIT_OVERLAP)
+
+        parts = []
+        for index in range(self.SPLIT_PARTS):
+            start = max(0, length * index // self.SPLIT_PARTS - overlap)
+            end = min(length, length * (index + 1) // self.SPLIT_PARTS + overlap)
+            box = (
+                (start, 0, end, image.height)
+                if horizontal
+                else (0, start, image.width, end)
+            )
+            output = io.BytesIO()
+            image.crop(box).save(output, format="JPEG", quality=90)
+            parts.append(output.getvalue())
+        return parts
+
+    @classmethod
+    def _merge_parts(cls, parts: list[dict]) -> Optional[dict]:
+        """
+        The parts' holes in one card, ordered by number, or None unless every
+        part has holes and together they number 1 to CARD_HOLES. A hole in
+        two parts (it sat on the overlap) keeps the reading with more shots,
+        the other likely cut off.
+        """
+        holes: dict[int, dict] = {}
+        for part in parts:
+            if not part.get("holes"):
+                return None
+            for hole in part["holes"]:
+                number = hole.get("number")
+                if not isinstance(number, int):
+                    return None
+                if number not in holes or len(hole.get("shots", [])) > len(
+                    holes[number].get("shots", [])
+                ):
+                    holes[number] = hole
+
+        numbers = sorted(holes)
+        if numbers != list(range(1, cls.CARD_HOLES + 1)):
+            return None
+        return {"holes": [holes[number] for number in numbers]}
+
+    def read_image(self, image_field) -> Optional[bytes]:
+        """Read an image from storage."""
         try:
             with default_storage.open(image_field.name, "rb") as image_file:
-                content = image_file.read()
-            return base64.b64encode(content).decode("utf-8")
+                return image_file.read()
         except FileNotFoundError:
             logger.error(f"Image file not found: {image_field.name}")
             return None
@@ -156,7 +332,9 @@ Important:
 - Be consistent with lie types based on the scorecard notation
 - Return ONLY the JSON object, no additional text or markdown formatting"""
 
-    def _call_llm(self, image_base64: str, media_type: str) -> Optional[str]:
+    def _call_llm(
+        self, image_base64: str, media_type: str, prompt: Optional[str] = None
+    ) -> Optional[str]:
         """Call Anthropic's Claude multimodal LLM with the scorecard image."""
         try:
             message = self.client.messages.create(
@@ -176,7 +354,7 @@ Important:
                             },
                             {
                                 "type": "text",
-                                "text": "Please parse this golf scorecard image and extract the hole and shot data as JSON.",
+                                "text": prompt or self.DEFAULT_PROMPT,
                             },
                         ],
                     }
@@ -210,7 +388,16 @@ Important:
             cleaned_response = cleaned_response.strip()
 
             data = json.loads(cleaned_response)
+            return self._parse_data(data)
+
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse LLM response as JSON: {str(e)}")
+            logger.error(f"Response was: {response}")
+            return None, None
 
+    def _parse_data(self, data: dict) -> tuple[Optional[ScorecardData], Optional[dict]]:
+        """Build ScorecardData from the parsed JSON and return it with the JSON."""
+        try:
             holes = []
 
             for hole_data in data.get("holes", []):
@@ -241,10 +428,6 @@ Important:
             scorecard_data = ScorecardData(holes=holes)
             return scorecard_data, data
 
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse LLM response as JSON: {str(e)}")
-            logger.error(f"Response was: {response}")
-            return None, None
         except Exception as e:
             logger.error(f"Error parsing LLM response: {str(e)}")
             return None, None
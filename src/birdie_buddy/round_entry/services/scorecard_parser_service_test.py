@@ -0,0 +1,263 @@
+import base64
+import io
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
+
+from birdie_buddy.round_entry.models import ScorecardUpload
+from birdie_buddy.round_entry.services.fake_scorecard_client import (
+    SCORECARD,
+    FakeScorecardClient,
+)
+from birdie_buddy.round_entry.services.scorecard_parse_cache import ScorecardParseCache
+from birdie_buddy.round_entry.services.scorecard_parse_cache_test import (
+    scorecard_photo,
+)
+from birdie_buddy.round_entry.services.scorecard_parser_service import (
+    ScorecardParserService,
+)
+from birdie_buddy.users.factories import UserFactory
+
+
+def upload(user, content):
+    return ScorecardUpload.objects.create(
+        user=user,
+        course_name="Test Course",
+        scorecard_image=SimpleUploadedFile("card.jpg", content, "image/jpeg"),
+    )
+
+
+@pytest.mark.django_db
+class TestScorecardParserService:
+    def test_parses_the_llm_response(self, user):
+        client = FakeScorecardClient()
+        parser = ScorecardParserService(client=client)
+
+        scorecard_data, raw_json = parser.parse_scorecard_image(
+            upload(user, scorecard_photo()).scorecard_image
+        )
+
+        assert raw_json == SCORECARD
+        assert [hole.score for hole in scorecard_data.holes] == [5, 4]
+        assert scorecard_data.holes[1].shots[1].lie == "rough"
+        assert len(client.calls) == 1
+
+    def test_reupload_is_served_from_the_cache(self, user):
+        client = FakeScorecardClient()
+        parser = ScorecardParserService(client=client)
+
+        first = parser.parse_scorecard_image(
+            upload(user, scorecard_photo()).scorecard_image, user=user
+        )
+        again = parser.parse_scorecard_image(
+            upload(user, scorecard_photo()).scorecard_image, user=user
+        )
+
+        assert first == again
+        assert len(client.calls) == 1
+
+    def test_re_encoded_reupload_with_perceptual_hash(self, user, monkeypatch):
+        monkeypatch.setattr(ScorecardParseCache, "PERCEPTUAL", True)
+        client = FakeScorecardClient()
+        parser = ScorecardParserService(client=client)
+
+        parser.parse_scorecard_image(
+            upload(user, scorecard_photo()).scorecard_image, user=user
+        )
+        parser.parse_scorecard_image(
+            upload(user, scorecard_photo(quality=60)).scorecard_image, user=user
+        )
+
+        assert len(client.calls) == 1
+
+    def test_other_users_do_not_share_parses(self, user):
+        client = FakeScorecardClient()
+        parser = ScorecardParserService(client=client)
+        other_user = UserFactory()
+
+        parser.parse_scorecard_image(
+            upload(user, scorecard_photo()).scorecard_image, user=user
+        )
+        parser.parse_scorecard_image(
+            upload(other_user, scorecard_photo()).scorecard_image, user=other_user
+        )
+
+        assert len(client.calls) == 2
+
+    def test_failed_parse_is_not_cached(self, user):
+        client = FakeScorecardClient(response="not json")
+        parser = ScorecardParserService(client=client)
+
+        for _ in range(2):
+            assert parser.parse_scorecard_image(
+                upload(user, scorecard_photo()).scorecard_image, user=user
+            ) == (None, None)
+
+        assert len(client.calls) == 2
+
+    def test_missing_image(self, user):
+        scorecard_upload = ScorecardUpload.objects.create(
+            user=user, course_name="Test Course", scorecard_image="missing.jpg"
+        )
+        client = FakeScorecardClient()
+
+        result = ScorecardParserService(client=client).parse_scorecard_image(
+            scorecard_upload.scorecard_image, user=user
+        )
+
+        assert result == (None, None)
+        assert client.calls == []
+
+
+def card(*numbers, shots=2):
+    return {
+        "holes": [
+            {
+                "number": number,
+                "par": 4,
+                "shots": [
+                    {"number": shot, "start_distance": 100, "lie": "fairway"}
+                    for shot in range(1, shots + 1)
+                ],
+            }
+            for number in numbers
+        ]
+    }
+
+
+def by_part(*cards):
+    """A FakeScorecardClient response giving each split part its own card."""
+
+    def response(**kwargs):
+        prompt = kwargs["messages"][0]["content"][1]["text"]
+        for part, part_card in enumerate(cards, start=1):
+            if f"part {part} of" in prompt:
+                return part_card
+        return card(*range(1, 19))
+
+    return response
+
+
+def sent_image(call) -> Image.Image:
+    data = call["messages"][0]["content"][0]["source"]["data"]
+    return Image.open(io.BytesIO(base64.b64decode(data)))
+
+
+class TestSplitParsing:
+    def test_parses_halves_concurrently_and_merges_them(self):
+        client = FakeScorecardClient(
+            response=by_part(card(*range(1, 10)), card(*range(10, 19))), delay=0.1
+        )
+        parser = ScorecardParserService(client=client, split=True)
+
+        scorecard_data, raw_json = parser.parse_scorecard_bytes(
+            scorecard_photo(), "card.jpg"
+        )
+
+        assert [hole.number for hole in scorecard_data.holes] == list(range(1, 19))
+        assert raw_json == card(*range(1, 19))
+        assert len(client.calls) == 2
+        assert client.max_in_flight == 2
+        # Each half of the 600 pixel wide card, plus a 30 pixel overlap
+        assert [sent_image(call).size for call in client.calls] == [(330, 400)] * 2
+
+    def test_hole_on_the_cut_keeps_the_reading_with_more_shots(self):
+        client = FakeScorecardClient(
+            response=by_part(
+                card(*range(1, 10), shots=4),
+                {"holes": card(9, shots=1)["holes"] + card(*range(10, 19))["holes"]},
+            )
+        )
+        parser = ScorecardParserService(client=client, split=True)
+
+        scorecard_data, _ = parser.parse_scorecard_bytes(scorecard_photo(), "card.jpg")
+
+        assert [hole.number for hole in scorecard_data.holes] == list(range(1, 19))
+        assert scorecard_data.holes[8].score == 4
+        assert len(client.calls) == 2
+
+    def test_gap_between_halves_falls_back_to_the_whole_card(self):
+        client = FakeScorecardClient(response=by_part(card(1, 2, 3), card(5, 6)))
+        parser = ScorecardParserService(client=client, split=True)
+
+        scorecard_data, _ = parser.parse_scorecard_bytes(scorecard_photo(), "card.jpg")
+
+        assert [hole.number for hole in scorecard_data.holes] == list(range(1, 19))
+        assert len(client.calls) == 3
+        whole_card = client.calls[-1]
+        assert (
+            whole_card["messages"][0]["content"][1]["text"]
+            == ScorecardParserService.DEFAULT_PROMPT
+        )
+
+    def test_empty_half_falls_back_to_the_whole_card(self):
+        client = FakeScorecardClient(
+            response=by_part(card(*range(1, 10)), {"holes": []})
+        )
+        parser = ScorecardParserService(client=client, split=True)
+
+        scorecard_data, _ = parser.parse_scorecard_bytes(scorecard_photo(), "card.jpg")
+
+        assert scorecard_data.holes_played == 18
+        assert len(client.calls) == 3
+
+    def test_failed_half_falls_back_to_the_whole_card(self):
+        client = FakeScorecardClient(response=by_part(card(1, 2), "not json"))
+        parser = ScorecardParserService(client=client, split=True)
+
+        scorecard_data, _ = parser.parse_scorecard_bytes(scorecard_photo(), "card.jpg")
+
+        assert scorecard_data.holes_played == 18
+        assert len(client.calls) == 3
+
+    def test_enabled_by_setting(self, settings):
+        settings.SCORECARD_PARSE_SPLIT = True
+        client = FakeScorecardClient(
+            response=by_part(card(*range(1, 10)), card(*range(10, 19)))
+        )
+
+        ScorecardParserService(client=client).parse_scorecard_bytes(
+            scorecard_photo(), "card.jpg"
+        )
+
+        assert len(client.calls) == 2
+
+    def test_off_by_default(self):
+        client = FakeScorecardClient()
+
+        ScorecardParserService(client=client).parse_scorecard_bytes(
+            scorecard_photo(), "card.jpg"
+        )
+
+        assert len(client.calls) == 1
+
+    def test_portrait_card_is_cut_across_its_height(self):
+        output = io.BytesIO()
+        Image.new("RGB", (300, 400), "white").save(output, format="JPEG")
+        parser = ScorecardParserService(client=FakeScorecardClient(), split=True)
+
+        parts = parser._split_image(output.getvalue())
+
+        assert [Image.open(io.BytesIO(part)).size for part in parts] == [(300, 220)] * 2
+
+    @pytest.mark.parametrize(
+        "parts",
+        [
+            [{"holes": []}, {"holes": []}],
+            [card(*range(1, 19)), {"holes": []}],
+            [card(*range(1, 10)), {}],
+            [card(*range(1, 9)), card(*range(10, 19))],
+            [card(*range(1, 10)), card(10, 11)],
+            [card(1), {"holes": [{"number": "two", "shots": []}]}],
+        ],
+    )
+    def test_merge_rejects_missing_or_partial_holes(self, parts):
+        assert ScorecardParserService._merge_parts(parts) is None
+
+    def test_merge_accepts_a_full_card(self):
+        merged = ScorecardParserService._merge_parts(
+            [card(*range(1, 11)), card(*range(10, 19))]
+        )
+
+        assert [hole["number"] for hole in merged["holes"]] == list(range(1, 19))
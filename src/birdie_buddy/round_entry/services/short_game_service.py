@@ -1,9 +1,17 @@
 from typing import NamedTuple
 
-from django.db.models import Count, Sum
-
-from birdie_buddy.round_entry.models import Hole, Shot
+from django.db.models import Avg, Count, Sum
+
+from birdie_buddy.round_entry.models import Hole, Shot, ShotBucketAggregate
+from birdie_buddy.round_entry.services.avg_strokes_to_holeout import DEFAULT_BASELINE
+from birdie_buddy.round_entry.services.baseline_shots import BaselineStatsMixin
+from birdie_buddy.round_entry.services.bucket_aggregator import (
+    BucketAggregator,
+    ShotBucket,
+)
 from birdie_buddy.round_entry.services.proximity_calculator import ProximityCalculator
+from birdie_buddy.round_entry.services.stats_window import StatsWindow
+from birdie_buddy.round_entry.services.user_stats_snapshot import UserStatsSnapshot
 
 
 class ShortGameStats(NamedTuple):
@@ -30,9 +38,52 @@ class ShortGameStats(NamedTuple):
     strokes_gained_sand_per_18: float
 
 
-class ShortGameService:
-    def __init__(self):
+class RoundShortGameStats(NamedTuple):
+    avg_proximity_0_10_fairway: float
+    avg_proximity_0_10_rough: float
+    avg_proximity_10_20_fairway: float
+    avg_proximity_10_20_rough: float
+    avg_proximity_20_30_fairway: float
+    avg_proximity_20_30_rough: float
+    avg_proximity_sand: float
+    two_chip_pct_0_10_fairway: float
+    two_chip_pct_0_10_rough: float
+    two_chip_pct_10_20_fairway: float
+    two_chip_pct_10_20_rough: float
+    two_chip_pct_20_30_fairway: float
+    two_chip_pct_20_30_rough: float
+    two_chip_pct_sand: float
+    strokes_gained_0_10_fairway: float
+    strokes_gained_0_10_rough: float
+    strokes_gained_10_20_fairway: float
+    strokes_gained_10_20_rough: float
+    strokes_gained_20_30_fairway: float
+    strokes_gained_20_30_rough: float
+    strokes_gained_sand: float
+
+
+class ShortGameService(BaselineStatsMixin):
+    BUCKETS = {
+        "0_10_fairway": ShotBucket("around_green", 0, 10, "fairway"),
+        "0_10_rough": ShotBucket("around_green", 0, 10, "rough"),
+        "10_20_fairway": ShotBucket("around_green", 10, 20, "fairway"),
+        "10_20_rough": ShotBucket("around_green", 10, 20, "rough"),
+        "20_30_fairway": ShotBucket("around_green", 20, 30, "fairway"),
+        "20_30_rough": ShotBucket("around_green", 20, 30, "rough"),
+        "sand": ShotBucket("around_green", 0, None, "sand"),
+    }
+
+    PROXIMITY_BUCKETS = {
+        f"avg_proximity_{name}": bucket for name, bucket in BUCKETS.items()
+    }
+
+    STROKES_GAINED_BUCKETS = {
+        f"strokes_gained_{name}": bucket for name, bucket in BUCKETS.items()
+    }
+
+    def __init__(self, baseline: str = DEFAULT_BASELINE):
         self.proximity_calculator = ProximityCalculator()
+        self.baseline = baseline
 
     def avg_proximity_0_10_fairway(self, user):
         return self.proximity_calculator.calculate_avg_proximity(
@@ -130,8 +181,13 @@ class ShortGameService:
         if max_distance is not None:
             filters["start_distance__lt"] = max_distance
 
-        shots = Shot.objects.filter(**filters)
-        total_sg = shots.aggregate(total=Sum("strokes_gained"))["total"] or 0.0
+        if self.uses_default_baseline:
+            shots = Shot.objects.filter(**filters)
+            total_sg = shots.aggregate(total=Sum("strokes_gained"))["total"] or 0.0
+        else:
+            total_sg = self.baseline_shots(user).strokes_gained(
+                "around_green", min_distance, max_distance, lie=lie
+            )
 
         total_holes = Hole.objects.filter(user=user).count()
         if total_holes == 0:
@@ -160,27 +216,110 @@ class ShortGameService:
     def strokes_gained_sand(self, user):
         return self.strokes_gained_by_distance_and_lie(user, 0, None, "sand")
 
-    def get_for_user(self, user):
-        return ShortGameStats(
-            avg_proximity_0_10_fairway=self.avg_proximity_0_10_fairway(user),
-            avg_proximity_0_10_rough=self.avg_proximity_0_10_rough(user),
-            avg_proximity_10_20_fairway=self.avg_proximity_10_20_fairway(user),
-            avg_proximity_10_20_rough=self.avg_proximity_10_20_rough(user),
-            avg_proximity_20_30_fairway=self.avg_proximity_20_30_fairway(user),
-            avg_proximity_20_30_rough=self.avg_proximity_20_30_rough(user),
-            avg_proximity_sand=self.avg_proximity_sand(user),
-            two_chip_pct_0_10_fairway=self.two_chip_pct_0_10_fairway(user),
-            two_chip_pct_0_10_rough=self.two_chip_pct_0_10_rough(user),
-            two_chip_pct_10_20_fairway=self.two_chip_pct_10_20_fairway(user),
-            two_chip_pct_10_20_rough=self.two_chip_pct_10_20_rough(user),
-            two_chip_pct_20_30_fairway=self.two_chip_pct_20_30_fairway(user),
-            two_chip_pct_20_30_rough=self.two_chip_pct_20_30_rough(user),
-            two_chip_pct_sand=self.two_chip_pct_sand(user),
-            strokes_gained_0_10_fairway_per_18=self.strokes_gained_0_10_fairway(user),
-            strokes_gained_0_10_rough_per_18=self.strokes_gained_0_10_rough(user),
-            strokes_gained_10_20_fairway_per_18=self.strokes_gained_10_20_fairway(user),
-            strokes_gained_10_20_rough_per_18=self.strokes_gained_10_20_rough(user),
-            strokes_gained_20_30_fairway_per_18=self.strokes_gained_20_30_fairway(user),
-            strokes_gained_20_30_rough_per_18=self.strokes_gained_20_30_rough(user),
-            strokes_gained_sand_per_18=self.strokes_gained_sand(user),
+    def get_for_user(
+        self,
+        user,
+        snapshot: UserStatsSnapshot | None = None,
+        window: StatsWindow | None = None,
+    ) -> ShortGameStats:
+        """
+        Per 18 hole stats. With no window and the default baseline they are
+        read from the user's ShotBucketAggregate rows; otherwise from the
+        snapshot given, or one loaded for the window.
+        """
+        if snapshot is None and window is None and self.uses_default_baseline:
+            return self._get_from_aggregates(user)
+        if snapshot is None:
+            snapshot = UserStatsSnapshot.load(user, window)
+        return self._get_from_snapshot(snapshot)
+
+    def get_for_round(self, round) -> RoundShortGameStats:
+        return self.get_for_rounds([round])[round.pk]
+
+    def get_for_rounds(self, rounds) -> dict[int, RoundShortGameStats]:
+        """
+        Unscaled stats for each round, keyed by round id.
+
+        Proximity and strokes gained come from one GROUP BY round query and
+        two-chip rates from one GROUP BY hole query, however many rounds are
+        passed.
+        """
+        rounds = list(rounds)
+        shots = Shot.objects.filter(hole__round__in=rounds, shot_type="around_green")
+
+        aggregates = {"leave_feet": (Avg, self.PROXIMITY_BUCKETS)}
+        if self.uses_default_baseline:
+            aggregates["strokes_gained"] = (Sum, self.STROKES_GAINED_BUCKETS)
+        by_round = BucketAggregator.aggregate_many_by(
+            shots, "hole__round_id", aggregates
         )
+
+        # Shots per bucket on every hole, to count holes needing two chips
+        chips_per_hole = (
+            shots.values("hole__round_id", "hole_id")
+            .annotate(
+                **{
+                    name: Count("id", filter=bucket.filter())
+                    for name, bucket in self.BUCKETS.items()
+                }
+            )
+            .order_by()
+        )
+        holes = {round.pk: dict.fromkeys(self.BUCKETS, 0) for round in rounds}
+        two_chip_holes = {round.pk: dict.fromkeys(self.BUCKETS, 0) for round in rounds}
+        for row in chips_per_hole:
+            round_id = row["hole__round_id"]
+            for name in self.BUCKETS:
+                if row[name]:
+                    holes[round_id][name] += 1
+                if row[name] >= 2:
+                    two_chip_holes[round_id][name] += 1
+
+        results = {}
+        for round in rounds:
+            stats = dict.fromkeys(RoundShortGameStats._fields, 0.0)
+            stats.update(by_round.get(round.pk, {}))
+            if not self.uses_default_baseline:
+                baseline_shots = self.baseline_shots(round.user)
+                for name, bucket in self.STROKES_GAINED_BUCKETS.items():
+                    stats[name] = baseline_shots.strokes_gained(*bucket, round=round)
+            for name in self.BUCKETS:
+                round_holes = holes[round.pk][name]
+                stats[f"two_chip_pct_{name}"] = (
+                    (two_chip_holes[round.pk][name] / round_holes) * 100
+                    if round_holes
+                    else 0.0
+                )
+            results[round.pk] = RoundShortGameStats(**stats)
+        return results
+
+    def _get_from_snapshot(self, snapshot: UserStatsSnapshot) -> ShortGameStats:
+        strokes_gained = snapshot.strokes_gained(self.baseline)
+        stats = {}
+        for name, bucket in self.BUCKETS.items():
+            shots = snapshot.select(*bucket)
+            chips_per_hole = snapshot.shots_per_hole(shots).values()
+            two_chip_holes = sum(1 for count in chips_per_hole if count >= 2)
+
+            stats[f"avg_proximity_{name}"] = snapshot.mean(snapshot.leave_feet, shots)
+            stats[f"two_chip_pct_{name}"] = (
+                (two_chip_holes / len(chips_per_hole)) * 100 if chips_per_hole else 0.0
+            )
+            stats[f"strokes_gained_{name}_per_18"] = snapshot.per_18(
+                snapshot.total(strokes_gained, shots)
+            )
+        return ShortGameStats(**stats)
+
+    def _get_from_aggregates(self, user) -> ShortGameStats:
+        aggregates = ShotBucketAggregate.objects.for_user(user, "around_green")
+        total_holes = Hole.objects.filter(user=user).count()
+
+        stats = {}
+        for name in self.BUCKETS:
+            aggregate = aggregates.get(name, ShotBucketAggregate())
+            stats[f"avg_proximity_{name}"] = aggregate.avg_leave_feet
+            stats[f"two_chip_pct_{name}"] = aggregate.two_chip_pct
+            stats[f"strokes_gained_{name}_per_18"] = (
+                (aggregate.strokes_gained_sum / total_holes) * 18 if total_holes else 0.0
+            )
+        return ShortGameStats(**stats)
@@ -307,3 +307,50 @@ class TestShortGameService:
         assert stats.strokes_gained_20_30_fairway_per_18 == 0.0
         assert stats.strokes_gained_20_30_rough_per_18 == 0.0
         assert stats.strokes_gained_sand_per_18 == pytest.approx(-0.6)
+
+    def test_get_for_rounds(self, django_assert_num_queries):
+        user = UserFactory()
+        service = ShortGameService()
+        round1 = RoundFactory(user=user)
+        round2 = RoundFactory(user=user)
+
+        hole1 = HoleFactory(user=user, round=round1, par=4, number=1)
+        ShotFactory(
+            user=user,
+            hole=hole1,
+            number=1,
+            lie="rough",
+            start_distance=15,
+            strokes_gained=-0.5,
+        )
+        ShotFactory(
+            user=user,
+            hole=hole1,
+            number=2,
+            lie="rough",
+            start_distance=12,
+            strokes_gained=-0.25,
+        )
+        ShotFactory(user=user, hole=hole1, number=3, lie="green", start_distance=6)
+
+        hole2 = HoleFactory(user=user, round=round1, par=4, number=2)
+        ShotFactory(
+            user=user,
+            hole=hole2,
+            number=1,
+            lie="rough",
+            start_distance=18,
+            strokes_gained=0.25,
+        )
+        ShotFactory(user=user, hole=hole2, number=2, lie="green", start_distance=3)
+
+        with django_assert_num_queries(2):
+            results = service.get_for_rounds([round1, round2])
+
+        stats = results[round1.pk]
+        assert stats.two_chip_pct_10_20_rough == 50.0
+        assert stats.strokes_gained_10_20_rough == pytest.approx(-0.5)
+        assert stats.avg_proximity_10_20_rough == pytest.approx((36 + 6 + 3) / 3)
+        assert stats.two_chip_pct_sand == 0.0
+        assert results[round2.pk].strokes_gained_10_20_rough == 0.0
+        assert service.get_for_round(round1) == stats
@@ -0,0 +1,181 @@
+from itertools import groupby
+from operator import attrgetter
+from typing import Iterable
+
+from django.db import transaction
+from django.db.models import F
+
+from birdie_buddy.round_entry.models import Shot, ShotBucketAggregate
+from birdie_buddy.round_entry.services.approach_stats_service import (
+    ApproachShotService,
+)
+from birdie_buddy.round_entry.services.bucket_aggregator import ShotBucket
+from birdie_buddy.round_entry.services.driving_stats_service import (
+    DrivingStatsService,
+)
+from birdie_buddy.round_entry.services.putting_stats_service import (
+    PuttingStatsService,
+)
+from birdie_buddy.round_entry.services.short_game_service import ShortGameService
+
+FIELDS = (
+    "shot_count",
+    "strokes_gained_sum",
+    "leave_feet_sum",
+    "leave_count",
+    "holed_count",
+    "hole_count",
+    "two_chip_holes",
+)
+
+# (bucket name, bucket, distance field) for every shot-level bucket
+SHOT_BUCKETS: list[tuple[str, ShotBucket, str]] = [
+    *(
+        (name, bucket, "start_distance")
+        for name, bucket in ApproachShotService.BUCKETS.items()
+    ),
+    *(
+        (name, bucket, "start_distance")
+        for name, bucket in ShortGameService.BUCKETS.items()
+    ),
+    *(
+        (name, ShotBucket("putt", min_feet, max_feet), "feet")
+        for name, min_feet, max_feet in PuttingStatsService.BUCKETS
+    ),
+]
+
+Key = tuple[str, str]
+Totals = dict[Key, list[float]]
+
+
+class ShotBucketAggregateService:
+    """
+    Keeps ShotBucketAggregate rows in step with a user's holes and shots.
+
+    Writers describe a hole before and after their change as (par, shots);
+    the difference is applied to the stored totals with F() increments, so
+    concurrent writers for the same user never lose an update.
+    """
+
+    @staticmethod
+    def hole_totals(par: int | None, shots: Iterable) -> Totals:
+        """Every bucket one hole contributes to, with its FIELDS totals."""
+        shots = list(shots)
+        totals: Totals = {}
+
+        for name, bucket, distance_field in SHOT_BUCKETS:
+            matching = [shot for shot in shots if bucket.matches(shot, distance_field)]
+            if not matching:
+                continue
+            leaves = [shot.leave_feet for shot in matching if shot.leave_feet is not None]
+            totals[(bucket.shot_type, name)] = [
+                len(matching),
+                sum(s.strokes_gained for s in matching if s.strokes_gained is not None),
+                sum(leaves),
+                len(leaves),
+                sum(1 for shot in matching if shot.is_holed),
+                1,
+                1 if len(matching) >= 2 else 0,
+            ]
+
+        # Drives are counted per hole by where the second shot was played from
+        if par in DrivingStatsService.DRIVING_PARS:
+            for lie in {shot.lie for shot in shots if shot.number == 2}:
+                if lie in DrivingStatsService.ENDING_LIES:
+                    totals[("drive", lie)] = [0, 0, 0, 0, 0, 1, 0]
+
+        return totals
+
+    @staticmethod
+    def shot_totals(shots: Iterable) -> Totals:
+        """
+        Totals for shots ordered by hole, each annotated with its hole_par.
+        """
+        holes = (
+            list(hole_shots)
+            for _, hole_shots in groupby(shots, key=attrgetter("hole_id"))
+        )
+        return ShotBucketAggregateService.holes_totals(
+            (hole_shots[0].hole_par, hole_shots) for hole_shots in holes
+        )
+
+    @staticmethod
+    def holes_totals(holes: Iterable[tuple[int | None, Iterable]]) -> Totals:
+        """Combined totals for many holes, each given as (par, shots)."""
+        totals: Totals = {}
+        for par, hole_shots in holes:
+            hole_totals = ShotBucketAggregateService.hole_totals(par, hole_shots)
+            for key, values in hole_totals.items():
+                current = totals.setdefault(key, [0] * len(FIELDS))
+                for i, value in enumerate(values):
+                    current[i] += value
+        return totals
+
+    @staticmethod
+    def apply(user_id: int, before: Totals | None = None, after: Totals | None = None):
+        """Add after - before to the user's stored totals."""
+        delta: Totals = {}
+        for sign, totals in ((-1, before or {}), (1, after or {})):
+            for key, values in totals.items():
+                current = delta.setdefault(key, [0] * len(FIELDS))
+                for i, value in enumerate(values):
+                    current[i] += sign * value
+
+        delta = {key: values for key, values in delta.items() if any(values)}
+        if not delta:
+            return
+
+        with transaction.atomic():
+            ShotBucketAggregate.objects.bulk_create(
+                [
+                    ShotBucketAggregate(user_id=user_id, shot_type=shot_type, bucket=bucket)
+                    for shot_type, bucket in delta
+                ],
+                ignore_conflicts=True,
+            )
+            for (shot_type, bucket), values in delta.items():
+                ShotBucketAggregate.objects.filter(
+                    user_id=user_id, shot_type=shot_type, bucket=bucket
+                ).update(
+                    **{
+                        field: F(field) + value
+                        for field, value in zip(FIELDS, values)
+                        if value
+                    }
+                )
+
+    @staticmethod
+    def apply_hole(
+        user_id: int,
+        before: tuple[int | None, Iterable] | None = None,
+        after: tuple[int | None, Iterable] | None = None,
+    ):
+        """Apply a hole's change, each side given as (par, shots) or None."""
+        ShotBucketAggregateService.apply(
+            user_id,
+            ShotBucketAggregateService.hole_totals(*before) if before else None,
+            ShotBucketAggregateService.hole_totals(*after) if after else None,
+        )
+
+    @staticmethod
+    @transaction.atomic
+    def rebuild_for_user(user_id: int) -> None:
+        """Recompute a user's totals from scratch, e.g. after a bulk update."""
+        shots = (
+            Shot.objects.filter(user_id=user_id)
+            .order_by("hole_id", "number", "id")
+            .annotate(hole_par=F("hole__par"))
+        )
+
+        totals = ShotBucketAggregateService.shot_totals(shots.iterator(chunk_size=2000))
+
+        ShotBucketAggregate.objects.filter(user_id=user_id).delete()
+        ShotBucketAggregate.objects.bulk_create(
+            ShotBucketAggregate(
+                user_id=user_id,
+                shot_type=shot_type,
+                bucket=bucket,
+                **dict(zip(FIELDS, values)),
+            )
+            for (shot_type, bucket), values in totals.items()
+        )
@@ -0,0 +1,146 @@
+from importlib import import_module
+
+import pytest
+from django.apps import apps
+from django.forms import formset_factory
+
+from birdie_buddy.round_entry.factories import HoleFactory, RoundFactory
+from birdie_buddy.round_entry.factories.full_round_factory import full_round_factory
+from birdie_buddy.round_entry.forms import ShotForm
+from birdie_buddy.round_entry.models import Shot, ShotBucketAggregate
+from birdie_buddy.round_entry.services.approach_stats_service import (
+    ApproachShotService,
+)
+from birdie_buddy.round_entry.services.driving_stats_service import DrivingStatsService
+from birdie_buddy.round_entry.services.hole_service import HoleService
+from birdie_buddy.round_entry.services.putting_stats_service import (
+    PuttingStatsService,
+)
+from birdie_buddy.round_entry.services.short_game_service import ShortGameService
+from birdie_buddy.round_entry.services.shot_bucket_aggregate_service import (
+    FIELDS,
+    ShotBucketAggregateService,
+)
+from birdie_buddy.round_entry.services.shot_service import ShotService
+from birdie_buddy.round_entry.services.user_stats_snapshot import UserStatsSnapshot
+from birdie_buddy.users.factories import UserFactory
+
+
+def shot_formset(shots):
+    data = {
+        "form-TOTAL_FORMS": str(len(shots)),
+        "form-INITIAL_FORMS": "0",
+        "form-MIN_NUM_FORMS": "0",
+        "form-MAX_NUM_FORMS": "1000",
+    }
+    for i, (lie, distance) in enumerate(shots):
+        data[f"form-{i}-lie"] = lie
+        data[f"form-{i}-start_distance"] = str(distance)
+    return formset_factory(ShotForm, extra=0)(data)
+
+
+def stored_totals(user):
+    return {
+        (row.shot_type, row.bucket): [getattr(row, field) for field in FIELDS]
+        for row in ShotBucketAggregate.objects.filter(user=user)
+        if any(getattr(row, field) for field in FIELDS)
+    }
+
+
+def assert_matches_rebuild(user):
+    incremental = stored_totals(user)
+    ShotBucketAggregateService.rebuild_for_user(user.pk)
+    rebuilt = stored_totals(user)
+
+    assert incremental.keys() == rebuilt.keys()
+    for key, values in rebuilt.items():
+        assert incremental[key] == pytest.approx(values)
+
+
+@pytest.mark.django_db
+class TestShotBucketAggregateService:
+    def test_hole_totals(self):
+        user = UserFactory()
+        hole = HoleFactory(user=user, par=4)
+        shots = ShotService.save_shots_with_strokes_gained(
+            [
+                Shot(user=user, hole=hole, lie="tee", start_distance=400),
+                Shot(user=user, hole=hole, lie="rough", start_distance=120),
+                Shot(user=user, hole=hole, lie="sand", start_distance=15),
+                Shot(user=user, hole=hole, lie="green", start_distance=6),
+                Shot(user=user, hole=hole, lie="green", start_distance=2),
+            ]
+        )
+
+        totals = ShotBucketAggregateService.hole_totals(4, shots)
+
+        assert totals[("approach", "100_150")][0] == 1
+        assert totals[("approach", "100_150_rough")][2:4] == [45, 1]
+        assert totals[("around_green", "sand")][0] == 1
+        assert totals[("putt", "0_3")][4] == 1
+        assert totals[("putt", "6_9")][4] == 0
+        assert totals[("drive", "rough")][5] == 1
+        assert ("drive", "rough") not in ShotBucketAggregateService.hole_totals(3, shots)
+
+    def test_replacing_shots_applies_the_delta(self):
+        user = UserFactory()
+        round = RoundFactory(user=user)
+        hole = HoleFactory(user=user, round=round, par=4, number=1)
+
+        ShotService.create_shots_for_hole(
+            hole, user, shot_formset([("tee", 400), ("fairway", 130), ("green", 15)])
+        )
+        ShotService.create_shots_for_hole(
+            hole,
+            user,
+            shot_formset([("tee", 400), ("rough", 160), ("green", 30), ("green", 3)]),
+        )
+
+        assert stored_totals(user).keys() == {
+            ("approach", "150_200"),
+            ("approach", "150_200_rough"),
+            ("putt", "30_40"),
+            ("putt", "3_6"),
+            ("drive", "rough"),
+        }
+        assert_matches_rebuild(user)
+
+    def test_deleting_a_hole_removes_its_totals(self):
+        user = UserFactory()
+        round = full_round_factory(n_holes=3, user=user)
+
+        HoleService.delete_hole(round.hole_set.first())
+
+        assert_matches_rebuild(user)
+
+    def test_migration_backfill_matches_rebuild(self):
+        # Its bucket rules are a frozen copy, so check they still agree
+        backfill = import_module(
+            "birdie_buddy.round_entry.migrations.0013_shotbucketaggregate"
+        ).backfill_aggregates
+        user = UserFactory()
+        full_round_factory(user=user)
+        ShotBucketAggregate.objects.all().delete()
+
+        backfill(apps, None)
+
+        assert_matches_rebuild(user)
+
+    def test_services_read_one_row_per_bucket(self, django_assert_num_queries):
+        user = UserFactory()
+        full_round_factory(user=user)
+        snapshot = UserStatsSnapshot.load(user)
+
+        for service in (
+            ApproachShotService(),
+            ShortGameService(),
+            PuttingStatsService(),
+            DrivingStatsService(),
+        ):
+            # One read of the aggregates plus the hole count
+            with django_assert_num_queries(2):
+                from_aggregates = service.get_for_user(user)
+
+            assert tuple(from_aggregates) == pytest.approx(
+                tuple(service.get_for_user(user, snapshot))
+            )
@@ -1,16 +1,69 @@
-from birdie_buddy.round_entry.models import Shot, Hole
+from math import isnan
+
+from django.db import transaction
+
+from birdie_buddy.round_entry.models import RoundSummary, Shot, Hole
+from birdie_buddy.round_entry.services.shot_bucket_aggregate_service import (
+    ShotBucketAggregateService,
+)
+from birdie_buddy.round_entry.services.stats_cache import StatsCache
+from birdie_buddy.round_entry.services.strokes_gained import strokes_gained_for_shots
 from django.contrib.auth.models import User
 from django.forms import BaseFormSet
 
 
+# Shot columns written by the bulk upsert; everything else is kept from the row
+UPSERT_FIELDS = [
+    "start_distance",
+    "lie",
+    "strokes_gained",
+    "shot_type",
+    "yards",
+    "feet",
+    "leave_feet",
+    "is_holed",
+]
+
+
 class ShotService:
+    @staticmethod
+    def set_strokes_gained(shots: list[Shot]) -> list[Shot]:
+        """
+        Calculate strokes gained, the leave distance, the holed flag and the
+        derived distance and type fields for a hole's shots, in memory.
+
+        Args:
+            shots: List of Shot objects for one hole, in order
+
+        Returns:
+            The same shots, numbered from 1
+        """
+        strokes_gained = strokes_gained_for_shots(
+            [shot.start_distance for shot in shots], [shot.lie for shot in shots]
+        )
+
+        for shot in shots:
+            shot.set_derived_fields()
+
+        for i, (shot, sg) in enumerate(zip(shots, strokes_gained)):
+            if isnan(sg):
+                raise KeyError((shot.lie, shot.start_distance))
+            next_shot = shots[i + 1] if i + 1 < len(shots) else None
+            shot.number = i + 1
+            shot.strokes_gained = sg
+            shot.leave_feet = next_shot.feet if next_shot else 0
+            shot.is_holed = next_shot is None
+
+        return shots
+
     @staticmethod
     def save_shots_with_strokes_gained(shots: list[Shot]) -> list[Shot]:
         """
         Calculate strokes gained for each shot and save them to the database.
 
-        This method handles the core logic of calculating strokes gained based on
-        the next shot in the sequence, then saves all shots.
+        This method handles the core logic of calculating strokes gained, the
+        leave distance and the holed flag based on the next shot in the sequence,
+        then saves all shots.
 
         Args:
             shots: List of Shot objects (not yet saved to DB) in order
@@ -18,24 +71,71 @@ class ShotService:
         Returns:
             List of saved Shot objects with strokes gained calculated
         """
-        for i, shot in enumerate(shots):
-            next_shot = shots[i + 1] if i + 1 < len(shots) else None
-            shot.number = i + 1
-            shot.calculate_strokes_gained(next_shot)
+        ShotService.set_strokes_gained(shots)
+
+        for shot in shots:
             shot.save()
 
         return shots
 
     @staticmethod
+    def upsert_shots(existing: list[Shot], shots: list[Shot]) -> list[Shot]:
+        """
+        Replace a hole's existing shots with `shots`, matched by shot number.
+
+        Shots whose number already exists take over that row and are only
+        written when a column changed; the rest are inserted, and rows past
+        the last new shot are deleted. That is at most one bulk_create, one
+        bulk_update and one delete, whatever the number of shots.
+
+        Args:
+            existing: The hole's saved shots
+            shots: Unsaved Shot objects for the hole, in order
+
+        Returns:
+            The new shots, saved
+        """
+        ShotService.set_strokes_gained(shots)
+
+        rows = {}
+        for row in existing:
+            rows.setdefault(row.number, row)
+
+        to_create, to_update = [], []
+        for shot in shots:
+            row = rows.pop(shot.number, None)
+            if row is None:
+                to_create.append(shot)
+                continue
+            shot.pk = row.pk
+            shot.created_at = row.created_at
+            if any(
+                getattr(shot, field) != getattr(row, field) for field in UPSERT_FIELDS
+            ):
+                to_update.append(shot)
+
+        kept = {shot.pk for shot in shots}
+        stale = [row.pk for row in existing if row.pk not in kept]
+        if stale:
+            Shot.objects.filter(pk__in=stale).delete()
+        Shot.objects.bulk_update(to_update, UPSERT_FIELDS)
+        Shot.objects.bulk_create(to_create)
+
+        return shots
+
+    @staticmethod
+    @transaction.atomic
     def create_shots_for_hole(hole: Hole, user: User, formset: BaseFormSet):
         """
-        Deletes existing shots for the given hole and user,
-        then creates new shots based on the provided formset data.
+        Replaces the existing shots for the given hole and user with the
+        shots in the provided formset, writing only the rows that changed,
+        and refreshes the round summary, bucket aggregates and the user's
+        cached stats.
         """
-        # Delete existing shots for the current hole
-        Shot.objects.filter(hole=hole, user=user).delete()
+        previous_shots = list(
+            Shot.objects.filter(hole=hole, user=user).order_by("number", "id")
+        )
 
-        # Create new shots
         shots_created: list[Shot] = []
         if formset.is_valid():
             for form in formset:
@@ -45,9 +145,12 @@ class ShotService:
                     shot.user = user
                     shots_created.append(shot)
 
-        # Use the shared method to calculate strokes gained and save
-        ShotService.save_shots_with_strokes_gained(shots_created)
+        ShotService.upsert_shots(previous_shots, shots_created)
 
-        # TODO: we may want to mark the round as complete here as well
+        RoundSummary.objects.refresh(hole.round)
+        ShotBucketAggregateService.apply_hole(
+            user.pk, (hole.par, previous_shots), (hole.par, shots_created)
+        )
+        StatsCache.invalidate_on_commit(user.pk)
 
         return shots_created
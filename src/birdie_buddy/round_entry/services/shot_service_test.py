@@ -0,0 +1,101 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from birdie_buddy.round_entry.factories import HoleFactory, RoundFactory
+from birdie_buddy.round_entry.models import Shot
+from birdie_buddy.round_entry.services.shot_bucket_aggregate_service_test import (
+    shot_formset,
+)
+from birdie_buddy.round_entry.services.shot_service import ShotService
+from birdie_buddy.users.factories import UserFactory
+
+
+@pytest.fixture
+def hole(db):
+    user = UserFactory()
+    round = RoundFactory(user=user)
+    return HoleFactory(user=user, round=round, par=4, number=1)
+
+
+def save(hole, shots):
+    return ShotService.create_shots_for_hole(hole, hole.user, shot_formset(shots))
+
+
+def stored(hole):
+    return list(
+        Shot.objects.filter(hole=hole)
+        .order_by("number")
+        .values_list("pk", "number", "lie", "start_distance", "leave_feet", "is_holed")
+    )
+
+
+@pytest.mark.django_db
+class TestCreateShotsForHole:
+    def test_creates_shots(self, hole):
+        save(hole, [("tee", 400), ("fairway", 130), ("green", 15)])
+
+        rows = stored(hole)
+        assert [row[1:] for row in rows] == [
+            (1, "tee", 400, 390, False),
+            (2, "fairway", 130, 15, False),
+            (3, "green", 15, 0, True),
+        ]
+        assert all(
+            shot.strokes_gained is not None for shot in Shot.objects.filter(hole=hole)
+        )
+
+    def test_correcting_a_shot_keeps_the_other_rows(self, hole):
+        save(hole, [("tee", 400), ("fairway", 130), ("green", 15), ("green", 2)])
+        before = stored(hole)
+
+        save(hole, [("tee", 400), ("rough", 130), ("green", 15), ("green", 2)])
+        after = stored(hole)
+
+        assert [row[0] for row in after] == [row[0] for row in before]
+        assert after[1][2] == "rough"
+        assert after[0] == before[0]
+        assert after[2:] == before[2:]
+
+    def test_shorter_hole_deletes_trailing_shots(self, hole):
+        save(hole, [("tee", 400), ("fairway", 130), ("green", 15), ("green", 2)])
+        first_pks = [row[0] for row in stored(hole)[:2]]
+
+        save(hole, [("tee", 400), ("fairway", 130), ("green", 1)])
+
+        rows = stored(hole)
+        assert [row[0] for row in rows[:2]] == first_pks
+        assert [row[1:] for row in rows[1:]] == [
+            (2, "fairway", 130, 1, False),
+            (3, "green", 1, 0, True),
+        ]
+
+    def test_longer_hole_inserts_new_shots(self, hole):
+        save(hole, [("tee", 400), ("green", 15)])
+
+        save(hole, [("tee", 400), ("green", 15), ("green", 3), ("green", 1)])
+
+        assert [row[1:] for row in stored(hole)][1:] == [
+            (2, "green", 15, 3, False),
+            (3, "green", 3, 1, False),
+            (4, "green", 1, 0, True),
+        ]
+
+    def test_writes_do_not_grow_with_shot_count(self, hole):
+        def writes(shots):
+            with CaptureQueriesContext(connection) as queries:
+                save(hole, shots)
+            return [
+                query["sql"].split()[0]
+                for query in queries
+                if query["sql"].startswith(("INSERT", "UPDATE", "DELETE"))
+                and '"round_entry_shot"' in query["sql"]
+            ]
+
+        assert writes([("tee", 400)] + [("green", 60 - i) for i in range(8)]) == [
+            "INSERT"
+        ]
+        assert writes(
+            [("tee", 400), ("rough", 60)] + [("green", 59 - i) for i in range(7)]
+        ) == ["UPDATE"]
+        assert writes([("tee", 400), ("green", 2)]) == ["DELETE", "UPDATE"]
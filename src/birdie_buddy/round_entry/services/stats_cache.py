@@ -0,0 +1,140 @@
+import logging
+from functools import cached_property, partial
+from typing import Callable, TypeVar
+from uuid import uuid4
+
+from django.core.cache import caches
+from django.db import transaction
+
+from birdie_buddy.round_entry.models import StatsVersion
+from birdie_buddy.round_entry.services.avg_strokes_to_holeout import DEFAULT_BASELINE
+from birdie_buddy.round_entry.services.stats_window import StatsWindow
+from birdie_buddy.round_entry.services.user_stats_snapshot import UserStatsSnapshot
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class StatsCache:
+    """
+    Caches a user's stats results keyed by a per-user data version.
+
+    Every write to a user's rounds, holes or shots replaces the version, so
+    earlier entries are never read again and simply expire. The version is
+    stored in the database (StatsVersion) so a write made in another process,
+    like the scorecard worker or a management command, invalidates every
+    process's results, even with per-process local-memory caches. It is a
+    random token so a user's results can never match a reused version.
+    Results for a StatsWindow are also keyed by the window. Works with any
+    Django cache backend.
+    """
+
+    CACHE_ALIAS = "default"
+    TIMEOUT = 60 * 60 * 24 * 7
+    HITS_KEY = "stats:hits"
+    MISSES_KEY = "stats:misses"
+
+    def __init__(self, user, window: StatsWindow | None = None):
+        self.user = user
+        self.window = window
+
+    @classmethod
+    def backend(cls):
+        return caches[cls.CACHE_ALIAS]
+
+    @classmethod
+    def version(cls, user_id: int) -> str:
+        stats_version, _ = StatsVersion.objects.get_or_create(
+            user_id=user_id, defaults={"version": uuid4().hex}
+        )
+        return stats_version.version
+
+    @classmethod
+    def invalidate(cls, user_id: int) -> None:
+        """Start a new data version for the user, orphaning every cached result."""
+        StatsVersion.objects.update_or_create(
+            user_id=user_id, defaults={"version": uuid4().hex}
+        )
+
+    @classmethod
+    def invalidate_on_commit(cls, user_id: int) -> None:
+        """
+        Invalidate once the current transaction commits, so a concurrent request
+        cannot cache pre-commit data under the new version.
+        """
+        transaction.on_commit(partial(cls.invalidate, user_id))
+
+    @classmethod
+    def counters(cls) -> dict[str, int]:
+        backend = cls.backend()
+        return {
+            "hits": backend.get(cls.HITS_KEY, 0),
+            "misses": backend.get(cls.MISSES_KEY, 0),
+        }
+
+    @classmethod
+    def reset_counters(cls) -> None:
+        cls.backend().delete_many([cls.HITS_KEY, cls.MISSES_KEY])
+
+    @classmethod
+    def _increment(cls, key: str) -> None:
+        backend = cls.backend()
+        if not backend.add(key, 1, timeout=None):
+            try:
+                backend.incr(key)
+            except ValueError:
+                # Evicted between add() and incr()
+                backend.set(key, 1, timeout=None)
+
+    @cached_property
+    def snapshot(self) -> UserStatsSnapshot:
+        """Loaded on the first cache miss and shared by every later one."""
+        return UserStatsSnapshot.load(self.user, self.window)
+
+    def snapshot_for(self, baseline: str = DEFAULT_BASELINE) -> UserStatsSnapshot | None:
+        """
+        The snapshot to compute a baseline's stats from, or None when they can
+        be read from the stored values: with no window and the default
+        baseline, services read ShotBucketAggregate rows and SQL totals
+        instead of loading every shot.
+        """
+        if self.window is None and baseline == DEFAULT_BASELINE:
+            return None
+        return self.snapshot
+
+    @cached_property
+    def _version(self) -> str:
+        return self.version(self.user.pk)
+
+    def get_or_compute(self, name: str, compute: Callable[[], T]) -> T:
+        key = f"stats:{self.user.pk}:{self._version}:{name}"
+        if self.window is not None:
+            key = f"{key}:{self.window.cache_key}"
+        backend = self.backend()
+
+        result = backend.get(key, _MISSING)
+        if result is not _MISSING:
+            self._increment(self.HITS_KEY)
+            return result
+
+        self._increment(self.MISSES_KEY)
+        logger.debug("Stats cache miss for %s", key)
+        result = compute()
+        backend.set(key, result, timeout=self.TIMEOUT)
+        return result
+
+    def get_for_user(self, service):
+        """Cached service.get_for_user(user), keyed by service and baseline."""
+        name = type(service).__name__
+        baseline = getattr(service, "baseline", None)
+        if baseline is not None:
+            name = f"{name}:{baseline}"
+        return self.get_or_compute(
+            name,
+            lambda: service.get_for_user(
+                self.user, snapshot=self.snapshot_for(baseline or DEFAULT_BASELINE)
+            ),
+        )
@@ -0,0 +1,134 @@
+from unittest.mock import patch
+
+import pytest
+from django.core.management import call_command
+
+from birdie_buddy.round_entry.factories.full_round_factory import full_round_factory
+from birdie_buddy.round_entry.services.hole_service import HoleService
+from birdie_buddy.round_entry.services.putting_stats_service import (
+    PuttingStatsService,
+)
+from birdie_buddy.round_entry.services.stats_cache import StatsCache
+from birdie_buddy.round_entry.services.stats_window import StatsWindow
+from birdie_buddy.round_entry.services.tiger_five import TigerFiveService
+from birdie_buddy.round_entry.services.user_stats_snapshot import UserStatsSnapshot
+from birdie_buddy.users.factories import UserFactory
+
+
+@pytest.mark.django_db
+class TestStatsCache:
+    def test_second_lookup_is_a_hit(self, django_assert_num_queries):
+        user = UserFactory()
+        full_round_factory(n_holes=3, user=user)
+
+        first = StatsCache(user).get_for_user(TigerFiveService())
+
+        # Only the version lookup
+        with django_assert_num_queries(1):
+            second = StatsCache(user).get_for_user(TigerFiveService())
+
+        assert second == first
+        assert StatsCache.counters() == {"hits": 1, "misses": 1}
+
+    def test_keyed_by_service_and_baseline(self):
+        user = UserFactory()
+        stats_cache = StatsCache(user)
+
+        stats_cache.get_for_user(PuttingStatsService())
+        stats_cache.get_for_user(TigerFiveService())
+        stats_cache.get_for_user(PuttingStatsService("tour"))
+
+        assert StatsCache.counters() == {"hits": 1, "misses": 2}
+
+    def test_misses_share_one_snapshot(self, django_assert_num_queries):
+        user = UserFactory()
+        full_round_factory(n_holes=3, user=user)
+        stats_cache = StatsCache(user, StatsWindow(last_rounds=5))
+        StatsCache.version(user.pk)
+
+        # The version and the two snapshot queries
+        with django_assert_num_queries(3):
+            stats_cache.get_for_user(TigerFiveService())
+            stats_cache.get_for_user(PuttingStatsService())
+
+    def test_other_baselines_use_the_snapshot(self, flat_baseline):
+        user = UserFactory()
+        full_round_factory(n_holes=3, user=user)
+
+        with patch.object(UserStatsSnapshot, "load", wraps=UserStatsSnapshot.load) as load:
+            StatsCache(user).get_for_user(PuttingStatsService(flat_baseline))
+
+        load.assert_called_once()
+
+    def test_default_baseline_reads_aggregates(self, django_assert_num_queries):
+        user = UserFactory()
+        full_round_factory(n_holes=3, user=user)
+        expected = PuttingStatsService().get_for_user(user, window=StatsWindow())
+        StatsCache.version(user.pk)
+
+        with patch.object(UserStatsSnapshot, "load") as load:
+            # The version, the aggregate rows and the hole count
+            with django_assert_num_queries(3):
+                result = StatsCache(user).get_for_user(PuttingStatsService())
+
+        load.assert_not_called()
+        assert result == pytest.approx(expected)
+
+    def test_invalidate_starts_a_new_version(self):
+        user = UserFactory()
+        round = full_round_factory(n_holes=3, user=user)
+        before = StatsCache(user).get_for_user(TigerFiveService())
+
+        HoleService.delete_hole(round.hole_set.first())
+        # Not committed yet, so the old results are still served
+        assert StatsCache(user).get_for_user(TigerFiveService()) == before
+
+        StatsCache.invalidate(user.pk)
+        StatsCache(user).get_for_user(TigerFiveService())
+
+        assert StatsCache.counters() == {"hits": 1, "misses": 2}
+
+    def test_invalidates_on_commit(self, django_capture_on_commit_callbacks):
+        user = UserFactory()
+        round = full_round_factory(n_holes=3, user=user)
+        version = StatsCache.version(user.pk)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            HoleService.delete_hole(round.hole_set.first())
+
+        assert StatsCache.version(user.pk) != version
+
+    def test_invalidate_reaches_other_processes(self, settings):
+        # Like the web server and the scorecard worker: separate local-memory
+        # caches, one database
+        settings.CACHES = {
+            alias: {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": alias,
+            }
+            for alias in ("default", "worker")
+        }
+        user = UserFactory()
+        StatsCache(user).get_or_compute("answer", lambda: 1)
+
+        with patch.object(StatsCache, "CACHE_ALIAS", "worker"):
+            StatsCache.invalidate(user.pk)
+
+        assert StatsCache(user).get_or_compute("answer", lambda: 2) == 2
+
+    def test_other_users_are_unaffected(self):
+        user = UserFactory()
+        other = UserFactory()
+        version = StatsCache.version(other.pk)
+
+        StatsCache.invalidate(user.pk)
+
+        assert StatsCache.version(other.pk) == version
+
+    def test_info_command_reports_and_resets(self, capsys):
+        StatsCache(UserFactory()).get_or_compute("answer", lambda: 42)
+
+        call_command("stats_cache_info", reset=True)
+
+        assert "hits: 0  misses: 1" in capsys.readouterr().out
+        assert StatsCache.counters() == {"hits": 0, "misses": 0}
@@ -0,0 +1,74 @@
+from datetime import date, datetime, time, timedelta
+from typing import NamedTuple
+
+from django.utils import timezone
+
+from birdie_buddy.round_entry.models import Round
+
+
+class StatsWindow(NamedTuple):
+    """
+    Limits stats to a user's most recent rounds and/or a range of dates.
+
+    Dates are inclusive and compared against Round.created_at in the current
+    time zone. With both set, last_rounds picks the most recent rounds inside
+    the date range.
+    """
+
+    last_rounds: int | None = None
+    start: date | None = None
+    end: date | None = None
+
+    @classmethod
+    def from_query(cls, params) -> "StatsWindow | None":
+        """Read ?last=, ?start= and ?end= (ISO dates), ignoring invalid values."""
+
+        def parse(value, parser):
+            try:
+                return parser(value) if value else None
+            except ValueError:
+                return None
+
+        def parse_date(value):
+            # The first and last representable days can't be widened to the
+            # day's bounds (end + 1 day overflows), so they count as invalid
+            day = parse(value, date.fromisoformat)
+            return day if day is not None and date.min < day < date.max else None
+
+        last_rounds = parse(params.get("last"), int)
+        window = cls(
+            last_rounds=last_rounds if last_rounds and last_rounds > 0 else None,
+            start=parse_date(params.get("start")),
+            end=parse_date(params.get("end")),
+        )
+        return window if window.is_bounded else None
+
+    @property
+    def is_bounded(self) -> bool:
+        return any(value is not None for value in self)
+
+    @property
+    def cache_key(self) -> str:
+        return ":".join("" if value is None else str(value) for value in self)
+
+    def rounds(self, user):
+        """
+        The user's rounds inside the window, usable as an `__in` subquery.
+
+        Served by the (user, created_at) index, so the cost follows the size
+        of the window rather than the user's whole history.
+        """
+        rounds = Round.objects.filter(user=user)
+        if self.start is not None:
+            rounds = rounds.filter(created_at__gte=self._start_of(self.start))
+        if self.end is not None:
+            rounds = rounds.filter(
+                created_at__lt=self._start_of(self.end + timedelta(days=1))
+            )
+        if self.last_rounds is not None:
+            rounds = rounds.order_by("-created_at", "-id")[: self.last_rounds]
+        return rounds.values("pk")
+
+    @staticmethod
+    def _start_of(day: date) -> datetime:
+        return timezone.make_aware(datetime.combine(day, time.min))
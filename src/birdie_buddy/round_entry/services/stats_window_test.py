@@ -0,0 +1,90 @@
+from datetime import date, datetime, timezone
+
+import pytest
+from django.http import QueryDict
+
+from birdie_buddy.round_entry.factories import HoleFactory, RoundFactory
+from birdie_buddy.round_entry.services.stats_window import StatsWindow
+from birdie_buddy.round_entry.services.tiger_five import TigerFiveService
+from birdie_buddy.round_entry.services.user_stats_snapshot import UserStatsSnapshot
+from birdie_buddy.users.factories import UserFactory
+
+
+def played_on(user, day: date):
+    return RoundFactory(
+        user=user, created_at=datetime(day.year, day.month, day.day, 12, tzinfo=timezone.utc)
+    )
+
+
+class TestFromQuery:
+    def test_reads_last_rounds_and_dates(self):
+        window = StatsWindow.from_query(
+            QueryDict("last=10&start=2026-01-01&end=2026-03-31")
+        )
+
+        assert window == StatsWindow(10, date(2026, 1, 1), date(2026, 3, 31))
+
+    def test_unbounded_or_invalid_is_none(self):
+        assert StatsWindow.from_query(QueryDict("")) is None
+        assert StatsWindow.from_query(QueryDict("last=0&start=yesterday")) is None
+
+    def test_out_of_range_dates_are_invalid(self):
+        assert StatsWindow.from_query(QueryDict("end=9999-12-31")) is None
+        assert StatsWindow.from_query(QueryDict("start=0001-01-01")) is None
+        assert StatsWindow.from_query(
+            QueryDict("start=0001-01-01&end=9999-12-30")
+        ) == StatsWindow(end=date(9999, 12, 30))
+
+
+@pytest.mark.django_db
+class TestStatsWindow:
+    def test_last_rounds(self):
+        user = UserFactory()
+        played_on(user, date(2026, 1, 1))
+        february = played_on(user, date(2026, 2, 1))
+        march = played_on(user, date(2026, 3, 1))
+        played_on(UserFactory(), date(2026, 4, 1))
+
+        rounds = StatsWindow(last_rounds=2).rounds(user)
+
+        assert {row["pk"] for row in rounds} == {february.pk, march.pk}
+
+    def test_date_range_is_inclusive(self):
+        user = UserFactory()
+        played_on(user, date(2026, 1, 1))
+        february = played_on(user, date(2026, 2, 1))
+        march = played_on(user, date(2026, 3, 1))
+
+        rounds = StatsWindow(start=date(2026, 2, 1), end=date(2026, 3, 1)).rounds(user)
+
+        assert {row["pk"] for row in rounds} == {february.pk, march.pk}
+
+    def test_snapshot_only_loads_rounds_in_the_window(self, django_assert_num_queries):
+        user = UserFactory()
+        january = played_on(user, date(2026, 1, 1))
+        march = played_on(user, date(2026, 3, 1))
+        HoleFactory.par_4_missed_green(user=user, round=january, number=1)
+        HoleFactory.par_4_par(user=user, round=march, number=1)
+        HoleFactory.par_4_par(user=user, round=march, number=2)
+
+        with django_assert_num_queries(2):
+            snapshot = UserStatsSnapshot.load(user, StatsWindow(last_rounds=1))
+
+        assert set(snapshot.hole_round_ids) == {march.pk}
+        assert snapshot.hole_count == 2
+
+    def test_services_accept_a_window(self):
+        user = UserFactory()
+        january = played_on(user, date(2026, 1, 1))
+        march = played_on(user, date(2026, 3, 1))
+        HoleFactory(user=user, round=january, number=1, par=4, score=7)
+        HoleFactory(user=user, round=march, number=1, par=4, score=4)
+        for hole in user.hole_set.all():
+            hole.shot_set.create(user=user, number=1, lie="tee", start_distance=400)
+
+        service = TigerFiveService()
+        everything = service.get_for_user(user)
+        recent = service.get_for_user(user, window=StatsWindow(start=date(2026, 2, 1)))
+
+        assert everything.double_bogeys == 9
+        assert recent.double_bogeys == 0
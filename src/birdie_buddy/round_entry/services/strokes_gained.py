@@ -1,2 +1,36 @@
+from typing import Sequence
 
+from .avg_strokes_to_holeout import DEFAULT_BASELINE, avg_strokes_to_holeout_many
 
+
+def strokes_gained_for_shots(
+    distances: Sequence,
+    lies: Sequence,
+    hole_ids: Sequence | None = None,
+    baseline: str = DEFAULT_BASELINE,
+) -> list[float]:
+    """
+    Calculate strokes gained for an ordered run of shots in one pass.
+
+    Shots must be ordered by hole and shot number. A shot is followed by the
+    next entry when both belong to the same hole; the last shot of a hole is
+    treated as holed out. When hole_ids is None every shot is assumed to be on
+    the same hole.
+
+    Shots whose distance or lie is not covered by the baseline (and the shot
+    played before them) come back as NaN.
+    """
+    expected = avg_strokes_to_holeout_many(distances, lies, baseline)
+    count = len(expected)
+    result = []
+
+    for i in range(count):
+        is_last = i + 1 == count or (
+            hole_ids is not None and hole_ids[i + 1] != hole_ids[i]
+        )
+        if is_last:
+            result.append(expected[i] - 1)
+        else:
+            result.append(expected[i] - expected[i + 1] - 1)
+
+    return result
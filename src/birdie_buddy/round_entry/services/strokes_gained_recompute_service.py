@@ -0,0 +1,85 @@
+from math import isnan
+from typing import NamedTuple
+
+from birdie_buddy.round_entry.models import Hole, Round, RoundSummary, Shot
+from birdie_buddy.round_entry.services.shot_bucket_aggregate_service import (
+    ShotBucketAggregateService,
+)
+from birdie_buddy.round_entry.services.stats_cache import StatsCache
+from birdie_buddy.round_entry.services.strokes_gained import strokes_gained_for_shots
+
+
+class RecomputeResult(NamedTuple):
+    holes: int
+    shots_updated: int
+    shots_skipped: int
+
+
+class StrokesGainedRecomputeService:
+    """Recomputes stored Shot.strokes_gained values in bulk."""
+
+    CHUNK_SIZE = 500
+
+    @staticmethod
+    def recompute_for_user(user_id: int, chunk_size: int = CHUNK_SIZE) -> RecomputeResult:
+        """
+        Recompute strokes gained for every shot of one user.
+
+        Holes are streamed in keyset-paginated chunks ordered by id, so memory
+        use is bounded by chunk_size regardless of how many shots the user has.
+        Each chunk is scored with a single batch lookup and only shots whose
+        value changed are written back with bulk_update. Shots the baseline
+        does not cover keep their stored value and are counted as skipped.
+        Rounds with a changed shot get their summary refreshed.
+        """
+        holes = 0
+        shots_updated = 0
+        shots_skipped = 0
+        last_hole_id = 0
+        changed_round_ids = set()
+
+        while True:
+            hole_rounds = dict(
+                Hole.objects.filter(user_id=user_id, id__gt=last_hole_id)
+                .order_by("id")
+                .values_list("id", "round_id")[:chunk_size]
+            )
+            if not hole_rounds:
+                break
+            hole_ids = list(hole_rounds)
+
+            shots = list(
+                Shot.objects.filter(hole_id__in=hole_ids)
+                .order_by("hole_id", "number", "id")
+                .only("id", "hole_id", "start_distance", "lie", "strokes_gained")
+            )
+            strokes_gained = strokes_gained_for_shots(
+                [shot.start_distance for shot in shots],
+                [shot.lie for shot in shots],
+                hole_ids=[shot.hole_id for shot in shots],
+            )
+
+            changed = []
+            for shot, sg in zip(shots, strokes_gained):
+                if isnan(sg):
+                    shots_skipped += 1
+                elif shot.strokes_gained != sg:
+                    shot.strokes_gained = sg
+                    changed.append(shot)
+
+            Shot.objects.bulk_update(changed, ["strokes_gained"], batch_size=chunk_size)
+            changed_round_ids.update(hole_rounds[shot.hole_id] for shot in changed)
+
+            holes += len(hole_ids)
+            shots_updated += len(changed)
+            last_hole_id = hole_ids[-1]
+
+        # The summaries' SG totals and stats are built from the stored values
+        for round in Round.objects.filter(pk__in=changed_round_ids):
+            RoundSummary.objects.refresh(round)
+
+        if shots_updated:
+            ShotBucketAggregateService.rebuild_for_user(user_id)
+            StatsCache.invalidate(user_id)
+
+        return RecomputeResult(holes, shots_updated, shots_skipped)
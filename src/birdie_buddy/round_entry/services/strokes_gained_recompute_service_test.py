@@ -0,0 +1,123 @@
+from unittest.mock import patch
+
+import pytest
+
+from birdie_buddy.round_entry.factories import HoleFactory, RoundFactory, ShotFactory
+from birdie_buddy.round_entry.models import RoundSummary, Shot
+from birdie_buddy.round_entry.services.stats_cache import StatsCache
+from birdie_buddy.round_entry.services.strokes_gained_recompute_service import (
+    StrokesGainedRecomputeService,
+)
+from birdie_buddy.users.factories import UserFactory
+
+
+def create_par_4(user, round, number):
+    hole = HoleFactory(user=user, round=round, par=4, number=number)
+    for i, (distance, lie) in enumerate(
+        [(400, "tee"), (130, "fairway"), (15, "green"), (1, "green")], start=1
+    ):
+        ShotFactory(
+            user=user,
+            hole=hole,
+            number=i,
+            lie=lie,
+            start_distance=distance,
+            strokes_gained=0.0,
+        )
+    return hole
+
+
+@pytest.mark.django_db
+class TestStrokesGainedRecomputeService:
+    def test_recomputes_stale_values(self):
+        user = UserFactory()
+        round = RoundFactory(user=user)
+        hole = create_par_4(user, round, 1)
+
+        result = StrokesGainedRecomputeService.recompute_for_user(user.id)
+
+        assert result.holes == 1
+        assert result.shots_updated == 4
+        values = list(
+            hole.shot_set.order_by("number").values_list("strokes_gained", flat=True)
+        )
+        assert values == pytest.approx(
+            [3.99 - 2.88 - 1, 2.88 - 1.78 - 1, 1.78 - 1.04 - 1, 1.04 - 1]
+        )
+
+    def test_refreshes_round_summary(self):
+        user = UserFactory()
+        round = RoundFactory(user=user)
+        create_par_4(user, round, 1)
+        RoundSummary.objects.refresh(round)
+        assert round.summary.strokes_gained_putting == 0.0
+
+        StrokesGainedRecomputeService.recompute_for_user(user.id)
+
+        summary = RoundSummary.objects.get(round=round)
+        assert summary.strokes_gained_putting == pytest.approx(
+            (1.78 - 1.04 - 1) + (1.04 - 1)
+        )
+
+    def test_invalidates_stats_cached_by_other_processes(self, settings):
+        # The command and its pool workers don't share the web process's
+        # local-memory cache
+        settings.CACHES = {
+            alias: {
+                "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+                "LOCATION": alias,
+            }
+            for alias in ("default", "command")
+        }
+        user = UserFactory()
+        create_par_4(user, RoundFactory(user=user), 1)
+        StatsCache(user).get_or_compute("answer", lambda: 1)
+
+        with patch.object(StatsCache, "CACHE_ALIAS", "command"):
+            StrokesGainedRecomputeService.recompute_for_user(user.id)
+
+        assert StatsCache(user).get_or_compute("answer", lambda: 2) == 2
+
+    def test_second_run_updates_nothing(self):
+        user = UserFactory()
+        round = RoundFactory(user=user)
+        create_par_4(user, round, 1)
+        StrokesGainedRecomputeService.recompute_for_user(user.id)
+
+        result = StrokesGainedRecomputeService.recompute_for_user(user.id)
+
+        assert result.shots_updated == 0
+
+    def test_streams_holes_in_chunks(self):
+        user = UserFactory()
+        round = RoundFactory(user=user)
+        for number in range(1, 6):
+            create_par_4(user, round, number)
+
+        result = StrokesGainedRecomputeService.recompute_for_user(user.id, chunk_size=2)
+
+        assert result.holes == 5
+        assert result.shots_updated == 20
+
+    def test_only_touches_given_user(self):
+        user = UserFactory()
+        other_user = UserFactory()
+        create_par_4(user, RoundFactory(user=user), 1)
+        create_par_4(other_user, RoundFactory(user=other_user), 1)
+
+        StrokesGainedRecomputeService.recompute_for_user(user.id)
+
+        assert set(
+            Shot.objects.filter(user=other_user).values_list("strokes_gained", flat=True)
+        ) == {0.0}
+
+    def test_skips_shots_outside_baseline(self):
+        user = UserFactory()
+        hole = HoleFactory(user=user, round=RoundFactory(user=user), par=5, number=1)
+        ShotFactory(user=user, hole=hole, number=1, lie="tee", start_distance=700, strokes_gained=0.0)
+        ShotFactory(user=user, hole=hole, number=2, lie="green", start_distance=1, strokes_gained=0.0)
+
+        result = StrokesGainedRecomputeService.recompute_for_user(user.id)
+
+        assert result.shots_skipped == 1
+        assert result.shots_updated == 1
@@ -0,0 +1,54 @@
+import math
+
+import pytest
+
+from birdie_buddy.round_entry.services.avg_strokes_to_holeout import (
+    avg_strokes_to_holeout,
+)
+from birdie_buddy.round_entry.services.strokes_gained import strokes_gained_for_shots
+
+
+class TestStrokesGainedForShots:
+    def test_single_hole(self):
+        result = strokes_gained_for_shots([400, 130, 15, 1], ["tee", "fairway", "green", "green"])
+
+        assert result == pytest.approx([3.99 - 2.88 - 1, 2.88 - 1.78 - 1, 1.78 - 1.04 - 1, 1.04 - 1])
+
+    def test_last_shot_is_holed_out(self):
+        result = strokes_gained_for_shots([300], ["tee"])
+
+        assert result == [avg_strokes_to_holeout(300, "tee") - 1]
+
+    def test_multiple_holes_split_by_hole_id(self):
+        result = strokes_gained_for_shots(
+            [170, 1, 400, 130, 15],
+            ["tee", "green", "tee", "fairway", "green"],
+            hole_ids=[1, 1, 2, 2, 2],
+        )
+
+        assert result == pytest.approx(
+            [
+                avg_strokes_to_holeout(170, "tee") - 1.04 - 1,
+                1.04 - 1,
+                3.99 - 2.88 - 1,
+                2.88 - 1.78 - 1,
+                1.78 - 1,
+            ]
+        )
+
+    def test_unknown_distance_only_affects_neighbouring_shots(self):
+        result = strokes_gained_for_shots(
+            [700, 250, 100, 10], ["tee", "fairway", "fairway", "green"]
+        )
+
+        assert math.isnan(result[0])
+        assert result[1:] == pytest.approx(
+            [
+                avg_strokes_to_holeout(250, "fairway") - avg_strokes_to_holeout(100, "fairway") - 1,
+                avg_strokes_to_holeout(100, "fairway") - avg_strokes_to_holeout(10, "green") - 1,
+                avg_strokes_to_holeout(10, "green") - 1,
+            ]
+        )
+
+    def test_empty(self):
+        assert strokes_gained_for_shots([], []) == []
@@ -0,0 +1,114 @@
+from datetime import datetime
+from typing import NamedTuple
+
+from django.db.models import Avg, F, RowRange, Window
+
+from birdie_buddy.round_entry.models import Round
+
+# Trend category -> RoundSummary field
+CATEGORIES = {
+    "driving": "strokes_gained_driving",
+    "approach": "strokes_gained_approach",
+    "short_game": "strokes_gained_around_the_green",
+    "putting": "strokes_gained_putting",
+}
+
+
+class TrendPoint(NamedTuple):
+    round_id: int
+    created_at: datetime
+    rounds: int
+    driving: float
+    approach: float
+    short_game: float
+    putting: float
+    rolling_driving: float
+    rolling_approach: float
+    rolling_short_game: float
+    rolling_putting: float
+
+
+class StrokesGainedTrendService:
+    """
+    Per-round strokes gained by category for a user's most recent rounds.
+
+    Reads the stored RoundSummary totals (default baseline) and computes the
+    rolling averages with a window function, so the series costs one query
+    over just the rounds it covers, however long the user's history is.
+    """
+
+    MAX_ROUNDS = 200
+    MAX_ROLLING = 20
+
+    def get_series(
+        self, user, last_rounds: int = 20, rolling: int = 5, points: int | None = None
+    ) -> list[TrendPoint]:
+        """
+        The last `last_rounds` rounds, oldest first, each with the average of
+        itself and the previous `rolling - 1` rounds. With `points`, longer
+        series are downsampled to that many points.
+        """
+        last_rounds = max(1, min(last_rounds, self.MAX_ROUNDS))
+        rolling = max(1, min(rolling, self.MAX_ROLLING))
+
+        # Earlier rounds are fetched too so the first points have a full frame.
+        # Rounds without a summary have no totals to plot.
+        recent = Round.objects.filter(user=user, summary__isnull=False).order_by(
+            "-created_at", "-id"
+        )[: last_rounds + rolling - 1]
+        order_by = [F("created_at").asc(), F("id").asc()]
+        frame = RowRange(start=-(rolling - 1), end=0)
+        series = (
+            Round.objects.filter(pk__in=recent.values("pk"))
+            .annotate(
+                **{
+                    category: F(f"summary__{field}")
+                    for category, field in CATEGORIES.items()
+                },
+                **{
+                    f"rolling_{category}": Window(
+                        Avg(f"summary__{field}"), order_by=order_by, frame=frame
+                    )
+                    for category, field in CATEGORIES.items()
+                },
+            )
+            .order_by("created_at", "id")
+            .values_list("id", "created_at", *self._value_fields())
+        )
+
+        rows = list(series)
+        trend = [
+            TrendPoint(round_id, created_at, 1, *values)
+            for round_id, created_at, *values in rows[-last_rounds:]
+        ]
+        return self.downsample(trend, points)
+
+    @staticmethod
+    def downsample(series: list[TrendPoint], points: int | None) -> list[TrendPoint]:
+        """
+        Average consecutive rounds into at most `points` evenly sized points,
+        each labelled with the last round it covers.
+        """
+        if not points or points < 1 or len(series) <= points:
+            return series
+
+        fields = StrokesGainedTrendService._value_fields()
+        downsampled = []
+        for i in range(points):
+            chunk = series[i * len(series) // points : (i + 1) * len(series) // points]
+            downsampled.append(
+                TrendPoint(
+                    chunk[-1].round_id,
+                    chunk[-1].created_at,
+                    sum(point.rounds for point in chunk),
+                    *(
+                        sum(getattr(point, field) for point in chunk) / len(chunk)
+                        for field in fields
+                    ),
+                )
+            )
+        return downsampled
+
+    @staticmethod
+    def _value_fields() -> list[str]:
+        return [*CATEGORIES, *(f"rolling_{category}" for category in CATEGORIES)]
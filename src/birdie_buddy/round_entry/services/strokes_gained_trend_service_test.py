@@ -0,0 +1,75 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from birdie_buddy.round_entry.factories import HoleFactory, RoundFactory
+from birdie_buddy.round_entry.models import RoundSummary
+from birdie_buddy.round_entry.services.strokes_gained_trend_service import (
+    StrokesGainedTrendService,
+    TrendPoint,
+)
+from birdie_buddy.users.factories import UserFactory
+
+
+def rounds_with_putting(user, values):
+    """One round a day with the given putting strokes gained, oldest first."""
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    rounds = []
+    for day, putting in enumerate(values):
+        round = RoundFactory(user=user, created_at=start + timedelta(days=day))
+        RoundSummary.objects.create(round=round, strokes_gained_putting=putting)
+        rounds.append(round)
+    return rounds
+
+
+@pytest.mark.django_db
+class TestStrokesGainedTrendService:
+    def test_last_rounds_with_rolling_average(self, django_assert_num_queries):
+        user = UserFactory()
+        rounds = rounds_with_putting(user, [1.0, 2.0, 3.0, 4.0, 5.0])
+
+        with django_assert_num_queries(1):
+            series = StrokesGainedTrendService().get_series(
+                user, last_rounds=3, rolling=2
+            )
+
+        assert [point.round_id for point in series] == [r.pk for r in rounds[2:]]
+        assert [point.putting for point in series] == [3.0, 4.0, 5.0]
+        # The first point averages in the round before the series starts
+        assert [point.rolling_putting for point in series] == [2.5, 3.5, 4.5]
+
+    def test_other_users_rounds_are_ignored(self):
+        user = UserFactory()
+        rounds_with_putting(UserFactory(), [9.0])
+        rounds_with_putting(user, [1.0])
+
+        series = StrokesGainedTrendService().get_series(user)
+
+        assert [point.putting for point in series] == [1.0]
+
+    def test_rounds_without_summaries_are_skipped(self):
+        user = UserFactory()
+        rounds_with_putting(user, [1.0])
+        round = RoundFactory(user=user)
+        HoleFactory.par_4_par(user=user, round=round, number=1)
+        RoundSummary.objects.filter(round=round).delete()
+
+        series = StrokesGainedTrendService().get_series(user)
+
+        assert [point.putting for point in series] == [1.0]
+        assert not RoundSummary.objects.filter(round=round).exists()
+
+    def test_downsamples_to_points(self):
+        user = UserFactory()
+        rounds = rounds_with_putting(user, [1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+
+        series = StrokesGainedTrendService().get_series(user, rolling=1, points=3)
+
+        assert [point.rounds for point in series] == [2, 2, 2]
+        assert [point.putting for point in series] == [1.5, 3.5, 5.5]
+        assert series[-1].round_id == rounds[-1].pk
+
+    def test_short_series_are_not_downsampled(self):
+        point = TrendPoint(1, None, 1, *[0.0] * 8)
+
+        assert StrokesGainedTrendService.downsample([point], 5) == [point]
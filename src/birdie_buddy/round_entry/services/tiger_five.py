@@ -1,6 +1,8 @@
 from collections import namedtuple
-from django.db.models import Count, F
+from django.db.models import Count, F, Q
 from birdie_buddy.round_entry.models import Shot, Hole
+from birdie_buddy.round_entry.services.stats_window import StatsWindow
+from birdie_buddy.round_entry.services.user_stats_snapshot import UserStatsSnapshot
 
 TigerFive = namedtuple(
     "TigerFive",
@@ -9,11 +11,29 @@ TigerFive = namedtuple(
 
 
 class TigerFiveService:
-    def get_for_user(self, user, round=None):
+    """
+    Counts of the five costly mistakes. They don't depend on the strokes
+    gained baseline, so unlike the bucket services this takes none.
+    """
+
+    def get_for_user(
+        self,
+        user,
+        round=None,
+        snapshot: UserStatsSnapshot | None = None,
+        window: StatsWindow | None = None,
+    ):
         """Return Tiger Five statistics averaged per 18 holes for `user`.
 
         Uses smaller helper methods for each stat to keep logic separated.
+        When a snapshot is given the stats are computed from it without
+        querying; a window loads a snapshot of just the rounds inside it.
         """
+        if snapshot is None and window is not None:
+            snapshot = UserStatsSnapshot.load(user, window)
+        if snapshot is not None:
+            return self._get_from_snapshot(snapshot)
+
         total_holes = self._total_holes_with_shots(user, round)
 
         if total_holes == 0:
@@ -37,20 +57,56 @@ class TigerFiveService:
 
     def get_for_round(self, round):
         """Return Tiger Five statistics for a specific round (not scaled)."""
-        penalties = self.penalties(round.user, round)
-        double_bogeys = self.double_bogeys(round.user, round)
-        three_putts = self.three_putts(round.user, round)
-        bogeys_inside_150 = self.bogeys_inside_150(round.user, round)
-        two_chip = self.two_chips(round.user, round)
+        return self.get_for_rounds([round])[round.pk]
 
-        return TigerFive(
-            penalties,
-            double_bogeys,
-            three_putts,
-            bogeys_inside_150,
-            two_chip,
+    def get_for_rounds(self, rounds) -> dict[int, TigerFive]:
+        """Return unscaled Tiger Five statistics for each round, keyed by round id.
+
+        One query counts the relevant shots on every hole of every round;
+        the per-hole counts are then rolled up by round.
+        """
+        rounds = list(rounds)
+        holes = (
+            Hole.objects.filter(round__in=rounds)
+            .values("id", "round_id", "par", "score")
+            .annotate(
+                penalty_shots=Count("shot", filter=Q(shot__lie="penalty")),
+                putts=Count("shot", filter=Q(shot__lie="green")),
+                chips=Count("shot", filter=Q(shot__shot_type="around_green")),
+                inside_150=Count(
+                    "shot",
+                    filter=Q(
+                        shot__start_distance__lte=150,
+                        shot__lie="fairway",
+                        shot__shot_type__in=["approach", "around_green"],
+                    ),
+                ),
+            )
+            .order_by()
         )
 
+        counts = {round.pk: dict.fromkeys(TigerFive._fields, 0) for round in rounds}
+        for hole in holes:
+            round_counts = counts[hole["round_id"]]
+            score, par = hole["score"], hole["par"]
+            if hole["penalty_shots"]:
+                round_counts["penalties"] += 1
+            if score is not None and score >= par + 2:
+                round_counts["double_bogeys"] += 1
+            if hole["putts"] >= 3:
+                round_counts["three_putts"] += 1
+            if (
+                score is not None
+                and score == par + 1
+                and hole["inside_150"]
+                and not hole["penalty_shots"]
+            ):
+                round_counts["bogeys_inside_150"] += 1
+            if hole["chips"] == 2:
+                round_counts["two_chip"] += 1
+
+        return {round_id: TigerFive(**values) for round_id, values in counts.items()}
+
     def penalties(self, user, round=None):
         """Count distinct holes with at least one penalty shot."""
         queryset = Shot.objects.filter(user=user, lie="penalty")
@@ -119,3 +175,44 @@ class TigerFiveService:
         if round:
             queryset = queryset.filter(hole__round=round)
         return queryset.values("hole").distinct().count()
+
+    def _get_from_snapshot(self, snapshot: UserStatsSnapshot):
+        total_holes = snapshot.holes_with_shots
+        if total_holes == 0:
+            return TigerFive(0, 0, 0, 0, 0)
+
+        penalty_holes = {
+            hole_id
+            for hole_id, lie in zip(snapshot.shot_hole_ids, snapshot.lies)
+            if lie == "penalty"
+        }
+        putts = snapshot.shots_per_hole(snapshot.select(lie="green"))
+        chips = snapshot.shots_per_hole(snapshot.select(shot_type="around_green"))
+        # Holes with a fairway approach or short game shot from inside 150
+        inside_150 = {
+            snapshot.shot_hole_ids[i]
+            for shot_type in ("approach", "around_green")
+            for i in snapshot.select(shot_type, max_distance=151, lie="fairway")
+        }
+
+        double_bogeys = 0
+        bogeys_inside_150 = 0
+        for hole_id, par, score in zip(snapshot.hole_ids, snapshot.pars, snapshot.scores):
+            if score >= par + 2:
+                double_bogeys += 1
+            elif (
+                score == par + 1
+                and hole_id in inside_150
+                and hole_id not in penalty_holes
+            ):
+                bogeys_inside_150 += 1
+
+        scale = 18 / total_holes
+
+        return TigerFive(
+            len(penalty_holes) * scale,
+            double_bogeys * scale,
+            sum(1 for count in putts.values() if count >= 3) * scale,
+            bogeys_inside_150 * scale,
+            sum(1 for count in chips.values() if count == 2) * scale,
+        )
@@ -3,8 +3,8 @@ from birdie_buddy.round_entry.services.tiger_five import TigerFiveService
 from birdie_buddy.round_entry.factories import (
     RoundFactory,
     HoleFactory,
-    full_round_factory,
 )
+from birdie_buddy.round_entry.factories.full_round_factory import full_round_factory
 from birdie_buddy.round_entry.factories.shot_factory import ShotFactory
 
 
@@ -149,3 +149,24 @@ def test_get_for_round_filters_only_specified_round():
     assert result.three_putts == 0
     assert result.bogeys_inside_150 == 0
     assert result.two_chip == 0
+
+
+@pytest.mark.django_db
+def test_get_for_rounds_matches_per_round_counts(django_assert_num_queries):
+    first = full_round_factory(n_holes=9)
+    user = first.user
+    rounds = [first, full_round_factory(n_holes=9, user=user), RoundFactory(user=user)]
+    service = TigerFiveService()
+
+    with django_assert_num_queries(1):
+        results = service.get_for_rounds(rounds)
+
+    assert results.keys() == {round.pk for round in rounds}
+    for round in rounds:
+        assert results[round.pk] == (
+            service.penalties(user, round),
+            service.double_bogeys(user, round),
+            service.three_putts(user, round),
+            service.bogeys_inside_150(user, round),
+            service.two_chips(user, round),
+        )
@@ -0,0 +1,160 @@
+from array import array
+from functools import cached_property
+from math import inf, isnan, nan
+
+from birdie_buddy.round_entry.models import Hole, Shot
+from birdie_buddy.round_entry.services.avg_strokes_to_holeout import DEFAULT_BASELINE
+from birdie_buddy.round_entry.services.stats_window import StatsWindow
+from birdie_buddy.round_entry.services.strokes_gained import strokes_gained_for_shots
+
+
+def _floats(values) -> array:
+    """Pack nullable numbers into doubles, NULL as NaN so comparisons fail like SQL."""
+    return array("d", (nan if value is None else value for value in values))
+
+
+class UserStatsSnapshot:
+    """
+    A user's holes and shots loaded once into column arrays.
+
+    Every stats service can compute its dashboard numbers from a snapshot
+    instead of running its own queries, so the whole stats page costs the two
+    queries in load(). Nullable numeric columns are stored as doubles with
+    NaN for NULL; text columns are plain lists. Shots are ordered by hole and
+    shot number, so a non-default baseline can be rescored in memory.
+    """
+
+    def __init__(self, holes: list[tuple], shots: list[tuple]):
+        hole_ids, round_ids, pars, scores, mental_scorecards = (
+            list(zip(*holes)) or [()] * 5
+        )
+        self.hole_ids = array("q", hole_ids)
+        self.hole_round_ids = array("q", round_ids)
+        self.pars = _floats(pars)
+        self.scores = _floats(scores)
+        self.mental_scorecards = _floats(mental_scorecards)
+
+        (
+            shot_hole_ids,
+            numbers,
+            start_distances,
+            feet,
+            lies,
+            shot_types,
+            strokes_gained,
+            leave_feet,
+            is_holed,
+        ) = list(zip(*shots)) or [()] * 9
+        self.shot_hole_ids = array("q", shot_hole_ids)
+        self.numbers = array("q", numbers)
+        self.start_distances = _floats(start_distances)
+        self.feet = _floats(feet)
+        self.lies: list[str | None] = list(lies)
+        self.shot_types: list[str | None] = list(shot_types)
+        self.stored_strokes_gained = _floats(strokes_gained)
+        self.leave_feet = _floats(leave_feet)
+        self.is_holed = array("b", is_holed)
+
+        self._rescored: dict[str, array] = {}
+
+    @classmethod
+    def load(cls, user, window: StatsWindow | None = None) -> "UserStatsSnapshot":
+        """Load every hole and shot, or only those in the window's rounds."""
+        holes = Hole.objects.filter(user=user)
+        shots = Shot.objects.filter(user=user)
+        if window is not None:
+            rounds = window.rounds(user)
+            holes = holes.filter(round__in=rounds)
+            shots = shots.filter(hole__round__in=rounds)
+
+        holes = holes.values_list("id", "round_id", "par", "score", "mental_scorecard")
+        shots = (
+            shots.order_by("hole_id", "number", "id")
+            .values_list(
+                "hole_id",
+                "number",
+                "start_distance",
+                "feet",
+                "lie",
+                "shot_type",
+                "strokes_gained",
+                "leave_feet",
+                "is_holed",
+            )
+        )
+        return cls(list(holes), list(shots))
+
+    @property
+    def hole_count(self) -> int:
+        return len(self.hole_ids)
+
+    @cached_property
+    def holes_with_shots(self) -> int:
+        return len(set(self.shot_hole_ids))
+
+    def strokes_gained(self, baseline: str = DEFAULT_BASELINE) -> array:
+        """Per-shot strokes gained, stored for the default baseline, rescored otherwise."""
+        if baseline == DEFAULT_BASELINE:
+            return self.stored_strokes_gained
+        if baseline not in self._rescored:
+            self._rescored[baseline] = array(
+                "d",
+                strokes_gained_for_shots(
+                    [None if isnan(d) else int(d) for d in self.start_distances],
+                    self.lies,
+                    hole_ids=self.shot_hole_ids,
+                    baseline=baseline,
+                ),
+            )
+        return self._rescored[baseline]
+
+    def select(
+        self,
+        shot_type: str | None = None,
+        min_distance: float | None = None,
+        max_distance: float | None = None,
+        lie: str | None = None,
+        distance_field: str = "start_distances",
+    ) -> list[int]:
+        """
+        Indexes of the shots matching the filters the stats services bucket by.
+
+        Shots with no distance only match when neither bound is given.
+        """
+        distances = getattr(self, distance_field)
+        bounded = min_distance is not None or max_distance is not None
+        lower = -inf if min_distance is None else min_distance
+        upper = inf if max_distance is None else max_distance
+        return [
+            i
+            for i, (kind, shot_lie, distance) in enumerate(
+                zip(self.shot_types, self.lies, distances)
+            )
+            if (shot_type is None or kind == shot_type)
+            and (lie is None or shot_lie == lie)
+            and (not bounded or lower <= distance < upper)
+        ]
+
+    @staticmethod
+    def total(column: array, indexes: list[int]) -> float:
+        """Sum a column over the given shots, skipping NULL (NaN) like SQL SUM."""
+        return sum(v for v in map(column.__getitem__, indexes) if not isnan(v))
+
+    @staticmethod
+    def mean(column: array, indexes: list[int]) -> float:
+        """Average a column over the given shots, skipping NULL like SQL AVG (0.0 if empty)."""
+        values = [v for v in map(column.__getitem__, indexes) if not isnan(v)]
+        return sum(values) / len(values) if values else 0.0
+
+    def per_18(self, total: float) -> float:
+        """Scale a total by every hole the user has entered."""
+        if self.hole_count == 0:
+            return 0.0
+        return (total / self.hole_count) * 18
+
+    def shots_per_hole(self, indexes: list[int]) -> dict[int, int]:
+        counts: dict[int, int] = {}
+        for i in indexes:
+            hole_id = self.shot_hole_ids[i]
+            counts[hole_id] = counts.get(hole_id, 0) + 1
+        return counts
@@ -0,0 +1,123 @@
+from dataclasses import astuple, is_dataclass
+
+import pytest
+
+from birdie_buddy.round_entry.factories import HoleFactory, RoundFactory, ShotFactory
+from birdie_buddy.round_entry.factories.full_round_factory import full_round_factory
+from birdie_buddy.round_entry.services.approach_stats_service import (
+    ApproachShotService,
+)
+from birdie_buddy.round_entry.services.avg_strokes_gained_per_18 import (
+    get_avg_strokes_gained_categories_per_18,
+)
+from birdie_buddy.round_entry.services.driving_stats_service import DrivingStatsService
+from birdie_buddy.round_entry.services.mental_scorecard_service import (
+    MentalScorecardService,
+)
+from birdie_buddy.round_entry.services.putting_stats_service import (
+    PuttingStatsService,
+)
+from birdie_buddy.round_entry.services.short_game_service import ShortGameService
+from birdie_buddy.round_entry.services.tiger_five import TigerFiveService
+from birdie_buddy.round_entry.services.user_stats_snapshot import UserStatsSnapshot
+from birdie_buddy.users.factories import UserFactory
+
+
+def assert_same_stats(from_snapshot, from_queries):
+    assert type(from_snapshot) is type(from_queries)
+    if is_dataclass(from_snapshot):
+        from_snapshot, from_queries = astuple(from_snapshot), astuple(from_queries)
+    assert tuple(from_snapshot) == pytest.approx(tuple(from_queries))
+
+
+@pytest.fixture
+def user_with_rounds():
+    user = UserFactory()
+    full_round_factory(user=user)
+    full_round_factory(n_holes=9, user=user)
+
+    # A hole with a penalty, sand shot and a three putt
+    round = RoundFactory(user=user)
+    hole = HoleFactory(user=user, round=round, par=4, number=1, score=7)
+    for number, (lie, distance) in enumerate(
+        [
+            ("tee", 410),
+            ("penalty", 200),
+            ("rough", 190),
+            ("sand", 15),
+            ("green", 25),
+            ("green", 6),
+            ("green", 2),
+        ],
+        start=1,
+    ):
+        ShotFactory(
+            user=user, hole=hole, number=number, lie=lie, start_distance=distance
+        )
+    # A hole without any shots still counts towards per 18 scaling
+    HoleFactory(user=user, round=round, par=3, number=2, score=3)
+    return user
+
+
+@pytest.mark.django_db
+class TestUserStatsSnapshot:
+    def test_load_uses_two_queries(self, user_with_rounds, django_assert_num_queries):
+        with django_assert_num_queries(2):
+            snapshot = UserStatsSnapshot.load(user_with_rounds)
+
+        assert snapshot.hole_count == 29
+        assert snapshot.holes_with_shots == 28
+
+    def test_empty_user(self):
+        snapshot = UserStatsSnapshot.load(UserFactory())
+
+        assert snapshot.hole_count == 0
+        assert snapshot.select("putt") == []
+        assert snapshot.per_18(1.0) == 0.0
+
+    def test_services_match_their_queries(
+        self, user_with_rounds, django_assert_num_queries
+    ):
+        user = user_with_rounds
+        snapshot = UserStatsSnapshot.load(user)
+
+        with django_assert_num_queries(0):
+            results = [
+                get_avg_strokes_gained_categories_per_18(user, snapshot=snapshot),
+                TigerFiveService().get_for_user(user, snapshot=snapshot),
+                DrivingStatsService().get_for_user(user, snapshot),
+                ApproachShotService().get_for_user(user, snapshot),
+                ShortGameService().get_for_user(user, snapshot),
+                PuttingStatsService().get_for_user(user, snapshot),
+                MentalScorecardService().get_for_user(user, snapshot),
+            ]
+
+        expected = [
+            get_avg_strokes_gained_categories_per_18(user),
+            TigerFiveService().get_for_user(user),
+            DrivingStatsService().get_for_user(user),
+            ApproachShotService().get_for_user(user),
+            ShortGameService().get_for_user(user),
+            PuttingStatsService().get_for_user(user),
+            MentalScorecardService().get_for_user(user),
+        ]
+
+        for actual, queried in zip(results, expected):
+            assert_same_stats(actual, queried)
+
+    def test_rescores_non_default_baseline(self, user_with_rounds, flat_baseline):
+        user = user_with_rounds
+        snapshot = UserStatsSnapshot.load(user)
+
+        assert_same_stats(
+            get_avg_strokes_gained_categories_per_18(user, flat_baseline, snapshot),
+            get_avg_strokes_gained_categories_per_18(user, flat_baseline),
+        )
+        assert_same_stats(
+            ApproachShotService(flat_baseline).get_for_user(user, snapshot),
+            ApproachShotService(flat_baseline).get_for_user(user),
+        )
+        assert_same_stats(
+            PuttingStatsService(flat_baseline).get_for_user(user, snapshot),
+            PuttingStatsService(flat_baseline).get_for_user(user),
+        )
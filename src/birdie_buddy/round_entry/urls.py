@@ -11,6 +11,7 @@ urlpatterns = [
         name="home_redirect",
     ),
     path("analytics", views.stats_view, name="home"),
+    path("analytics/trend", views.stats_trend_view, name="stats_trend"),
     path("rounds/", views.RoundListView.as_view(), name="round_list"),
     path("rounds/create", views.RoundCreateView.as_view(), name="create_round"),
     path(
@@ -38,6 +39,21 @@ urlpatterns = [
         views.ScorecardReviewView.as_view(),
         name="scorecard_review",
     ),
+    path(
+        "rounds/scorecard/<int:scorecard_upload_id>/status",
+        views.ScorecardParseStatusView.as_view(),
+        name="scorecard_parse_status",
+    ),
+    path(
+        "rounds/upload-scorecards",
+        views.ScorecardBatchUploadView.as_view(),
+        name="upload_scorecard_batch",
+    ),
+    path(
+        "rounds/scorecard/batch/<int:batch_id>",
+        views.ScorecardBatchView.as_view(),
+        name="scorecard_batch",
+    ),
     path(
         "holes/<int:hole_id>/delete",
         views.HoleDeleteView.as_view(),
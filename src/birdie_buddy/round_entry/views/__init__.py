@@ -6,8 +6,10 @@ from .shot_create_view import ShotCreateView
 from .round_detail_view import RoundDetailView
 from .round_list_view import RoundListView
 from .stats_view import stats_view
+from .stats_trend_view import stats_trend_view
 from .scorecard_upload_view import ScorecardUploadView
-from .scorecard_review_view import ScorecardReviewView
+from .scorecard_review_view import ScorecardReviewView, ScorecardParseStatusView
+from .scorecard_batch_view import ScorecardBatchUploadView, ScorecardBatchView
 
 __all__ = [
     "RoundCreateView",
@@ -17,8 +19,12 @@ __all__ = [
     "RoundDetailView",
     "RoundListView",
     "stats_view",
+    "stats_trend_view",
     "ScorecardUploadView",
     "ScorecardReviewView",
+    "ScorecardParseStatusView",
+    "ScorecardBatchUploadView",
+    "ScorecardBatchView",
 ]
 
 
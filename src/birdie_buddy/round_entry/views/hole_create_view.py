@@ -1,10 +1,15 @@
 from django import forms
+from django.db import transaction
 from django.views.generic import View
 from django.urls import reverse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.contrib.auth.mixins import LoginRequiredMixin
 
-from birdie_buddy.round_entry.models import Hole, Round
+from birdie_buddy.round_entry.models import Hole, Round, RoundSummary
+from birdie_buddy.round_entry.services.shot_bucket_aggregate_service import (
+    ShotBucketAggregateService,
+)
+from birdie_buddy.round_entry.services.stats_cache import StatsCache
 
 
 class HoleForm(forms.ModelForm):
@@ -28,13 +33,23 @@ class HoleCreateView(LoginRequiredMixin, View):
 
     def post(self, request, id, number):
         hole = self.get_object()
+        previous_par = hole.par if hole is not None else None
         form = HoleForm(request.POST, instance=hole)
 
         if form.is_valid():
             form.instance.user = self.request.user
             form.instance.round_id = id
             form.instance.number = number
-            form.save()
+            with transaction.atomic():
+                hole = form.save()
+                RoundSummary.objects.refresh(hole.round)
+                if previous_par is not None and previous_par != hole.par:
+                    # Driving stats depend on par, so re-file the hole's shots
+                    shots = list(hole.shot_set.all())
+                    ShotBucketAggregateService.apply_hole(
+                        hole.user_id, (previous_par, shots), (hole.par, shots)
+                    )
+                StatsCache.invalidate_on_commit(hole.user_id)
             return self.redirect_to_success_url()
 
         return render(
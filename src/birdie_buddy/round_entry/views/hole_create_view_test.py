@@ -5,7 +5,7 @@ import pytest
 from django.test import Client
 from pytest_django.asserts import assertTemplateUsed
 from birdie_buddy.round_entry.factories.round_factory import RoundFactory
-from birdie_buddy.round_entry.models import Round, Hole
+from birdie_buddy.round_entry.models import Round, Hole, RoundSummary
 from birdie_buddy.round_entry.factories.hole_factory import HoleFactory
 from birdie_buddy.round_entry.factories.shot_factory import ShotFactory
 from birdie_buddy.round_entry.models import Shot
@@ -105,6 +105,7 @@ class TestHoleCreateView:
         for n in range(1, round.holes_played + 1):
             h = HoleFactory(user=user, round=round, number=n, score=3, par=4, mental_scorecard=3)
             ShotFactory(hole=h, user=user, start_distance=100, lie="fairway")
+        RoundSummary.objects.refresh(round)
         url = reverse("round_entry:create_hole", kwargs={"id": round.pk, "number": 1})
         response = authenticated_client.get(url)
         assert response.status_code == 200
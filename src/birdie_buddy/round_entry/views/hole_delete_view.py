@@ -12,7 +12,7 @@ class HoleDeleteView(LoginRequiredMixin, View):
     def delete(self, request, hole_id: int) -> HttpResponse:
         # Get hole and verify it belongs to user (round ownership is implicit)
         hole = get_object_or_404(
-            Hole,
+            Hole.objects.select_related("round__scorecardupload"),
             id=hole_id,
             user=request.user,
         )
@@ -25,7 +25,7 @@ class HoleDeleteView(LoginRequiredMixin, View):
         HoleService.delete_hole(hole)
 
         # Get updated holes list (with renumbered holes)
-        holes = Hole.objects.filter(round=round_obj).order_by('number')
+        holes = Hole.objects.filter(round=round_obj).with_shots().order_by('number')
 
         # Render the updated holes grid
         html = render_to_string(
@@ -1,4 +1,6 @@
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from birdie_buddy.round_entry.factories.hole_factory import HoleFactory
@@ -18,6 +20,20 @@ def hole(user, round):
 
 
 class TestHoleDeleteView:
+    def test_query_count_does_not_grow_with_holes(self, authenticated_client, user):
+        def queries_for(holes_left):
+            round = RoundFactory(user=user, holes_played=18)
+            for number in range(1, holes_left + 2):
+                HoleFactory.par_3_par(user=user, round=round, number=number)
+            hole = round.hole_set.get(number=holes_left + 1)
+            url = reverse("round_entry:delete_hole", kwargs={"hole_id": hole.pk})
+            with CaptureQueriesContext(connection) as queries:
+                response = authenticated_client.delete(url)
+            assert response.status_code == 200
+            return len(queries)
+
+        assert queries_for(2) == queries_for(6)
+
     def test_login_required(self, client, round, hole):
         url = reverse(
             "round_entry:delete_hole",
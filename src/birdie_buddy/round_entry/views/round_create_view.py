@@ -2,6 +2,7 @@ from django.views.generic import CreateView
 from django.urls import reverse
 
 from ..models import Round
+from ..services.stats_cache import StatsCache
 from django.contrib.auth.mixins import LoginRequiredMixin
 
 
@@ -11,7 +12,10 @@ class RoundCreateView(LoginRequiredMixin, CreateView):
 
     def form_valid(self, form):
         form.instance.user = self.request.user
-        return super().form_valid(form)
+        response = super().form_valid(form)
+        # Stats over the last N rounds now cover a different set of rounds
+        StatsCache.invalidate_on_commit(self.request.user.pk)
+        return response
 
     def get_success_url(self):
         id = self.get_context_data()["object"].pk
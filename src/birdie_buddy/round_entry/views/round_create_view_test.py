@@ -1,6 +1,7 @@
 import pytest
 from django.urls import reverse
 from birdie_buddy.round_entry.models import Round
+from birdie_buddy.round_entry.services.stats_cache import StatsCache
 from pytest_django.asserts import assertTemplateUsed, assertRedirects
 
 
@@ -39,6 +40,17 @@ class TestRoundCreateView:
             reverse("round_entry:create_hole", kwargs={"id": round.id, "number": 1}),
         )
 
+    def test_creating_round_invalidates_stats(
+        self, authenticated_client, user, django_capture_on_commit_callbacks
+    ):
+        version = StatsCache.version(user.pk)
+        data = {"course_name": "Test Golf Course", "holes_played": 18}
+
+        with django_capture_on_commit_callbacks(execute=True):
+            authenticated_client.post(self.url, data)
+
+        assert StatsCache.version(user.pk) != version
+
     @pytest.mark.parametrize(
         "data",
         [
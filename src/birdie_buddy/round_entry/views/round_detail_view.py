@@ -4,17 +4,16 @@ from django.views.generic import View
 from django.urls import reverse
 
 from birdie_buddy.round_entry.models import Round
-from birdie_buddy.round_entry.services.tiger_five import TigerFiveService
-from birdie_buddy.round_entry.services.approach_stats_service import ApproachShotService
-from birdie_buddy.round_entry.services.driving_stats_service import DrivingStatsService
-from birdie_buddy.round_entry.services.putting_stats_service import PuttingStatsService
-from birdie_buddy.round_entry.services.mental_scorecard_service import MentalScorecardService
+from birdie_buddy.round_entry.services.round_stats_service import RoundStatsService
 
 
 class RoundDetailView(LoginRequiredMixin, View):
     def get(self, request, id):
-        round: Round = get_object_or_404(Round, pk=id, user=request.user)
-        holes = round.hole_set.all()
+        # The summary carries completeness, SG totals and the stored stats
+        round: Round = get_object_or_404(
+            Round.objects.select_related("summary"), pk=id, user=request.user
+        )
+        holes = round.hole_set.with_shots()
 
         # Continue link: point to the first hole (number=1) for now.
         continue_href = reverse(
@@ -24,13 +23,10 @@ class RoundDetailView(LoginRequiredMixin, View):
         context = {
             "round": round,
             "holes": holes,
-            "tiger": TigerFiveService().get_for_round(round),
-            "approach_stats": ApproachShotService().get_for_round(round),
-            "driving_stats": DrivingStatsService().get_for_round(round),
-            "putting_stats": PuttingStatsService().get_for_round(round),
-            "mental_stats": MentalScorecardService().get_for_round(round),
             "show_stats": round.complete,
             "continue_href": continue_href,
         }
+        if round.complete:
+            context.update(RoundStatsService.get_for_round(round)._asdict())
 
         return render(request, "round_entry/round_detail.html", context)
@@ -1,9 +1,13 @@
 import pytest
 from django.urls import reverse
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from pytest_django.asserts import assertTemplateUsed
 from birdie_buddy.round_entry.factories.full_round_factory import full_round_factory
 from birdie_buddy.round_entry.factories.round_factory import RoundFactory
 from birdie_buddy.round_entry.factories.hole_factory import HoleFactory
+from birdie_buddy.round_entry.models import RoundSummary
+from birdie_buddy.round_entry.services.round_stats_service import RoundStatsService
 
 
 @pytest.mark.django_db
@@ -55,3 +59,34 @@ class TestRoundDetailView:
         url = reverse("round_entry:round_detail", kwargs={"id": 99999})
         response = authenticated_client.get(url)
         assert response.status_code == 404
+
+    def test_complete_round_renders_stored_stats(
+        self, authenticated_client, user, monkeypatch
+    ):
+        round = RoundFactory(user=user, holes_played=1)
+        HoleFactory.par_4_par(round=round, user=user, number=1)
+        RoundSummary.objects.refresh(round)
+        # Stored when the round completed, so nothing is recomputed on view
+        monkeypatch.setattr(RoundStatsService, "compute", None)
+
+        response = authenticated_client.get(
+            reverse("round_entry:round_detail", kwargs={"id": round.id})
+        )
+
+        assert response.status_code == 200
+        assert response.context["show_stats"] is True
+        assert response.context["putting_stats"].make_rate_0_3 == 100.0
+
+    def test_query_count_does_not_grow_with_holes(self, authenticated_client, user):
+        def queries_for(holes_played):
+            round = RoundFactory(user=user, holes_played=18)
+            for number in range(1, holes_played + 1):
+                HoleFactory.par_3_par(user=user, round=round, number=number)
+            url = reverse("round_entry:round_detail", kwargs={"id": round.id})
+            authenticated_client.get(url)
+            with CaptureQueriesContext(connection) as queries:
+                response = authenticated_client.get(url)
+            assert response.status_code == 200
+            return len(queries)
+
+        assert queries_for(2) == queries_for(6)
@@ -1,14 +1,87 @@
+from datetime import datetime
+from urllib.parse import urlencode
+
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db.models import Q
 from django.views.generic import ListView
 
 from birdie_buddy.round_entry.models import Round
 
 
 class RoundListView(LoginRequiredMixin, ListView):
+    """
+    Rounds newest first, keyset-paginated on (created_at, id).
+
+    Next/previous links carry the last/first row as an ?after=/?before=
+    cursor, so deep pages cost the same as the first and no COUNT(*) is run.
+    A bare ?page=N (no cursor) falls back to an offset for old links.
+    """
+
     model = Round
     template_name = "round_entry/round_list.html"
     context_object_name = "rounds"
-    paginate_by = 10
+    page_size = 10
 
     def get_queryset(self):
-        return Round.objects.filter(user=self.request.user).order_by("-created_at")
+        # Completeness, score and SG totals come from the joined summary
+        return (
+            Round.objects.filter(user=self.request.user)
+            .select_related("summary")
+            .order_by("-created_at", "-id")
+        )
+
+    def get_context_data(self, **kwargs):
+        rounds, has_previous, has_next = self._get_page(self.object_list)
+        page_number = self._page_number()
+
+        context = super().get_context_data(object_list=rounds, **kwargs)
+        context["page_number"] = page_number
+        if has_previous and rounds:
+            context["previous_url"] = self._page_url(
+                "before", rounds[0], page_number - 1
+            )
+        if has_next and rounds:
+            context["next_url"] = self._page_url("after", rounds[-1], page_number + 1)
+        return context
+
+    def _get_page(self, queryset) -> tuple[list[Round], bool, bool]:
+        size = self.page_size
+        if (before := self._cursor("before")) is not None:
+            created_at, id = before
+            rows = list(
+                queryset.filter(
+                    Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=id)
+                ).order_by("created_at", "id")[: size + 1]
+            )
+            return rows[:size][::-1], len(rows) > size, True
+
+        if (after := self._cursor("after")) is not None:
+            created_at, id = after
+            rows = list(
+                queryset.filter(
+                    Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=id)
+                )[: size + 1]
+            )
+            return rows[:size], True, len(rows) > size
+
+        offset = (self._page_number() - 1) * size
+        rows = list(queryset[offset : offset + size + 1])
+        return rows[:size], offset > 0, len(rows) > size
+
+    def _cursor(self, name: str) -> tuple[datetime, int] | None:
+        try:
+            created_at, id = self.request.GET[name].rsplit("_", 1)
+            return datetime.fromisoformat(created_at), int(id)
+        except (KeyError, ValueError):
+            return None
+
+    def _page_number(self) -> int:
+        try:
+            return max(int(self.request.GET.get("page", 1)), 1)
+        except ValueError:
+            return 1
+
+    @staticmethod
+    def _page_url(direction: str, round: Round, page_number: int) -> str:
+        cursor = f"{round.created_at.isoformat()}_{round.pk}"
+        return "?" + urlencode({direction: cursor, "page": page_number})
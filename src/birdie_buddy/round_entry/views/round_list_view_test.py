@@ -1,8 +1,12 @@
+from datetime import datetime, timedelta, timezone
+
 import pytest
 from django.urls import reverse
 from pytest_django.asserts import assertTemplateUsed
 
+from birdie_buddy.round_entry.factories.hole_factory import HoleFactory
 from birdie_buddy.round_entry.factories.round_factory import RoundFactory
+from birdie_buddy.round_entry.models import RoundSummary
 from birdie_buddy.users.factories import UserFactory
 
 
@@ -46,3 +50,42 @@ class TestRoundListView:
         response2 = authenticated_client.get(self.url + "?page=2")
         assert response2.status_code == 200
         assert "Page 2" in response2.content.decode()
+
+    def test_rows_come_from_one_query(
+        self, authenticated_client, user, django_assert_max_num_queries
+    ):
+        for round in RoundFactory.create_batch(12, user=user, holes_played=1):
+            HoleFactory.par_4_par(user=user, round=round, number=1)
+            RoundSummary.objects.refresh(round)
+
+        # Session, user and the page of rounds with their summaries
+        with django_assert_max_num_queries(3):
+            response = authenticated_client.get(self.url)
+
+        assert len(response.context["rounds"]) == 10
+        assert "4 (0)" in response.content.decode()
+
+    def test_keyset_pages_walk_forward_and_back(self, authenticated_client, user):
+        start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        # Two rounds share a timestamp to exercise the id tie-break
+        rounds = [
+            RoundFactory(user=user, created_at=start + timedelta(days=day // 2 * 2))
+            for day in range(25)
+        ]
+        newest_first = sorted(rounds, key=lambda r: (r.created_at, r.pk), reverse=True)
+
+        seen = []
+        response = authenticated_client.get(self.url)
+        while True:
+            seen.extend(response.context["rounds"])
+            if "next_url" not in response.context:
+                break
+            response = authenticated_client.get(self.url + response.context["next_url"])
+
+        assert seen == newest_first
+        assert response.context["page_number"] == 3
+
+        response = authenticated_client.get(self.url + response.context["previous_url"])
+        assert list(response.context["rounds"]) == newest_first[10:20]
+        assert response.context["page_number"] == 2
+        assert "next_url" in response.context
@@ -0,0 +1,78 @@
+import logging
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.shortcuts import get_object_or_404, redirect, render
+from django.urls import reverse
+from django.views.generic import View
+
+from birdie_buddy.round_entry.forms import ScorecardBatchUploadForm
+from birdie_buddy.round_entry.models import ScorecardUploadBatch
+from birdie_buddy.round_entry.services.scorecard_parse_job_service import (
+    ScorecardParseJobService,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ScorecardBatchUploadView(LoginRequiredMixin, View):
+    """Upload several scorecard images; each is parsed by the worker."""
+
+    def get(self, request):
+        return self.render_form(ScorecardBatchUploadForm())
+
+    def post(self, request):
+        form = ScorecardBatchUploadForm(request.POST, request.FILES)
+
+        if form.is_valid():
+            batch = ScorecardParseJobService.enqueue_batch(
+                request.user,
+                form.cleaned_data["scorecard_images"],
+                form.cleaned_data["course_name"],
+            )
+            logger.info(
+                f"Queued batch {batch.id} of "
+                f"{len(form.cleaned_data['scorecard_images'])} scorecards "
+                f"for user {request.user.id}"
+            )
+            return redirect("round_entry:scorecard_batch", batch_id=batch.id)
+
+        return self.render_form(form)
+
+    def render_form(self, form):
+        return render(
+            self.request,
+            "round_entry/scorecard_batch_upload.html",
+            {"form": form, "previous": reverse("round_entry:upload_scorecard")},
+        )
+
+
+class ScorecardBatchView(LoginRequiredMixin, View):
+    """
+    Per-image progress for a batch. While any image is pending the progress
+    list polls this view, which answers HTMX requests with just the list.
+    """
+
+    def get(self, request, batch_id):
+        batch = get_object_or_404(ScorecardUploadBatch, pk=batch_id, user=request.user)
+        uploads = list(
+            # The jobs' images can be megabytes each and aren't needed here
+            batch.uploads.select_related("parse_job", "round")
+            .defer("parse_job__image")
+            .order_by("id")
+        )
+        jobs = [getattr(upload, "parse_job", None) for upload in uploads]
+
+        context = {
+            "batch": batch,
+            "uploads": uploads,
+            "pending": sum(job is not None and job.is_pending for job in jobs),
+            "imported": sum(upload.round_id is not None for upload in uploads),
+        }
+        context["failed"] = len(uploads) - context["pending"] - context["imported"]
+
+        # Boosted navigation wants the whole page, polling just the list
+        if request.htmx and not request.htmx.boosted:
+            return render(
+                request, "round_entry/_scorecard_batch_progress.html", context
+            )
+        return render(request, "round_entry/scorecard_batch.html", context)
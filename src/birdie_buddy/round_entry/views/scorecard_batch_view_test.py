@@ -0,0 +1,127 @@
+import io
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from PIL import Image
+
+from birdie_buddy.users.factories import UserFactory
+from birdie_buddy.round_entry.forms import ScorecardBatchUploadForm
+from birdie_buddy.round_entry.models import (
+    ScorecardParseJob,
+    ScorecardUpload,
+    ScorecardUploadBatch,
+)
+from birdie_buddy.round_entry.services.scorecard_parse_job_service import (
+    ScorecardParseJobService,
+)
+from birdie_buddy.round_entry.services.scorecard_parse_job_service_test import (
+    fake_parser,
+)
+
+
+def jpeg_file(name, color="white"):
+    output = io.BytesIO()
+    Image.new("RGB", (40, 30), color).save(output, format="JPEG")
+    return SimpleUploadedFile(name, output.getvalue(), content_type="image/jpeg")
+
+
+@pytest.mark.django_db
+class TestScorecardBatchUploadView:
+    def test_login_required(self, client):
+        response = client.get(reverse("round_entry:upload_scorecard_batch"))
+
+        assert response.status_code == 302
+        assert "users/login/" in response.url
+
+    def test_queues_a_job_per_image(self, authenticated_client, user):
+        response = authenticated_client.post(
+            reverse("round_entry:upload_scorecard_batch"),
+            {
+                "course_name": "",
+                "scorecard_images": [
+                    jpeg_file("monday.jpg"),
+                    jpeg_file("tuesday.png", "green"),
+                    SimpleUploadedFile("notes.jpg", b"not an image"),
+                ],
+            },
+        )
+
+        batch = ScorecardUploadBatch.objects.get(user=user)
+        assert response.status_code == 302
+        assert response.url == reverse(
+            "round_entry:scorecard_batch", kwargs={"batch_id": batch.id}
+        )
+        monday, tuesday, notes = batch.uploads.select_related("parse_job").order_by(
+            "id"
+        )
+        assert [monday.course_name, tuesday.course_name] == ["monday", "tuesday"]
+        assert monday.parse_job.status == ScorecardParseJob.QUEUED
+        assert bytes(monday.parse_job.image).startswith(b"\xff\xd8")
+        assert tuesday.parse_job.image_name == "tuesday.jpg"
+        assert notes.parse_job.status == ScorecardParseJob.FAILED
+
+    def test_too_many_images_are_rejected(self, authenticated_client):
+        count = ScorecardBatchUploadForm.MAX_IMAGES + 1
+        images = [jpeg_file(f"{i}.jpg") for i in range(count)]
+
+        response = authenticated_client.post(
+            reverse("round_entry:upload_scorecard_batch"),
+            {"course_name": "", "scorecard_images": images},
+        )
+
+        assert response.status_code == 200
+        assert "Upload at most" in response.content.decode()
+        assert not ScorecardUpload.objects.exists()
+
+
+@pytest.mark.django_db
+class TestScorecardBatchView:
+    @staticmethod
+    def batch_for(user):
+        return ScorecardParseJobService.enqueue_batch(
+            user,
+            [
+                ("front.jpg", SimpleUploadedFile("front.jpg", b"front")),
+                ("back.jpg", SimpleUploadedFile("back.jpg", b"back")),
+                ("blurry.jpg", None),
+            ],
+        )
+
+    def test_polls_while_images_are_pending(self, authenticated_client, user):
+        batch = self.batch_for(user)
+
+        response = authenticated_client.get(
+            reverse("round_entry:scorecard_batch", kwargs={"batch_id": batch.id})
+        )
+
+        content = response.content.decode()
+        assert response.status_code == 200
+        assert "Processing 2 of 3 scorecards" in content
+        assert 'hx-trigger="every 2s"' in content
+        assert "<html" in content
+
+    def test_reports_each_image_once_parsed(self, authenticated_client, user):
+        batch = self.batch_for(user)
+        ScorecardParseJobService.run_pending(fake_parser())
+
+        response = authenticated_client.get(
+            reverse("round_entry:scorecard_batch", kwargs={"batch_id": batch.id}),
+            headers={"HX-Request": "true"},
+        )
+
+        content = response.content.decode()
+        assert "2 of 3 scorecards imported" in content
+        assert "1 failed" in content
+        assert "hx-trigger" not in content
+        # Polling gets just the progress list
+        assert "<html" not in content
+
+    def test_other_users_batch_is_not_found(self, authenticated_client):
+        batch = self.batch_for(UserFactory())
+
+        response = authenticated_client.get(
+            reverse("round_entry:scorecard_batch", kwargs={"batch_id": batch.id})
+        )
+
+        assert response.status_code == 404
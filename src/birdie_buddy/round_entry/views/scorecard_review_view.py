@@ -1,7 +1,8 @@
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.shortcuts import get_object_or_404, render
+from django.shortcuts import get_object_or_404, redirect, render
 from django.urls import reverse
 from django.views.generic import View
+from django_htmx.http import HttpResponseClientRefresh
 
 from birdie_buddy.round_entry.models import ScorecardUpload
 
@@ -11,20 +12,33 @@ class ScorecardReviewView(LoginRequiredMixin, View):
 
     def get(self, request, scorecard_upload_id):
         scorecard_upload = get_object_or_404(
-            ScorecardUpload, pk=scorecard_upload_id, user=request.user
+            # The job's image can be megabytes and isn't needed here
+            ScorecardUpload.objects.select_related("round", "parse_job").defer(
+                "parse_job__image"
+            ),
+            pk=scorecard_upload_id,
+            user=request.user,
         )
 
+        # Uploads from before parse jobs existed have no job
+        parse_job = getattr(scorecard_upload, "parse_job", None)
+        parsing = parse_job is not None and parse_job.is_pending
+
         # Check if parsing was successful
-        parsing_failed = scorecard_upload.round is None
+        parsing_failed = not parsing and scorecard_upload.round is None
 
         context = {
             "scorecard_upload": scorecard_upload,
+            "parse_job": parse_job,
+            "parsing": parsing,
             "parsing_failed": parsing_failed,
         }
 
-        if not parsing_failed:
+        if parsing_failed:
+            context["manual_entry_url"] = reverse("round_entry:create_round")
+        elif not parsing:
             round_obj = scorecard_upload.round
-            holes = round_obj.hole_set.prefetch_related("shot_set").order_by("number")
+            holes = round_obj.hole_set.with_shots().order_by("number")
 
             context.update(
                 {
@@ -35,7 +49,33 @@ class ScorecardReviewView(LoginRequiredMixin, View):
                     ),
                 }
             )
-        else:
-            context["manual_entry_url"] = reverse("round_entry:create_round")
 
         return render(request, "round_entry/scorecard_review.html", context)
+
+
+class ScorecardParseStatusView(LoginRequiredMixin, View):
+    """Polled by the review page while the upload's parse job is pending."""
+
+    def get(self, request, scorecard_upload_id):
+        scorecard_upload = get_object_or_404(
+            ScorecardUpload.objects.select_related("parse_job").defer(
+                "parse_job__image"
+            ),
+            pk=scorecard_upload_id,
+            user=request.user,
+        )
+        parse_job = getattr(scorecard_upload, "parse_job", None)
+
+        if parse_job is not None and parse_job.is_pending:
+            return render(
+                request,
+                "round_entry/_scorecard_parse_status.html",
+                {"scorecard_upload": scorecard_upload, "parse_job": parse_job},
+            )
+
+        # Finished: reload the review page to show the round or the error
+        if request.htmx:
+            return HttpResponseClientRefresh()
+        return redirect(
+            "round_entry:scorecard_review", scorecard_upload_id=scorecard_upload.id
+        )
@@ -0,0 +1,145 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from birdie_buddy.round_entry.factories.hole_factory import HoleFactory
+from birdie_buddy.round_entry.factories.round_factory import RoundFactory
+from birdie_buddy.round_entry.models import ScorecardParseJob, ScorecardUpload
+from birdie_buddy.round_entry.services.scorecard_parse_job_service import (
+    ScorecardParseJobService,
+)
+
+
+def scorecard_upload_for(user, holes_played):
+    round = RoundFactory(user=user, holes_played=18)
+    for number in range(1, holes_played + 1):
+        HoleFactory.par_3_par(user=user, round=round, number=number)
+    return ScorecardUpload.objects.create(
+        user=user,
+        round=round,
+        course_name=round.course_name,
+        scorecard_image="test.jpg",
+    )
+
+
+@pytest.mark.django_db
+class TestScorecardReviewView:
+    def test_login_required(self, client, user):
+        scorecard = scorecard_upload_for(user, 1)
+        url = reverse(
+            "round_entry:scorecard_review",
+            kwargs={"scorecard_upload_id": scorecard.id},
+        )
+
+        response = client.get(url)
+
+        assert response.status_code == 302
+        assert "users/login/" in response.url
+
+    def test_shows_parsed_holes(self, authenticated_client, user):
+        scorecard = scorecard_upload_for(user, 3)
+        url = reverse(
+            "round_entry:scorecard_review",
+            kwargs={"scorecard_upload_id": scorecard.id},
+        )
+
+        response = authenticated_client.get(url)
+
+        assert response.status_code == 200
+        assert [hole.number for hole in response.context["holes"]] == [1, 2, 3]
+
+    def test_query_count_does_not_grow_with_holes(self, authenticated_client, user):
+        def queries_for(holes_played):
+            scorecard = scorecard_upload_for(user, holes_played)
+            url = reverse(
+                "round_entry:scorecard_review",
+                kwargs={"scorecard_upload_id": scorecard.id},
+            )
+            with CaptureQueriesContext(connection) as queries:
+                response = authenticated_client.get(url)
+            assert response.status_code == 200
+            return len(queries)
+
+        assert queries_for(2) == queries_for(6)
+
+    def test_pending_job_shows_polling_status(self, authenticated_client, user):
+        scorecard = ScorecardUpload.objects.create(
+            user=user, course_name="Test Course", scorecard_image="test.jpg"
+        )
+        ScorecardParseJobService.enqueue(scorecard)
+
+        response = authenticated_client.get(
+            reverse(
+                "round_entry:scorecard_review",
+                kwargs={"scorecard_upload_id": scorecard.id},
+            )
+        )
+
+        assert response.context["parsing"]
+        assert not response.context["parsing_failed"]
+        assert reverse(
+            "round_entry:scorecard_parse_status",
+            kwargs={"scorecard_upload_id": scorecard.id},
+        ) in response.content.decode()
+
+    def test_failed_job_shows_error(self, authenticated_client, user):
+        scorecard = ScorecardUpload.objects.create(
+            user=user, course_name="Test Course", scorecard_image="test.jpg"
+        )
+        ScorecardParseJob.objects.create(
+            scorecard_upload=scorecard, status=ScorecardParseJob.FAILED
+        )
+
+        response = authenticated_client.get(
+            reverse(
+                "round_entry:scorecard_review",
+                kwargs={"scorecard_upload_id": scorecard.id},
+            )
+        )
+
+        assert response.context["parsing_failed"]
+        assert "Unable to Parse Scorecard" in response.content.decode()
+
+
+@pytest.mark.django_db
+class TestScorecardParseStatusView:
+    def url(self, scorecard):
+        return reverse(
+            "round_entry:scorecard_parse_status",
+            kwargs={"scorecard_upload_id": scorecard.id},
+        )
+
+    def test_pending_job_keeps_polling(self, authenticated_client, user):
+        scorecard = ScorecardUpload.objects.create(
+            user=user, course_name="Test Course", scorecard_image="test.jpg"
+        )
+        ScorecardParseJobService.enqueue(scorecard)
+
+        response = authenticated_client.get(self.url(scorecard), HTTP_HX_REQUEST="true")
+
+        assert response.status_code == 200
+        assert 'hx-trigger="every 2s"' in response.content.decode()
+        assert "HX-Refresh" not in response
+
+    def test_finished_job_refreshes_the_page(self, authenticated_client, user):
+        scorecard = scorecard_upload_for(user, 2)
+        ScorecardParseJob.objects.create(
+            scorecard_upload=scorecard, status=ScorecardParseJob.SUCCEEDED
+        )
+
+        response = authenticated_client.get(self.url(scorecard), HTTP_HX_REQUEST="true")
+
+        assert response["HX-Refresh"] == "true"
+
+    def test_other_users_upload_not_found(self, authenticated_client, django_user_model):
+        other_user = django_user_model.objects.create_user(
+            username="other", password="test123"
+        )
+        scorecard = ScorecardUpload.objects.create(
+            user=other_user, course_name="Test Course", scorecard_image="test.jpg"
+        )
+
+        response = authenticated_client.get(self.url(scorecard))
+
+        assert response.status_code == 404
@@ -0,0 +1,84 @@
+import io
+from unittest.mock import patch
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.urls import reverse
+from PIL import Image
+
+from birdie_buddy.round_entry.models import ScorecardParseJob, ScorecardUpload
+from birdie_buddy.round_entry.services.image_processing_pool import (
+    ImageProcessingBusy,
+)
+
+
+def jpeg_file(name="scorecard.jpg"):
+    output = io.BytesIO()
+    Image.new("RGB", (40, 30), "white").save(output, format="JPEG")
+    return SimpleUploadedFile(name, output.getvalue(), content_type="image/jpeg")
+
+
+@pytest.mark.django_db
+class TestScorecardUploadView:
+    def test_login_required(self, client):
+        response = client.get(reverse("round_entry:upload_scorecard"))
+
+        assert response.status_code == 302
+        assert "users/login/" in response.url
+
+    @patch(
+        "birdie_buddy.round_entry.services.scorecard_parser_service."
+        "ScorecardParserService.parse_scorecard_bytes"
+    )
+    def test_upload_queues_a_parse_job_and_redirects(
+        self, parse, authenticated_client, user
+    ):
+        response = authenticated_client.post(
+            reverse("round_entry:upload_scorecard"),
+            {"course_name": "Test Course", "scorecard_image": jpeg_file()},
+        )
+
+        scorecard_upload = ScorecardUpload.objects.get(user=user)
+        assert response.status_code == 302
+        assert response.url == reverse(
+            "round_entry:scorecard_review",
+            kwargs={"scorecard_upload_id": scorecard_upload.id},
+        )
+        job = scorecard_upload.parse_job
+        assert job.status == ScorecardParseJob.QUEUED
+        assert scorecard_upload.round is None
+        # The processed image rides on the job; storage is written by the worker
+        assert bytes(job.image).startswith(b"\xff\xd8")
+        assert job.image_name == "scorecard.jpg"
+        assert not scorecard_upload.scorecard_image
+        # Parsing is left to the worker
+        parse.assert_not_called()
+
+    def test_invalid_image_is_rejected(self, authenticated_client, user):
+        response = authenticated_client.post(
+            reverse("round_entry:upload_scorecard"),
+            {
+                "course_name": "Test Course",
+                "scorecard_image": SimpleUploadedFile("card.jpg", b"not an image"),
+            },
+        )
+
+        assert response.status_code == 200
+        assert not ScorecardUpload.objects.exists()
+
+    @patch(
+        "birdie_buddy.round_entry.services.image_processing_pool."
+        "ImageProcessingPool.process_image",
+        side_effect=ImageProcessingBusy,
+    )
+    def test_busy_image_processing_asks_to_retry(
+        self, process_image, authenticated_client, user
+    ):
+        response = authenticated_client.post(
+            reverse("round_entry:upload_scorecard"),
+            {"course_name": "Test Course", "scorecard_image": jpeg_file()},
+        )
+
+        assert response.status_code == 200
+        assert "Please try again" in response.content.decode()
+        assert not ScorecardUpload.objects.exists()
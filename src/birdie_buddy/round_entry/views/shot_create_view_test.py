@@ -5,7 +5,8 @@ from pytest_django.asserts import assertRedirects, assertTemplateUsed
 from birdie_buddy.round_entry.factories.hole_factory import HoleFactory
 from birdie_buddy.round_entry.factories.round_factory import RoundFactory
 from birdie_buddy.round_entry.factories.shot_factory import ShotFactory
-from birdie_buddy.round_entry.models import Round, Hole, Shot
+from birdie_buddy.round_entry.models import Round, RoundSummary, Hole, Shot
+from birdie_buddy.round_entry.services.stats_cache import StatsCache
 
 User = get_user_model()
 
@@ -107,6 +108,80 @@ class TestCreateShotsView:
             ),
         )
 
+    def test_saving_shots_refreshes_round_summary(
+        self, authenticated_client, round, hole
+    ):
+        url = reverse(
+            "round_entry:create_shots", kwargs={"id": round.id, "number": hole.number}
+        )
+        data = {
+            "form-TOTAL_FORMS": "3",
+            "form-INITIAL_FORMS": "0",
+            "form-MIN_NUM_FORMS": "0",
+            "form-MAX_NUM_FORMS": "1000",
+            "form-0-start_distance": "170",
+            "form-0-lie": "tee",
+            "form-1-start_distance": "20",
+            "form-1-lie": "green",
+            "form-2-start_distance": "1",
+            "form-2-lie": "green",
+        }
+
+        authenticated_client.post(url, data)
+
+        summary = RoundSummary.objects.get(round=round)
+        assert summary.shot_count == 3
+        assert summary.holes_with_shots == 1
+        assert summary.strokes_gained_putting == pytest.approx(
+            sum(Shot.objects.filter(hole=hole, shot_type="putt").values_list("strokes_gained", flat=True))
+        )
+
+    def test_saving_shots_stores_leave_distance_and_holed_flag(
+        self, authenticated_client, round, hole
+    ):
+        url = reverse(
+            "round_entry:create_shots", kwargs={"id": round.id, "number": hole.number}
+        )
+        data = {
+            "form-TOTAL_FORMS": "3",
+            "form-INITIAL_FORMS": "0",
+            "form-MIN_NUM_FORMS": "0",
+            "form-MAX_NUM_FORMS": "1000",
+            "form-0-start_distance": "170",
+            "form-0-lie": "tee",
+            "form-1-start_distance": "20",
+            "form-1-lie": "green",
+            "form-2-start_distance": "1",
+            "form-2-lie": "green",
+        }
+
+        authenticated_client.post(url, data)
+
+        shots = Shot.objects.filter(hole=hole).order_by("number")
+        assert [shot.leave_feet for shot in shots] == [20, 1, 0]
+        assert [shot.is_holed for shot in shots] == [False, False, True]
+
+    def test_saving_shots_invalidates_cached_stats(
+        self, authenticated_client, round, hole, user, django_capture_on_commit_callbacks
+    ):
+        url = reverse(
+            "round_entry:create_shots", kwargs={"id": round.id, "number": hole.number}
+        )
+        version = StatsCache.version(user.pk)
+        data = {
+            "form-TOTAL_FORMS": "1",
+            "form-INITIAL_FORMS": "0",
+            "form-MIN_NUM_FORMS": "0",
+            "form-MAX_NUM_FORMS": "1000",
+            "form-0-start_distance": "170",
+            "form-0-lie": "tee",
+        }
+
+        with django_capture_on_commit_callbacks(execute=True):
+            authenticated_client.post(url, data)
+
+        assert StatsCache.version(user.pk) != version
+
     def test_invalid_formset_returns_errors(self, authenticated_client, round, hole):
         url = reverse(
             "round_entry:create_shots", kwargs={"id": round.id, "number": hole.number}
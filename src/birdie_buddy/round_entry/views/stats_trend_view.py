@@ -0,0 +1,28 @@
+from django.contrib.auth.decorators import login_required
+from django.http import JsonResponse
+
+from birdie_buddy.round_entry.services.strokes_gained_trend_service import (
+    StrokesGainedTrendService,
+)
+
+
+def _int_param(req, name: str, default: int | None) -> int | None:
+    try:
+        return int(req.GET[name])
+    except (KeyError, ValueError):
+        return default
+
+
+@login_required
+def stats_trend_view(req):
+    """
+    Strokes gained by category for the last ?rounds= rounds, with a
+    ?rolling= round average and optional ?points= downsampling.
+    """
+    series = StrokesGainedTrendService().get_series(
+        req.user,
+        last_rounds=_int_param(req, "rounds", 20),
+        rolling=_int_param(req, "rolling", 5),
+        points=_int_param(req, "points", None),
+    )
+    return JsonResponse({"series": [point._asdict() for point in series]})
@@ -1,6 +1,10 @@
 from django.shortcuts import render
 from django.contrib.auth.decorators import login_required
 
+from birdie_buddy.round_entry.services.avg_strokes_to_holeout import (
+    BASELINES,
+    DEFAULT_BASELINE,
+)
 from birdie_buddy.round_entry.services.avg_strokes_gained_per_18 import (
     get_avg_strokes_gained_categories_per_18,
 )
@@ -12,17 +16,44 @@ from birdie_buddy.round_entry.services.putting_stats_service import PuttingStats
 from birdie_buddy.round_entry.services.mental_scorecard_service import (
     MentalScorecardService,
 )
+from birdie_buddy.round_entry.services.stats_cache import StatsCache
+from birdie_buddy.round_entry.services.stats_window import StatsWindow
+
+
+BASELINE_SESSION_KEY = "strokes_gained_baseline"
+
+# Options for the ?last= rounds selector; "" covers every round
+WINDOW_CHOICES = [("", "All rounds"), (5, "Last 5"), (10, "Last 10"), (20, "Last 20")]
+
+
+def get_selected_baseline(req) -> str:
+    """Pick the baseline from ?baseline=, falling back to the one remembered in the session."""
+    baseline = req.GET.get("baseline") or req.session.get(BASELINE_SESSION_KEY)
+    if baseline not in BASELINES:
+        baseline = DEFAULT_BASELINE
+    req.session[BASELINE_SESSION_KEY] = baseline
+    return baseline
 
 
 @login_required
 def stats_view(req):
-    stats = get_avg_strokes_gained_categories_per_18(req.user)
-    tiger = TigerFiveService().get_for_user(req.user)
-    driving_stats = DrivingStatsService().get_for_user(req.user)
-    approach_stats = ApproachShotService().get_for_user(req.user)
-    short_game_stats = ShortGameService().get_for_user(req.user)
-    putting_stats = PuttingStatsService().get_for_user(req.user)
-    mental_stats = MentalScorecardService().get_for_user(req.user)
+    baseline = get_selected_baseline(req)
+    window = StatsWindow.from_query(req.GET)
+    # Sections missing from the cache read the stored aggregates, or for a
+    # window or another baseline share one load of the holes and shots
+    stats_cache = StatsCache(req.user, window)
+    stats = stats_cache.get_or_compute(
+        f"categories:{baseline}",
+        lambda: get_avg_strokes_gained_categories_per_18(
+            req.user, baseline, stats_cache.snapshot_for(baseline)
+        ),
+    )
+    tiger = stats_cache.get_for_user(TigerFiveService())
+    driving_stats = stats_cache.get_for_user(DrivingStatsService())
+    approach_stats = stats_cache.get_for_user(ApproachShotService(baseline))
+    short_game_stats = stats_cache.get_for_user(ShortGameService(baseline))
+    putting_stats = stats_cache.get_for_user(PuttingStatsService(baseline))
+    mental_stats = stats_cache.get_for_user(MentalScorecardService())
     return render(
         req,
         "stats.html",
@@ -37,5 +68,9 @@ def stats_view(req):
             "short_game_stats": short_game_stats,
             "putting_stats": putting_stats,
             "mental_stats": mental_stats,
+            "baseline": baseline,
+            "baselines": [(name, label) for name, (label, _) in BASELINES.items()],
+            "window": window,
+            "window_choices": WINDOW_CHOICES,
         },
     )
@@ -0,0 +1,117 @@
+from unittest.mock import patch
+
+import pytest
+from django.urls import reverse
+from pytest_django.asserts import assertTemplateUsed
+
+from birdie_buddy.round_entry.factories.full_round_factory import full_round_factory
+from birdie_buddy.round_entry.services.avg_strokes_to_holeout import BASELINES
+from birdie_buddy.round_entry.services.stats_cache import StatsCache
+from birdie_buddy.round_entry.services.stats_window import StatsWindow
+from birdie_buddy.round_entry.services.user_stats_snapshot import UserStatsSnapshot
+
+
+@pytest.mark.django_db
+class TestStatsView:
+    @property
+    def url(self):
+        return reverse("round_entry:home")
+
+    def test_login_required(self, client):
+        response = client.get(self.url)
+        assert response.status_code == 302
+        assert "/login/" in response.url
+
+    def test_renders_with_default_baseline(self, authenticated_client, user):
+        full_round_factory(user=user)
+
+        response = authenticated_client.get(self.url)
+
+        assert response.status_code == 200
+        assertTemplateUsed(response, "stats.html")
+        assert response.context["baseline"] == "tour"
+
+    def test_notes_which_stats_ignore_the_baseline(
+        self, authenticated_client, monkeypatch
+    ):
+        monkeypatch.setitem(BASELINES, "scratch", ("Scratch", None))
+
+        response = authenticated_client.get(self.url)
+
+        assert 'value="scratch"' in response.content.decode()
+        assert "the counts are the same for every baseline" in response.content.decode()
+
+    def test_unknown_baseline_falls_back_to_default(self, authenticated_client):
+        response = authenticated_client.get(self.url + "?baseline=beginner")
+
+        assert response.context["baseline"] == "tour"
+        assert authenticated_client.session["strokes_gained_baseline"] == "tour"
+
+    def test_default_stats_do_not_load_shots(self, authenticated_client, user):
+        full_round_factory(user=user)
+
+        with patch.object(UserStatsSnapshot, "load") as load:
+            response = authenticated_client.get(self.url)
+
+        assert response.status_code == 200
+        load.assert_not_called()
+
+    def test_window_stats_are_loaded_from_one_snapshot(
+        self, authenticated_client, user, django_assert_max_num_queries
+    ):
+        full_round_factory(user=user)
+        StatsCache.version(user.pk)
+
+        # Session and user lookups, the stats version, the two snapshot
+        # queries and the session save (an UPDATE wrapped in a savepoint)
+        with django_assert_max_num_queries(8):
+            response = authenticated_client.get(self.url + "?last=5")
+
+        assert response.status_code == 200
+
+    def test_repeat_visits_are_served_from_cache(self, authenticated_client, user):
+        full_round_factory(user=user)
+        authenticated_client.get(self.url)
+
+        response = authenticated_client.get(self.url)
+
+        assert response.status_code == 200
+        assert StatsCache.counters()["hits"] == 7
+
+    def test_window_limits_stats_to_recent_rounds(self, authenticated_client, user):
+        full_round_factory(user=user)
+
+        response = authenticated_client.get(self.url + "?last=5")
+
+        assert response.status_code == 200
+        assert response.context["window"] == StatsWindow(last_rounds=5)
+
+    def test_out_of_range_end_date_is_ignored(self, authenticated_client, user):
+        full_round_factory(user=user)
+
+        response = authenticated_client.get(self.url + "?end=9999-12-31")
+
+        assert response.status_code == 200
+        assert response.context["window"] is None
+
+
+@pytest.mark.django_db
+class TestStatsTrendView:
+    @property
+    def url(self):
+        return reverse("round_entry:stats_trend")
+
+    def test_login_required(self, client):
+        response = client.get(self.url)
+        assert response.status_code == 302
+
+    def test_returns_series(self, authenticated_client, user):
+        full_round_factory(n_holes=9, user=user)
+        full_round_factory(n_holes=9, user=user)
+
+        response = authenticated_client.get(self.url + "?rounds=5&rolling=2&points=1")
+
+        series = response.json()["series"]
+        assert len(series) == 1
+        assert series[0]["rounds"] == 2
+        assert set(series[0]) >= {"round_id", "created_at", "putting", "rolling_putting"}
@@ -108,6 +108,15 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# e.g. CACHE_URL=filecache:///var/tmp/birdie_buddy to share between workers.
+# Stats versions live in the database, so a write in one process invalidates
+# every process's cached stats whether or not the cache is shared.
+
+CACHES = {"default": env.cache_url("CACHE_URL", default="locmemcache://")}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -183,3 +192,13 @@ OPENAI_API_KEY = env("OPENAI_KEY")
 
 # Anthropic configuration for scorecard parsing
 ANTHROPIC_API_KEY = env("ANTHROPIC_API_KEY")
+# Dotted path to a client class used instead of anthropic.Anthropic, e.g.
+# "birdie_buddy.round_entry.services.fake_scorecard_client.FakeScorecardClient"
+SCORECARD_PARSER_CLIENT = env("SCORECARD_PARSER_CLIENT", default=None)
+# Scorecard parse jobs the worker runs at once, bounding concurrent LLM requests
+SCORECARD_PARSE_CONCURRENCY = env.int("SCORECARD_PARSE_CONCURRENCY", default=4)
+# Parse the halves of each scorecard concurrently and merge them
+SCORECARD_PARSE_SPLIT = env.bool("SCORECARD_PARSE_SPLIT", default=False)
+
+# Worker processes that decode, resize and compress uploaded scorecard photos
+IMAGE_PROCESSING_WORKERS = env.int("IMAGE_PROCESSING_WORKERS", default=2)
@@ -0,0 +1,29 @@
+#!/usr/bin/env bash
+# Runs the web server and the scorecard worker side by side. If either one
+# exits (a crash, an OOM kill), the other is stopped and the container exits
+# non-zero. The platform then restarts the whole container, rather than it
+# staying up with uploads queued behind a dead worker.
+set -u
+
+stopping=0
+stop() {
+    stopping=1
+    kill -TERM $(jobs -p) 2>/dev/null
+}
+trap stop TERM INT
+
+python manage.py run_scorecard_worker &
+gunicorn --bind "0.0.0.0:$PORT" --workers 1 --threads 8 --timeout 0 \
+    birdie_buddy.wsgi:application &
+
+# Returns when the first of the two exits, or when a signal arrives
+wait -n
+status=$?
+
+if [ "$stopping" -eq 0 ]; then
+    echo "A process exited with status $status; stopping the container" >&2
+    [ "$status" -eq 0 ] && status=1
+fi
+stop
+wait
+exit "$status"